@@ -0,0 +1,64 @@
+"""Adapters per request: ad hoc ``TypeAdapter`` construction against a shared ``TypeAdapterRegistry``.
+
+Simulates ``--requests`` handler calls, each validating ``--batch`` records of one conftest alias model (cycling over
+all of them) as ``list[Model]`` and as ``dict[str, Model]``: building both adapters in the handler, and getting them
+from a registry prebuilt at startup. Registry stats show hits and the build time saved.
+
+    uv run python benchmarks/bench_adapters.py --requests 2000 --batch 10
+"""
+
+import argparse
+from collections.abc import Sequence
+from itertools import cycle, islice
+
+from pydantic import BaseModel, TypeAdapter
+
+from pydantic_notes.adapters import TypeAdapterRegistry
+from pydantic_notes.bench import measure
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload
+
+
+def handle(list_adapter: TypeAdapter, dict_adapter: TypeAdapter, records: list[dict]) -> None:
+    list_adapter.validate_python(records)
+    dict_adapter.validate_python({str(index): record for index, record in enumerate(records)})
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--batch", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    batches = {m: list(Workload(m, seed=0).records(args.batch)) for m in ALIAS_MODELS.values()}
+    requests: list[type[BaseModel]] = list(islice(cycle(batches), args.requests))
+    registry = TypeAdapterRegistry()
+    registry.register(batches)
+
+    def ad_hoc() -> None:
+        for model_cls in requests:
+            handle(TypeAdapter(list[model_cls]), TypeAdapter(dict[str, model_cls]), batches[model_cls])
+
+    def shared() -> None:
+        for model_cls in requests:
+            handle(registry.get(list[model_cls]), registry.get(dict[str, model_cls]), batches[model_cls])
+
+    baseline = None
+    for label, func in {"ad hoc TypeAdapter": ad_hoc, "registry": shared}.items():
+        measurement = measure(func, repeat=args.repeat, min_time=0)
+        baseline = baseline or measurement.median
+        print(
+            f"  {label:<20} {args.requests / measurement.median:>12,.0f} requests/s"
+            f"  x{baseline / measurement.median:.2f}"
+        )
+    stats = registry.stats
+    print(
+        f"  registry: {stats.entries} adapters, {stats.hits:,} hits, {stats.misses} misses,"
+        f" {stats.mean_build_time * 1e3:.2f}ms per build"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
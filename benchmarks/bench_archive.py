@@ -0,0 +1,80 @@
+"""Compressed NDJSON archives: serial decompression and validation against the pipelined reader.
+
+Writes ``--count`` records of ``--model`` as gzip, bz2 and lzma NDJSON archives, then validates every line with
+``gzip.open`` / ``bz2.open`` / ``lzma.open`` and a ``model_validate_json`` loop, and with ``ArchiveReader`` inline, with
+a decompression thread and with a decompression process. Per-stage stats of the last pipelined run show the
+bottleneck. Overlap needs a spare core: on a single one, the pipelined modes can only match the serial loop.
+
+    uv run python benchmarks/bench_archive.py --model validation_alias_choices --count 200000
+"""
+
+import argparse
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from pydantic_notes.archive import ArchiveReader
+from pydantic_notes.bench import measure
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload, write_ndjson
+
+OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "lzma": lzma.open}
+COMPRESS = {"gzip": gzip.compress, "bz2": bz2.compress, "lzma": lzma.compress}
+
+
+def serial(path: Path, codec: str, model_cls: type[BaseModel]) -> int:
+    validate_json = model_cls.model_validate_json
+    with OPENERS[codec](path, "rb") as fp:
+        return sum(1 for line in fp if line.strip() and validate_json(line))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", choices=sorted(ALIAS_MODELS), default="validation_alias_choices")
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    model_cls = ALIAS_MODELS[args.model]
+    fp = io.StringIO()
+    write_ndjson(Workload(model_cls, seed=0).records(args.count), fp)
+    data = fp.getvalue().encode()
+    print(f"{args.model}: {args.count:,} records, {len(data):,} bytes, {os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory() as tmp:
+        for codec, compress in COMPRESS.items():
+            path = Path(tmp) / f"records.ndjson.{codec}"
+            path.write_bytes(compress(data))
+            readers: dict[str, ArchiveReader] = {}
+
+            def pipelined(mode: str, p: Path = path, r: dict[str, ArchiveReader] = readers) -> int:
+                r[mode] = reader = ArchiveReader(p, model_cls, mode=mode)  # type: ignore[arg-type]
+                return sum(1 for _ in reader)
+
+            cases = {
+                f"{codec}.open + loop": lambda p=path, c=codec: serial(p, c, model_cls),
+                "reader, inline": lambda: pipelined("inline"),
+                "reader, thread": lambda: pipelined("thread"),
+                "reader, process": lambda: pipelined("process"),
+            }
+            print(f"{codec} ({path.stat().st_size:,} bytes)")
+            baseline = None
+            for label, func in cases.items():
+                measurement = measure(func, repeat=args.repeat, min_time=0)
+                baseline = baseline or measurement.median
+                print(
+                    f"  {label:<18} {args.count / measurement.median:>12,.0f} records/s"
+                    f"  x{baseline / measurement.median:.2f}"
+                )
+            print("\n".join(f"  {line}" for line in str(readers["process"].stats).splitlines()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,62 @@
+"""The same document again: ``model_validate_json`` against a :class:`~pydantic_notes.cache.ValidationCache` hit.
+
+The document is a model of ``--width`` scalar fields (strings, numbers, dates) plus a list and a nested model, the
+mutable values a hit has to copy. A hit hashes the document and copies the cached instance, which pays off once
+validation costs more than that, from about 20 fields up. ``model_copy(deep=True)`` is listed as well, as the per-hit
+copy the cache used to make.
+
+    uv run python benchmarks/bench_cache.py --width 20
+"""
+
+import argparse
+import json
+from collections.abc import Sequence
+from datetime import datetime
+
+from pydantic import BaseModel, create_model
+
+from pydantic_notes.bench import measure
+from pydantic_notes.cache import ValidationCache
+
+FIELD_TYPES = ((str, "Mickey"), (int, 42), (float, 4.2), (bool, True), (datetime, "1928-11-18T00:00:00"))
+
+
+class Address(BaseModel):
+    city: str
+    zip_code: str
+
+
+def document_model(width: int) -> tuple[type[BaseModel], dict]:
+    fields = {}
+    payload = {"tags": ["mouse", "disney", "1928"], "address": {"city": "Toontown", "zip_code": "12345"}}
+    for i in range(width):
+        annotation, value = FIELD_TYPES[i % len(FIELD_TYPES)]
+        fields[f"field_{i}"] = (annotation, ...)
+        payload[f"field_{i}"] = value
+    return create_model("Document", tags=(list[str], ...), address=(Address, ...), **fields), payload
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    model_cls, payload = document_model(args.width)
+    raw = json.dumps(payload).encode()
+    cache = ValidationCache()
+    instance = cache.validate_json(model_cls, raw)
+    cases = {
+        "model_validate_json": lambda: model_cls.model_validate_json(raw),
+        "ValidationCache hit": lambda: cache.validate_json(model_cls, raw),
+        "model_copy(deep=True)": lambda: instance.model_copy(deep=True),
+    }
+    print(f"{args.width + 2} fields, {len(raw)} bytes per document")
+    for name, func in cases.items():
+        measurement = measure(func, repeat=args.repeat)
+        print(f"{name:<25} {measurement.median * 1e6:>9.2f}us +/- {measurement.spread * 1e6:.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+"""Size and speed of :mod:`pydantic_notes.codec` against NDJSON (``model_dump_json`` / ``model_validate_json``).
+
+Runs on ``ModelWithPlainAlias`` and on the wide model of ``bench_lazy.py``, ``--count`` records each.
+
+    uv run python benchmarks/bench_codec.py --count 1000 --width 50
+"""
+
+import argparse
+from collections.abc import Sequence
+
+from bench_lazy import wide_model
+
+from pydantic_notes.bench import measure
+from pydantic_notes.codec import dumps, loads
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--width", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    wide_cls, wide_payload = wide_model(args.width)
+    for model_cls, payload in (
+        (ALIAS_MODELS["plain_alias"], SAMPLE_PAYLOADS["plain_alias"]),
+        (wide_cls, wide_payload),
+    ):
+        instances = [model_cls.model_validate(payload)] * args.count
+        ndjson = b"".join(instance.model_dump_json(by_alias=True).encode() + b"\n" for instance in instances)
+        binary = dumps(model_cls, instances)
+        cases = {
+            "model_dump_json": lambda i=instances: [instance.model_dump_json(by_alias=True) for instance in i],
+            "codec.dumps": lambda m=model_cls, i=instances: dumps(m, i),
+            "model_validate_json": lambda m=model_cls, d=ndjson: [
+                m.model_validate_json(line) for line in d.splitlines()
+            ],
+            "codec.loads": lambda m=model_cls, d=binary: loads(m, d),
+            "codec.loads(validate)": lambda m=model_cls, d=binary: loads(m, d, validate=True),
+        }
+        print(f"{model_cls.__name__}: {args.count} records, NDJSON {len(ndjson)} bytes, codec {len(binary)} bytes")
+        for name, func in cases.items():
+            measurement = measure(func, repeat=args.repeat)
+            print(f"  {name:<24} {measurement.median * 1e3:>9.2f}ms +/- {measurement.spread * 1e3:.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
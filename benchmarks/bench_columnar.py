@@ -0,0 +1,56 @@
+"""Validated batches back from a worker process: pickled model lists against shared-memory columns.
+
+For each conftest alias model, a worker validates ``--count`` records and returns either the list of models (pickled
+and rebuilt in the parent) or a :class:`~pydantic_notes.columnar.BatchHandle`, from which the parent rebuilds every
+model or reads a single column.
+
+    uv run python benchmarks/bench_columnar.py --count 10000
+"""
+
+import argparse
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from pydantic import BaseModel
+
+from pydantic_notes.bench import measure
+from pydantic_notes.columnar import ColumnarBatch, unpack, validate_to_shared
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload
+
+
+def validate_to_list(model_cls: type[BaseModel], payloads: list[dict]) -> list[BaseModel]:
+    return [model_cls.model_validate(payload) for payload in payloads]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        for name, model_cls in ALIAS_MODELS.items():
+            payloads = list(Workload(model_cls, seed=0).records(args.count))
+            first_field = next(iter(model_cls.model_fields))
+
+            def first_column(m=model_cls, p=payloads, f=first_field) -> None:
+                with ColumnarBatch(pool.submit(validate_to_shared, m, p).result()) as batch:
+                    list(batch.column(f))
+
+            cases = {
+                "pickled list": lambda m=model_cls, p=payloads: pool.submit(validate_to_list, m, p).result(),
+                "shared, all models": lambda m=model_cls, p=payloads: unpack(
+                    pool.submit(validate_to_shared, m, p).result()
+                ),
+                "shared, one column": first_column,
+            }
+            print(name)
+            for label, func in cases.items():
+                measurement = measure(func, repeat=args.repeat, min_time=0)
+                print(f"  {label:<20} {measurement.median * 1e3:>9.2f}ms +/- {measurement.spread * 1e3:.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+"""Routing a mixed stream of records: try-each validation against :class:`~pydantic_notes.dispatch.Dispatcher`.
+
+The stream interleaves ``--count`` valid records of each alias model that no key set confuses with another; try-each
+validation tries the models in a fixed order until one validates.
+
+    uv run python benchmarks/bench_dispatch.py --count 200
+"""
+
+import argparse
+from collections.abc import Sequence
+
+from pydantic import BaseModel, ValidationError
+
+from pydantic_notes.bench import measure
+from pydantic_notes.dispatch import Dispatcher
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload
+
+MODELS = [
+    "plain_alias",
+    "serialization_alias",
+    "validation_alias_path",
+    "alias_generator_and_priority_1",
+    "alias_generator_and_unset_priority",
+]
+
+
+def try_each(models: Sequence[type[BaseModel]], record: dict) -> BaseModel:
+    for model_cls in models:
+        try:
+            return model_cls.model_validate(record)
+        except ValidationError:
+            continue
+    raise LookupError(record)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    models = [ALIAS_MODELS[model] for model in MODELS]
+    streams = [Workload(model_cls, seed=i).records(args.count) for i, model_cls in enumerate(models)]
+    records = [record for batch in zip(*streams, strict=True) for record in batch]
+    dispatcher = Dispatcher(models)
+    cases = {
+        "try each model": lambda: [try_each(models, record) for record in records],
+        "Dispatcher.validate": lambda: [dispatcher.validate(record) for record in records],
+        "Dispatcher.route only": lambda: [dispatcher.route(record) for record in records],
+    }
+    print(f"{len(records)} records of {len(models)} models")
+    for name, func in cases.items():
+        measurement = measure(func, repeat=args.repeat)
+        print(f"{name:<24} {measurement.median * 1e3:>9.3f}ms +/- {measurement.spread * 1e3:.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
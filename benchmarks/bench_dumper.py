@@ -0,0 +1,47 @@
+"""Masked JSON dumps: ``model_dump_json(include=..., exclude=...)`` against ``compile_dumper``.
+
+For each conftest alias model, dumps ``--count`` validated instances by alias with an ``include`` mask of the first
+field and an ``exclude`` mask of the last, through the generic call and through a compiled dumper.
+
+    uv run python benchmarks/bench_dumper.py --count 10000
+"""
+
+import argparse
+from collections.abc import Sequence
+
+from pydantic_notes.bench import measure
+from pydantic_notes.dumper import compile_dumper
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for name, model_cls in ALIAS_MODELS.items():
+        instances = [model_cls.model_validate(record) for record in Workload(model_cls, seed=0).records(args.count)]
+        names = list(model_cls.model_fields)
+        print(name)
+        for mask in ({"include": {names[0]}}, {"exclude": {names[-1]}}):
+            dump = compile_dumper(model_cls, by_alias=True, **mask)
+            generic = measure(
+                lambda m=mask, i=instances: [instance.model_dump_json(by_alias=True, **m) for instance in i],
+                repeat=args.repeat,
+                min_time=0,
+            )
+            compiled = measure(
+                lambda d=dump, i=instances: [d(instance) for instance in i], repeat=args.repeat, min_time=0
+            )
+            label = ", ".join(f"{key}={sorted(value)}" for key, value in mask.items())
+            print(
+                f"  {label:<28} generic {generic.median * 1e3:>7.2f}ms"
+                f"  compiled {compiled.median * 1e3:>7.2f}ms  x{generic.median / compiled.median:.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
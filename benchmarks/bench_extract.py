@@ -0,0 +1,56 @@
+"""Two ``AliasPath`` fields out of a large document: full parsing against extraction.
+
+The document holds ``names`` plus ``--size`` records of unrelated data, with ``names`` either first (extraction stops
+right after ``names[1]``) or last (everything before it is skipped).
+
+    uv run python benchmarks/bench_extract.py --size 1000
+"""
+
+import argparse
+import json
+from collections.abc import Sequence
+
+from pydantic import AliasPath, BaseModel, Field
+
+from pydantic_notes.bench import measure
+from pydantic_notes.extract import validate_extracted
+
+
+class Names(BaseModel):
+    first_name: str = Field(validation_alias=AliasPath("names", 0))
+    last_name: str = Field(validation_alias=AliasPath("names", 1))
+
+
+def noise(size: int) -> list[dict]:
+    return [
+        {"id": i, "label": f"record {i}", "tags": ["a", "b", "c"], "score": i / 7, "nested": {"ok": True, "n": None}}
+        for i in range(size)
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    names = ["Mickey", "Mouse", *(f"alias {i}" for i in range(args.size))]
+    documents = {
+        "names first": json.dumps({"names": names, "records": noise(args.size)}).encode(),
+        "names last": json.dumps({"records": noise(args.size), "names": names}).encode(),
+    }
+    for label, document in documents.items():
+        cases = {
+            "model_validate_json": lambda d=document: Names.model_validate_json(d),
+            "model_validate(json.loads)": lambda d=document: Names.model_validate(json.loads(d)),
+            "validate_extracted": lambda d=document: validate_extracted(Names, d),
+        }
+        print(f"{label}, {len(document)} bytes")
+        for name, func in cases.items():
+            measurement = measure(func, repeat=args.repeat)
+            print(f"  {name:<28} {measurement.median * 1e6:>10.2f}us +/- {measurement.spread * 1e6:.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+"""Reading ``first_name`` only: eager ``model_validate*`` against :class:`~pydantic_notes.lazy.LazyModel`.
+
+The conftest models carry one or two fields, where there is nothing to save; the comparison runs on a wide model with
+``first_name`` behind the same plain alias as ``ModelWithPlainAlias`` plus ``--width`` camelCase-aliased fields.
+
+    uv run python benchmarks/bench_lazy.py --width 50
+"""
+
+import argparse
+import json
+from collections.abc import Sequence
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from pydantic.alias_generators import to_camel
+
+from pydantic_notes.bench import measure
+from pydantic_notes.lazy import LazyModel
+
+FIELD_TYPES = ((str, "Mickey"), (int, 42), (float, 4.2), (bool, True), (datetime, "1928-11-18T00:00:00"))
+
+
+def wide_model(width: int) -> tuple[type[BaseModel], dict]:
+    fields = {}
+    payload = {"firstName": "Mickey"}
+    for i in range(width):
+        annotation, value = FIELD_TYPES[i % len(FIELD_TYPES)]
+        fields[f"field_{i}"] = (annotation, ...)
+        payload[to_camel(f"field_{i}")] = value
+    model_cls = create_model(
+        "WideModel",
+        __config__=ConfigDict(alias_generator=to_camel),
+        first_name=(str, Field(alias="firstName")),
+        **fields,
+    )
+    return model_cls, payload
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    model_cls, payload = wide_model(args.width)
+    raw = json.dumps(payload).encode()
+    cases = {
+        "model_validate_json(raw).first_name": lambda: model_cls.model_validate_json(raw).first_name,
+        "LazyModel(raw).first_name": lambda: LazyModel(model_cls, raw).first_name,
+        "model_validate(dict).first_name": lambda: model_cls.model_validate(payload).first_name,
+        "LazyModel(dict).first_name": lambda: LazyModel(model_cls, payload).first_name,
+    }
+    print(f"{args.width + 1} fields, {len(raw)} bytes per document")
+    for name, func in cases.items():
+        measurement = measure(func, repeat=args.repeat)
+        print(f"{name:<40} {measurement.median * 1e6:>9.2f}us +/- {measurement.spread * 1e6:.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
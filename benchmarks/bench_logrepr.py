@@ -0,0 +1,50 @@
+"""Logging a batch of models: eager ``repr()`` against :func:`~pydantic_notes.logrepr.bounded` / ``summary``.
+
+Each case logs a ``--count`` batch of wide models once at DEBUG on a logger filtered at INFO (nothing is emitted) and
+once at WARNING to a handler writing to a null stream (the message is formatted).
+
+    uv run python benchmarks/bench_logrepr.py --count 1000 --width 50
+"""
+
+import argparse
+import io
+import logging
+from collections.abc import Sequence
+
+from bench_lazy import wide_model
+
+from pydantic_notes.bench import measure
+from pydantic_notes.logrepr import bounded, summary
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--width", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    model_cls, payload = wide_model(args.width)
+    batch = [model_cls.model_validate(payload) for _ in range(args.count)]
+    logger = logging.getLogger("bench_logrepr")
+    logger.propagate = False
+    logger.addHandler(logging.StreamHandler(io.StringIO()))
+    logger.setLevel(logging.INFO)
+
+    cases = {
+        "f-string repr": lambda level: logger.log(level, f"batch {batch!r}"),  # noqa: G004
+        "%r": lambda level: logger.log(level, "batch %r", batch),
+        "bounded": lambda level: logger.log(level, "batch %s", bounded(batch)),
+        "summary": lambda level: logger.log(level, "batch %s", summary(batch)),
+    }
+    print(f"{args.count} models of {args.width + 1} fields")
+    for name, log in cases.items():
+        for level in (logging.DEBUG, logging.WARNING):
+            measurement = measure(lambda log=log, level=level: log(level), repeat=args.repeat)
+            label = f"{name} ({logging.getLevelName(level).lower()})"
+            print(f"{label:<26} {measurement.median * 1e6:>11.2f}us +/- {measurement.spread * 1e6:.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+"""Keys in mixed spellings: ``AliasChoices`` listing every spelling against key normalization.
+
+Both models declare ``--width`` ``str`` fields. The first lists eight spellings per field in ``AliasChoices``; the
+second, a :class:`~pydantic_notes.normalize.NormalizedKeysModel`, reads the snake_case name and normalizes keys.
+Inputs spell keys in snake_case, with a seeded random pick among the spellings, or with the last one listed.
+
+    uv run python benchmarks/bench_normalize.py --width 20
+"""
+
+import argparse
+import random
+from collections.abc import Sequence
+
+from pydantic import AliasChoices, BaseModel, Field, create_model
+from pydantic.alias_generators import to_camel, to_pascal
+
+from pydantic_notes.bench import measure
+from pydantic_notes.normalize import NormalizedKeysModel
+
+
+def spellings(name: str) -> list[str]:
+    return [
+        name,
+        to_camel(name),
+        to_pascal(name),
+        name.upper(),
+        name.replace("_", ""),
+        name.replace("_", "-"),
+        name.upper().replace("_", "-"),
+        name.replace("_", "."),
+    ]
+
+
+def models(width: int) -> tuple[type[BaseModel], type[BaseModel]]:
+    names = [f"field_name_{i}" for i in range(width)]
+    choices = create_model(
+        "WithAliasChoices",
+        **{name: (str, Field(validation_alias=AliasChoices(*spellings(name)))) for name in names},
+    )
+    normalized = create_model(
+        "WithNormalizedKeys", __base__=NormalizedKeysModel, **{name: (str, ...) for name in names}
+    )
+    return choices, normalized
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)  # noqa: S311
+    choices, normalized = models(args.width)
+    names = list(choices.model_fields)
+    inputs = {
+        "snake_case keys": {name: "Mickey" for name in names},
+        "mixed keys": {rng.choice(spellings(name)): "Mickey" for name in names},
+        "last choice keys": {spellings(name)[-1]: "Mickey" for name in names},
+    }
+    for label, data in inputs.items():
+        for model_cls in (choices, normalized):
+            measurement = measure(lambda m=model_cls, d=data: m.model_validate(d), repeat=args.repeat)
+            name = f"{label}, {model_cls.__name__}"
+            print(f"{name:<40} {measurement.median * 1e6:>9.2f}us +/- {measurement.spread * 1e6:.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
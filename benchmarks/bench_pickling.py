@@ -0,0 +1,60 @@
+"""Pickle size and speed of model lists: default pickles against compact rows.
+
+For each conftest alias model, pickles ``--count`` validated instances as a plain list (default ``__getstate__``), as a
+list of :class:`~pydantic_notes.pickling.CompactPickleModel` instances, one message at a time (as a queue would send
+them) and as a :class:`~pydantic_notes.pickling.CompactBatch`.
+
+    uv run python benchmarks/bench_pickling.py --count 10000
+"""
+
+import argparse
+import pickle
+from collections.abc import Sequence
+
+from pydantic_notes.bench import measure
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.pickling import CompactPickleModel, compact_batch
+from pydantic_notes.workload import Workload
+
+COMPACT_MODELS = {
+    name: type(model_cls.__name__, (CompactPickleModel, model_cls), {"__module__": __name__})
+    for name, model_cls in ALIAS_MODELS.items()
+}
+globals().update({model_cls.__name__: model_cls for model_cls in COMPACT_MODELS.values()})
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for name, model_cls in ALIAS_MODELS.items():
+        records = list(Workload(model_cls, seed=0).records(args.count))
+        plain = [model_cls.model_validate(record) for record in records]
+        compact = [COMPACT_MODELS[name].model_validate(record) for record in records]
+        cases = {
+            "default list": plain,
+            "default, one each": plain,
+            "compact list": compact,
+            "compact, one each": compact,
+            "compact batch": compact_batch(plain),
+        }
+        print(name)
+        for label, instances in cases.items():
+            if label.endswith("one each"):
+                size = sum(len(pickle.dumps(instance)) for instance in instances)
+                func = lambda i=instances: [pickle.loads(pickle.dumps(instance)) for instance in i]  # noqa: E731, S301
+            else:
+                size = len(pickle.dumps(instances))
+                func = lambda i=instances: pickle.loads(pickle.dumps(i))  # noqa: E731, S301
+            measurement = measure(func, repeat=args.repeat, min_time=0)
+            print(
+                f"  {label:<18} {size / len(instances):>7.1f} B/record"
+                f" {measurement.median * 1e3:>9.2f}ms +/- {measurement.spread * 1e3:.2f}ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+"""Staged pipelines: a hand-rolled validate / transform / dump loop against ``json_pipeline`` configurations.
+
+Runs ``--count`` NDJSON lines of ``--model`` through ``model_validate_json``, a transform upper-casing the first
+string field and ``model_dump_json(by_alias=True)``: in a plain loop, then as a pipeline with every stage inline, in
+thread pools, and with validation and dumping in process pools of ``--workers`` processes. Per-stage metrics of the
+last configuration show where the time goes.
+
+    uv run python benchmarks/bench_pipeline.py --model validation_alias_choices --count 100000 --workers 4
+"""
+
+import argparse
+import io
+import os
+from collections.abc import Sequence
+
+from pydantic import BaseModel
+
+from pydantic_notes.bench import measure
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.pipeline import Mode, Pipeline, json_pipeline
+from pydantic_notes.workload import Workload, write_ndjson
+
+
+def shout(model: BaseModel) -> BaseModel:
+    name = next(name for name, field in type(model).model_fields.items() if field.annotation is str)
+    return model.model_copy(update={name: getattr(model, name).upper()})
+
+
+def loop(model_cls: type[BaseModel], lines: list[bytes]) -> list[bytes]:
+    return [shout(model_cls.model_validate_json(line)).model_dump_json(by_alias=True).encode() for line in lines]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", choices=sorted(ALIAS_MODELS), default="validation_alias_choices")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    model_cls = ALIAS_MODELS[args.model]
+    fp = io.StringIO()
+    write_ndjson(Workload(model_cls, seed=0).records(args.count), fp)
+    lines = fp.getvalue().encode().splitlines()
+    stages = ("validate", "transform", "dump")
+    configurations: dict[str, tuple[dict[str, Mode], dict[str, int]]] = {
+        "inline": ({}, {}),
+        "threads": (dict.fromkeys(stages, "thread"), dict.fromkeys(stages, args.workers)),
+        "processes": (
+            {"validate": "process", "dump": "process"},
+            {"validate": args.workers, "dump": args.workers},
+        ),
+    }
+    print(f"{args.model}: {args.count:,} lines, {os.cpu_count()} CPUs, {args.workers} workers per pool")
+    measurement = measure(lambda: loop(model_cls, lines), repeat=args.repeat, min_time=0)
+    baseline = measurement.median
+    print(f"  {'loop':<20} {args.count / baseline:>12,.0f} lines/s  x1.00")
+    pipeline: Pipeline | None = None
+    for label, (modes, workers) in configurations.items():
+        pipeline = json_pipeline(model_cls, shout, modes=modes, workers=workers, batch_size=args.batch_size)
+        measurement = measure(lambda p=pipeline: list(p.run(lines)), repeat=args.repeat, min_time=0)
+        print(
+            f"  {f'pipeline, {label}':<20} {args.count / measurement.median:>12,.0f} lines/s"
+            f"  x{baseline / measurement.median:.2f}"
+        )
+    print("\n".join(f"  {line}" for line in str(pipeline).splitlines()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
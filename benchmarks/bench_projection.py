@@ -0,0 +1,39 @@
+"""``first_name`` out of a wide model: full validation against :func:`~pydantic_notes.projection.validate_projection`.
+
+uv run python benchmarks/bench_projection.py --width 50
+"""
+
+import argparse
+import json
+from collections.abc import Sequence
+
+from bench_lazy import wide_model
+
+from pydantic_notes.bench import measure
+from pydantic_notes.projection import validate_projection
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    model_cls, payload = wide_model(args.width)
+    raw = json.dumps(payload).encode()
+    fields = {"first_name"}
+    cases = {
+        "model_validate_json(raw)": lambda: model_cls.model_validate_json(raw),
+        "validate_projection(raw)": lambda: validate_projection(model_cls, raw, fields),
+        "model_validate(dict)": lambda: model_cls.model_validate(payload),
+        "validate_projection(dict)": lambda: validate_projection(model_cls, payload, fields),
+    }
+    print(f"{args.width + 1} fields, {len(raw)} bytes per document")
+    for name, func in cases.items():
+        measurement = measure(func, repeat=args.repeat)
+        print(f"{name:<30} {measurement.median * 1e6:>9.2f}us +/- {measurement.spread * 1e6:.2f}us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
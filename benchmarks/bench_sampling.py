@@ -0,0 +1,83 @@
+"""Trusted streams: full validation, sampled validation and trusted construction.
+
+For each conftest alias model, and for a reading model with a nested model, a list of ``--values`` floats and a
+Python field validator, builds models out of ``--count`` valid records with ``model_validate``, with a
+``SampledValidator`` validating one record in ``--every``, and with trusted construction alone.
+
+    uv run python benchmarks/bench_sampling.py --count 20000 --every 100
+"""
+
+import argparse
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from pydantic import BaseModel, Field, field_validator
+
+from pydantic_notes.bench import measure
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.sampling import SampledValidator, trusted_builder
+from pydantic_notes.workload import Workload
+
+
+class Sensor(BaseModel):
+    sensor_id: str = Field(alias="sensorId")
+    site: str
+
+
+class Reading(BaseModel):
+    reading_id: int = Field(alias="readingId")
+    taken_at: datetime = Field(alias="takenAt")
+    sensor: Sensor
+    values: list[float]
+    unit: str = "C"
+
+    @field_validator("unit")
+    @classmethod
+    def known_unit(cls, value: str) -> str:
+        if value not in ("C", "F"):
+            raise ValueError(value)
+        return value
+
+
+def readings(count: int, values: int) -> list[dict]:
+    taken_at = datetime(2024, 1, 1, tzinfo=UTC)
+    sensor = {"sensorId": "s-1", "site": "lab"}
+    return [
+        {"readingId": i, "takenAt": taken_at, "sensor": sensor, "values": [i / 64] * values, "unit": "C"}
+        for i in range(count)
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--every", type=int, default=100)
+    parser.add_argument("--values", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    streams = {name: (m, list(Workload(m, seed=0).records(args.count))) for name, m in ALIAS_MODELS.items()}
+    streams["reading"] = (Reading, readings(args.count, args.values))
+    for name, (model_cls, records) in streams.items():
+        build = trusted_builder(model_cls).build
+        cases = {
+            "model_validate": lambda m=model_cls, r=records: [m.model_validate(record) for record in r],
+            f"sampled 1/{args.every}": lambda m=model_cls, r=records: list(
+                SampledValidator(m, args.every, seed=0).validate_many(r)
+            ),
+            "trusted construct": lambda b=build, r=records: [b(record) for record in r],
+        }
+        print(name)
+        baseline = None
+        for label, func in cases.items():
+            measurement = measure(func, repeat=args.repeat, min_time=0)
+            baseline = baseline or measurement.median
+            print(
+                f"  {label:<18} {args.count / measurement.median:>12,.0f} records/s"
+                f"  x{baseline / measurement.median:.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+"""Sharded NDJSON export by worker count, against a sequential ``model_dump_json`` loop.
+
+Exports ``--count`` raw validated rows of a ten-field aliased model in shards of ``--shard-size`` records with 1, 2, 4,
+... up to ``os.cpu_count()`` worker processes (``0`` serializes in-process).
+
+    uv run python benchmarks/bench_shard.py --count 200000
+"""
+
+import argparse
+import os
+import tempfile
+from collections.abc import Sequence
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+from pydantic_notes.bench import measure
+from pydantic_notes.shard import export
+
+
+class Record(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    record_id: int
+    first_name: str
+    last_name: str
+    email_address: str
+    signup_date: datetime
+    score: float
+    is_active: bool
+    city_name: str
+    country_code: str
+    referral_count: int
+
+
+def rows(count: int) -> list[dict]:
+    template = Record.model_validate(
+        {
+            "recordId": 0,
+            "firstName": "Mickey",
+            "lastName": "Mouse",
+            "emailAddress": "mickey@example.com",
+            "signupDate": "1928-11-18T00:00:00",
+            "score": 4.2,
+            "isActive": True,
+            "cityName": "Toontown",
+            "countryCode": "US",
+            "referralCount": 7,
+        }
+    )
+    return [{**template.__dict__, "record_id": i} for i in range(count)]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--shard-size", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    data = rows(args.count)
+    instances = [Record.model_construct(**row) for row in data]
+    worker_counts = [0]
+    while worker_counts[-1] < (os.cpu_count() or 1):
+        worker_counts.append(max(1, worker_counts[-1] * 2))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sequential.ndjson")
+
+        def sequential() -> None:
+            with open(path, "w") as fp:
+                for instance in instances:
+                    fp.write(instance.model_dump_json(by_alias=True) + "\n")
+
+        baseline = measure(sequential, repeat=args.repeat, min_time=0)
+        print(f"{args.count} records, {os.cpu_count()} CPUs")
+        print(f"{'sequential loop':<16} {baseline.median:>8.3f}s")
+        for workers in worker_counts:
+            measurement = measure(
+                lambda w=workers: export(Record, data, tmp, shard_size=args.shard_size, workers=w),
+                repeat=args.repeat,
+                min_time=0,
+            )
+            speedup = baseline.median / measurement.median
+            print(f"{f'{workers} workers':<16} {measurement.median:>8.3f}s  x{speedup:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+"""Bulk SQLite loading and reading: per-model loops against ``SQLiteSink`` and ``SQLiteSource``.
+
+For each conftest alias model and for an order model with ``datetime``, list and nested model fields, writes
+``--count`` validated models to a fresh database file: one ``execute`` of ``model_dump(mode="json")`` values per
+model, containers as JSON, committed once at the end; then ``SQLiteSink`` with default and with bulk pragmas, and the
+sink fed raw rows. Reads the rows back with ``fetchall``, a dict per row and ``model_validate`` (JSON columns parsed
+with ``json.loads``), then with ``SQLiteSource``, validating and trusted.
+
+    uv run python benchmarks/bench_sqlite.py --count 50000 --batch-size 10000
+"""
+
+import argparse
+import json
+import sqlite3
+import tempfile
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from pydantic_notes.aliases import input_paths, place
+from pydantic_notes.bench import measure
+from pydantic_notes.codec import field_kind
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.sqlite import BULK_PRAGMAS, SQLiteSink, SQLiteSource, quote, table_schema
+from pydantic_notes.workload import Workload
+
+
+class Address(BaseModel):
+    city: str
+    zip_code: str | None = None
+
+
+class Order(BaseModel):
+    order_id: int = Field(alias="orderId")
+    placed_at: datetime
+    total: float
+    paid: bool = False
+    note: str | None = None
+    items: list[str] = []
+    address: Address | None = None
+
+
+def orders(count: int) -> list[Order]:
+    placed_at = datetime(2024, 1, 1, tzinfo=UTC)
+    address = Address(city="Toontown", zip_code="00001")
+    return [
+        Order(orderId=i, placed_at=placed_at, total=i / 4, items=["a", "b", "c"], address=address) for i in range(count)
+    ]
+
+
+def naive(connection: sqlite3.Connection, models: list[BaseModel]) -> None:
+    model_cls = type(models[0])
+    connection.execute(table_schema(model_cls))
+    names = ", ".join(quote(name) for name in model_cls.model_fields)
+    marks = ", ".join("?" * len(model_cls.model_fields))
+    sql = f"INSERT INTO {quote(model_cls.__name__)} ({names}) VALUES ({marks})"  # noqa: S608
+    for model in models:
+        values = model.model_dump(mode="json").values()
+        connection.execute(sql, [json.dumps(v) if isinstance(v, list | dict) else v for v in values])
+    connection.commit()
+
+
+def naive_read(connection: sqlite3.Connection, model_cls: type[BaseModel]) -> list[BaseModel]:
+    paths = [paths[0] for paths in input_paths(model_cls).values()]
+    kinds = [field_kind(field.annotation) for field in model_cls.model_fields.values()]
+    models = []
+    for row in connection.execute(f"SELECT * FROM {quote(model_cls.__name__)}").fetchall():  # noqa: S608
+        data: dict = {}
+        for path, kind, value in zip(paths, kinds, row, strict=True):
+            place(data, path, json.loads(value) if kind == "json" and value is not None else value)
+        models.append(model_cls.model_validate(data))
+    return models
+
+
+def source(connection: sqlite3.Connection, model_cls: type[BaseModel], **options: object) -> list[BaseModel]:
+    cursor = connection.execute(f"SELECT * FROM {quote(model_cls.__name__)}")  # noqa: S608
+    return list(SQLiteSource(cursor, model_cls, **options))
+
+
+def report(label: str, count: int, seconds: float, baseline: float) -> None:
+    print(f"  {label:<24} {count / seconds:>12,.0f} rows/s  x{baseline / seconds:.2f}")
+
+
+def run(directory: Path, write: Callable[[sqlite3.Connection], object]) -> None:
+    path = directory / "bench.db"
+    path.unlink(missing_ok=True)
+    connection = sqlite3.connect(path)
+    try:
+        write(connection)
+    finally:
+        connection.close()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    streams = {
+        name: [m.model_validate(record) for record in Workload(m, seed=0).records(args.count)]
+        for name, m in ALIAS_MODELS.items()
+    }
+    streams["order"] = orders(args.count)
+    options = {"batch_size": args.batch_size}
+    bulk = {**options, "pragmas": BULK_PRAGMAS}
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for name, models in streams.items():
+            model_cls = type(models[0])
+            rows = [model.__dict__ for model in models]
+            cases = {
+                "per-model insert": lambda c, ms=models: naive(c, ms),
+                "sink": lambda c, m=model_cls, ms=models: SQLiteSink(c, m, **options).write(ms),
+                "sink, bulk pragmas": lambda c, m=model_cls, ms=models: SQLiteSink(c, m, **bulk).write(ms),
+                "sink, raw rows": lambda c, m=model_cls, rs=rows: SQLiteSink(c, m, **bulk).write(rs),
+            }
+            print(name)
+            baseline = None
+            for label, write in cases.items():
+                measurement = measure(lambda w=write: run(directory, w), repeat=args.repeat, min_time=0)
+                baseline = baseline or measurement.median
+                report(label, args.count, measurement.median, baseline)
+
+            readers = {
+                "fetchall + model_validate": lambda c, m=model_cls: naive_read(c, m),
+                "source, validated": lambda c, m=model_cls: source(c, m, **options),
+                "source, trusted": lambda c, m=model_cls: source(c, m, validate=False, **options),
+            }
+            connection = sqlite3.connect(directory / "bench.db")
+            try:
+                baseline = None
+                for label, reader in readers.items():
+                    measurement = measure(lambda r=reader, c=connection: r(c), repeat=args.repeat, min_time=0)
+                    baseline = baseline or measurement.median
+                    report(label, args.count, measurement.median, baseline)
+            finally:
+                connection.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
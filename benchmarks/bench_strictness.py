@@ -0,0 +1,85 @@
+"""Lax against strict validation throughput on the same canonical payloads.
+
+Profiles ``--sample`` payloads of a ten-field typed model with ``profile_coercion``, then validates ``--count`` payloads
+(dicts of native values, and JSON documents) with the model and with the report's strict variant.
+
+    uv run python benchmarks/bench_strictness.py --count 20000
+"""
+
+import argparse
+import json
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
+
+from pydantic_notes.bench import measure
+from pydantic_notes.strictness import profile_coercion
+
+
+class Reading(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    reading_id: int
+    sensor_name: str
+    taken_at: datetime
+    value: float
+    low: float
+    high: float
+    is_valid: bool
+    retries: int
+    tags: list[str]
+    samples: list[int]
+
+
+def payloads(count: int) -> list[dict]:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    return [
+        {
+            "readingId": i,
+            "sensorName": f"sensor-{i % 17}",
+            "takenAt": start + timedelta(seconds=i),
+            "value": i / 7,
+            "low": -1.5,
+            "high": 99.5,
+            "isValid": i % 3 != 0,
+            "retries": i % 4,
+            "tags": ["a", "b"],
+            "samples": [i, i + 1, i + 2],
+        }
+        for i in range(count)
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--sample", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    dicts = payloads(args.count)
+    documents = [json.dumps(payload, default=datetime.isoformat) for payload in dicts]
+    report = profile_coercion(Reading, dicts[: args.sample] + documents[: args.sample])
+    print(report)
+    strict_cls = report.strict_model()
+
+    for label, data, method in (("dicts", dicts, "model_validate"), ("JSON", documents, "model_validate_json")):
+        lax = measure(
+            lambda d=data, m=method: [getattr(Reading, m)(payload) for payload in d], repeat=args.repeat, min_time=0
+        )
+        strict = measure(
+            lambda d=data, m=method: [getattr(strict_cls, m)(payload) for payload in d],
+            repeat=args.repeat,
+            min_time=0,
+        )
+        print(
+            f"{label:<6} lax {args.count / lax.median:>10,.0f}/s  strict {args.count / strict.median:>10,.0f}/s"
+            f"  x{lax.median / strict.median:.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
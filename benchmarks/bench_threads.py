@@ -0,0 +1,136 @@
+"""Thread scaling of ``model_validate_json`` / ``model_dump_json`` on the alias models.
+
+Every thread count from 1 to ``--max-threads`` runs the same amount of work per thread (weak scaling), all threads
+released together by a barrier. Reported per thread count:
+
+- throughput (calls/s) and speedup over a single thread;
+- efficiency (speedup / threads) and contention (1 - efficiency);
+- CPU utilisation: summed per-thread CPU time over wall time. With the GIL it stays close to 1 however many threads
+  run; on a free-threaded interpreter it should track the thread count.
+
+    uv run python benchmarks/bench_threads.py --model validation_alias_choices --max-threads 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+
+from pydantic_notes.bench import environment, gil_label
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload
+
+
+@dataclass(frozen=True)
+class ScalingPoint:
+    threads: int
+    wall: float
+    cpu: float
+    calls: int
+    speedup: float = 1.0
+
+    @property
+    def throughput(self) -> float:
+        return self.calls / self.wall
+
+    @property
+    def efficiency(self) -> float:
+        return self.speedup / self.threads
+
+    @property
+    def utilisation(self) -> float:
+        return self.cpu / self.wall
+
+
+def run_threads(work: Callable[[], None], threads: int) -> tuple[float, float]:
+    """Run ``work`` once on each of ``threads`` threads; return wall time and summed thread CPU time."""
+    barrier = threading.Barrier(threads + 1)
+    cpu_times = [0.0] * threads
+
+    def target(index: int) -> None:
+        barrier.wait()
+        started = time.thread_time()
+        work()
+        cpu_times[index] = time.thread_time() - started
+
+    workers = [threading.Thread(target=target, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started, sum(cpu_times)
+
+
+def scaling(work: Callable[[], None], calls_per_run: int, max_threads: int) -> list[ScalingPoint]:
+    work()  # warm up
+    points: list[ScalingPoint] = []
+    for threads in range(1, max_threads + 1):
+        wall, cpu = run_threads(work, threads)
+        calls = calls_per_run * threads
+        speedup = calls / wall / points[0].throughput if points else 1.0
+        points.append(ScalingPoint(threads, wall, cpu, calls, speedup))
+    return points
+
+
+def workloads(model: str, records: int, rounds: int) -> dict[str, tuple[Callable[[], None], int]]:
+    model_cls = ALIAS_MODELS[model]
+    payloads = [json.dumps(record) for record in Workload(model_cls, seed=0).records(records)]
+    instances = [model_cls.model_validate_json(payload) for payload in payloads]
+
+    def validate_json() -> None:
+        for _ in range(rounds):
+            for payload in payloads:
+                model_cls.model_validate_json(payload)
+
+    def dump_json() -> None:
+        for _ in range(rounds):
+            for instance in instances:
+                instance.model_dump_json(by_alias=True)
+
+    return {"model_validate_json": (validate_json, records * rounds), "model_dump_json": (dump_json, records * rounds)}
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", choices=sorted(ALIAS_MODELS), action="append")
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--records", type=int, default=1_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for model in args.model or ["plain_alias", "validation_alias_choices", "validation_alias_path"]:
+        for method, (work, calls) in workloads(model, args.records, args.rounds).items():
+            results[f"{model}/{method}"] = scaling(work, calls, args.max_threads)
+
+    if args.json:
+        document = {
+            "environment": environment(),
+            "results": {name: [asdict(p) for p in points] for name, points in results.items()},
+        }
+        print(json.dumps(document, indent=2))
+        return 0
+
+    print(f"{sys.version.split()[0]} [{gil_label()}], {os.cpu_count()} CPUs")
+    for name, points in results.items():
+        print(f"\n{name}")
+        print(
+            f"{'threads':>7}  {'calls/s':>12}  {'speedup':>7}  {'efficiency':>10}  {'contention':>10}  {'cpu/wall':>8}"
+        )
+        for p in points:
+            print(
+                f"{p.threads:>7}  {p.throughput:>12,.0f}  {p.speedup:>7.2f}  {p.efficiency:>10.0%}  "
+                f"{1 - p.efficiency:>10.0%}  {p.utilisation:>8.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
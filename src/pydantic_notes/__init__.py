@@ -0,0 +1,15 @@
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydantic_notes.plan import explain
+
+__all__ = ["explain"]
+
+
+def __getattr__(name: str) -> Any:
+    # Imported on first use: ``plan`` imports ``bench``, which ``python -m pydantic_notes.bench`` must find unimported.
+    if name == "explain":
+        from pydantic_notes.plan import explain
+
+        return explain
+    raise AttributeError(name)
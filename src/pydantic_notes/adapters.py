@@ -0,0 +1,184 @@
+"""Shared, bounded registry of ``TypeAdapter`` instances, keyed by type expression and config.
+
+Building a ``TypeAdapter(list[Model])`` or ``TypeAdapter(dict[str, Model])`` generates and compiles a core schema
+every time, which request handlers building adapters ad hoc pay on every call. A :class:`TypeAdapterRegistry` hands
+out one shared adapter per type expression and config (a ``ConfigDict``, frozen into the key), building it on the
+first request and keeping at most ``max_entries`` adapters, evicting the least recently used first.
+
+Lookups are thread-safe, and concurrent requests for an adapter being built wait for that build rather than starting
+their own. ``Field()`` metadata in ``Annotated`` types is keyed by its repr, ``FieldInfo`` itself comparing by
+identity. Type expressions or configs that cannot be hashed (e.g. ``Annotated`` metadata holding a list) get a fresh
+adapter every time, counted as ``uncached``. :attr:`TypeAdapterRegistry.stats` reports hits, misses, evictions and the
+time spent building.
+
+:meth:`TypeAdapterRegistry.register` prebuilds, for models registered at startup, the adapters of every shape in
+``shapes``: generic aliases over a type variable (:data:`DEFAULT_SHAPES`, ``list[T]`` and ``dict[str, T]``), filled
+in with each model. Type expressions are evaluated by the caller: string forward references would be resolved in this
+module, not where they were written.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Annotated, Any, Literal, TypeVar, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic.fields import FieldInfo
+
+T = TypeVar("T")
+
+DEFAULT_SHAPES: tuple[Any, ...] = (list[T], dict[str, T])
+
+type _Key = tuple[Any, tuple[tuple[str, Any], ...]]
+
+
+@dataclass(frozen=True)
+class RegistryStats:
+    hits: int
+    misses: int
+    uncached: int
+    evictions: int
+    entries: int
+    builds: int
+    build_time: float
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses + self.uncached
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def mean_build_time(self) -> float:
+        return self.build_time / self.builds if self.builds else 0.0
+
+
+def _has_field_info(type_: Any) -> bool:
+    if isinstance(type_, list | tuple):
+        return any(_has_field_info(item) for item in type_)
+    if get_origin(type_) is Annotated:
+        return any(isinstance(item, FieldInfo) for item in type_.__metadata__) or _has_field_info(type_.__origin__)
+    return get_origin(type_) is not Literal and _has_field_info(get_args(type_))
+
+
+def _normalized(type_: Any) -> Any:
+    """``type_``, with ``Field()`` metadata replaced by its repr.
+
+    ``FieldInfo`` compares by identity: equal ``Annotated[int, Field(gt=0)]`` expressions, written out in two places,
+    are not equal, and would never share an adapter. Expressions without ``Field()`` metadata are kept as they are.
+    """
+    if isinstance(type_, list | tuple):
+        return tuple(_normalized(item) for item in type_)
+    if not _has_field_info(type_):
+        return type_
+    if get_origin(type_) is Annotated:
+        metadata = tuple(
+            (FieldInfo, repr(item)) if isinstance(item, FieldInfo) else item for item in type_.__metadata__
+        )
+        return Annotated, _normalized(type_.__origin__), metadata
+    return get_origin(type_), _normalized(get_args(type_))
+
+
+def _key(type_: Any, config: ConfigDict | None) -> _Key | None:
+    key = (_normalized(type_), tuple(sorted((config or {}).items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class TypeAdapterRegistry:
+    def __init__(self, *, max_entries: int = 256):
+        if max_entries < 1:
+            raise ValueError(max_entries)
+        self.max_entries = max_entries
+        self._entries: OrderedDict[_Key, TypeAdapter] = OrderedDict()
+        self._building: dict[_Key, Future[TypeAdapter]] = {}
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._uncached = self._evictions = self._builds = 0
+        self._build_time = 0.0
+
+    def _build(self, type_: Any, config: ConfigDict | None) -> TypeAdapter:
+        started = time.perf_counter()
+        adapter = TypeAdapter(type_, config=config)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._builds += 1
+            self._build_time += elapsed
+        return adapter
+
+    def get(self, type_: Any, config: ConfigDict | None = None) -> TypeAdapter:
+        """The shared adapter for ``type_`` and ``config``, built on first use."""
+        key = _key(type_, config)
+        if key is None:
+            with self._lock:
+                self._uncached += 1
+            return self._build(type_, config)
+        with self._lock:
+            adapter = self._entries.get(key)
+            if adapter is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return adapter
+            building = self._building.get(key)
+            if building is not None:
+                # Another thread is building it.
+                self._hits += 1
+            else:
+                self._misses += 1
+                pending = self._building[key] = Future()
+        if building is not None:
+            return building.result()
+        try:
+            adapter = self._build(type_, config)
+        except BaseException as exc:
+            with self._lock:
+                del self._building[key]
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            del self._building[key]
+            self._entries[key] = adapter
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        pending.set_result(adapter)
+        return adapter
+
+    def register(
+        self,
+        models: Iterable[type[BaseModel]],
+        *,
+        shapes: Iterable[Any] = DEFAULT_SHAPES,
+        config: ConfigDict | None = None,
+    ) -> list[TypeAdapter]:
+        """Prebuild the adapter of every shape, filled in with every model; the adapters, model by model."""
+        shapes = list(shapes)
+        return [self.get(shape[model], config) for model in models for shape in shapes]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, type_: Any) -> bool:
+        key = _key(type_, None)
+        return key is not None and key in self._entries
+
+    @property
+    def stats(self) -> RegistryStats:
+        with self._lock:
+            return RegistryStats(
+                hits=self._hits,
+                misses=self._misses,
+                uncached=self._uncached,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                builds=self._builds,
+                build_time=self._build_time,
+            )
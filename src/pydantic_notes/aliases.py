@@ -0,0 +1,89 @@
+"""Where pydantic looks for a field's value in the validation input.
+
+Once a model class is built, ``FieldInfo.validation_alias`` already reflects ``AliasGenerator`` and ``alias_priority``
+resolution, so every field boils down to an ordered list of *paths*: a plain alias ``"firstName"`` is the path
+``("firstName",)``, ``AliasPath("names", 0)`` is ``("names", 0)``, ``AliasChoices`` contributes one path per choice and
+``populate_by_name`` appends the field name as a last resort. The first path that resolves wins.
+"""
+
+from collections.abc import Mapping
+from functools import cache
+from typing import Any
+
+from pydantic import AliasChoices, AliasPath, BaseModel
+from pydantic.fields import FieldInfo
+
+type InputPath = tuple[str | int, ...]
+
+MISSING: Any = object()
+
+
+def field_paths(name: str, field: FieldInfo, *, populate_by_name: bool = False) -> tuple[InputPath, ...]:
+    alias = field.validation_alias if field.validation_alias is not None else field.alias
+    if alias is None:
+        return ((name,),)
+    if isinstance(alias, str):
+        paths = [(alias,)]
+    elif isinstance(alias, AliasPath):
+        paths = [tuple(alias.path)]
+    elif isinstance(alias, AliasChoices):
+        paths = [(choice,) if isinstance(choice, str) else tuple(choice.path) for choice in alias.choices]
+    else:
+        raise TypeError(name, alias)
+    if populate_by_name and (name,) not in paths:
+        paths.append((name,))
+    return tuple(paths)
+
+
+@cache
+def input_paths(model_cls: type[BaseModel]) -> dict[str, tuple[InputPath, ...]]:
+    """Field name to candidate input paths, in the order pydantic tries them."""
+    populate_by_name = bool(model_cls.model_config.get("populate_by_name", False))
+    return {
+        name: field_paths(name, field, populate_by_name=populate_by_name)
+        for name, field in model_cls.model_fields.items()
+    }
+
+
+def input_keys(model_cls: type[BaseModel]) -> frozenset[str]:
+    """Every top-level key the model reads from."""
+    return frozenset(str(path[0]) for paths in input_paths(model_cls).values() for path in paths)
+
+
+def lookup(data: Any, path: InputPath) -> Any:
+    """Follow ``path`` through nested mappings and sequences; :data:`MISSING` if it does not resolve."""
+    for item in path:
+        if isinstance(item, str):
+            if not isinstance(data, Mapping) or item not in data:
+                return MISSING
+        elif not isinstance(data, list | tuple) or not -len(data) <= item < len(data):
+            return MISSING
+        data = data[item]
+    return data
+
+
+def resolve(data: Any, paths: tuple[InputPath, ...]) -> Any:
+    for path in paths:
+        if (value := lookup(data, path)) is not MISSING:
+            return value
+    return MISSING
+
+
+def place(record: dict[str, Any], path: InputPath, value: Any) -> None:
+    """Store ``value`` at ``path``, creating intermediate mappings and lists (padded with ``None``) as needed."""
+    container: Any = record
+    for item, following in zip(path, path[1:], strict=False):
+        default: Any = [] if isinstance(following, int) else {}
+        if isinstance(item, str):
+            container = container.setdefault(item, default)
+        else:
+            container.extend([None] * (item + 1 - len(container)))
+            if container[item] is None:
+                container[item] = default
+            container = container[item]
+    last = path[-1]
+    if isinstance(last, str):
+        container[last] = value
+    else:
+        container.extend([None] * (last + 1 - len(container)))
+        container[last] = value
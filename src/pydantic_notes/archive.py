@@ -0,0 +1,326 @@
+"""Pipelined reading of compressed NDJSON archives: read, decompress and validate in overlapping stages.
+
+Reading a ``.ndjson.gz`` with ``gzip.open`` and validating line by line runs every stage in turn on one thread. An
+:class:`ArchiveReader` splits the work in two. A producer reads ``chunk_size`` bytes at a time from the file,
+decompresses them incrementally (gzip, bz2 or lzma, detected from the magic bytes; concatenated members and streams
+included) and hands blocks of whole lines, about ``block_size`` decompressed bytes each, through a queue of at most
+``max_pending`` blocks to the consumer, which validates every line with ``model_validate_json`` and yields the models.
+While validation runs, the producer works ahead; when validation falls behind, the full queue blocks it, so memory
+stays bounded. An archive cut short of its end-of-stream marker raises ``EOFError``, as ``gzip.open`` and the like do;
+NUL padding after a gzip member is skipped, as ``gzip.open`` skips it.
+
+The producer runs in a thread (``mode="thread"``), which overlaps well because ``zlib``, ``bz2`` and ``lzma`` release
+the GIL while they decompress, or in a process (``mode="process"``), which also moves the line cutting and queueing off
+the validating interpreter and pays for pickling the blocks; ``mode="inline"`` runs both stages in turn, as a
+baseline. By default gzip and plain files get a thread, and bz2 and lzma, several times slower to decompress, a process.
+
+Each stage times itself: :attr:`ArchiveReader.stats` holds, per stage, what it went through (compressed bytes read,
+bytes decompressed, records validated), the seconds it was busy and the seconds it waited on the queue (the
+producer's, on ``read``). A producer waiting on a full queue means validation is the bottleneck; a consumer waiting
+on an empty one, decompression (or the disk). :attr:`ArchiveStats.bottleneck` names the busiest stage.
+"""
+
+import bz2
+import lzma
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Literal, Protocol
+
+from pydantic import BaseModel
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_BLOCK_SIZE = 1 << 18
+DEFAULT_MAX_PENDING = 8
+# Seconds between checks of the stop flag while the producer waits on a full queue.
+POLL_INTERVAL = 0.05
+
+type Codec = Literal["gzip", "bz2", "lzma", "none"]
+type Mode = Literal["inline", "thread", "process"]
+
+MAGIC: dict[bytes, Codec] = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "lzma",
+}
+DEFAULT_MODES: dict[Codec, Mode] = {"gzip": "thread", "none": "thread", "bz2": "process", "lzma": "process"}
+
+
+class _Decompressor(Protocol):
+    eof: bool
+    unused_data: bytes
+
+    def decompress(self, data: bytes) -> bytes: ...
+
+
+class _Plain:
+    eof = False
+    unused_data = b""
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+
+_DECOMPRESSORS: dict[Codec, Callable[[], _Decompressor]] = {
+    "gzip": lambda: zlib.decompressobj(wbits=16 + zlib.MAX_WBITS),
+    "bz2": bz2.BZ2Decompressor,
+    "lzma": lzma.LZMADecompressor,
+    "none": _Plain,
+}
+
+
+def detect_codec(path: str | os.PathLike[str]) -> Codec:
+    with open(path, "rb") as fp:
+        head = fp.read(max(len(magic) for magic in MAGIC))
+    return next((codec for magic, codec in MAGIC.items() if head.startswith(magic)), "none")
+
+
+@dataclass
+class StageStats:
+    name: str
+    unit: str
+    items: int = 0
+    busy: float = 0.0
+    waiting: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items per busy second."""
+        return self.items / self.busy if self.busy else 0.0
+
+
+@dataclass
+class ArchiveStats:
+    read: StageStats = field(default_factory=lambda: StageStats("read", "B"))
+    decompress: StageStats = field(default_factory=lambda: StageStats("decompress", "B"))
+    validate: StageStats = field(default_factory=lambda: StageStats("validate", "records"))
+    blocks: int = 0
+    wall: float = 0.0
+
+    @property
+    def stages(self) -> list[StageStats]:
+        return [self.read, self.decompress, self.validate]
+
+    @property
+    def bottleneck(self) -> str:
+        return max(self.stages, key=lambda stage: stage.busy).name
+
+    def __str__(self) -> str:
+        lines = [f"{self.blocks} blocks in {self.wall:.3f}s, bottleneck: {self.bottleneck}"]
+        for stage in self.stages:
+            lines.append(
+                f"  {stage.name:<10} {stage.items:>14,} {stage.unit:<7} busy {stage.busy:7.3f}s"
+                f"  {stage.throughput:>14,.0f} {stage.unit}/s  waited {stage.waiting:7.3f}s"
+            )
+        return "\n".join(lines)
+
+
+def _padding_skipped(codec: Codec, data: bytes) -> bytes:
+    """``data`` past the end of a member or stream, without the NUL padding ``gzip`` ignores there."""
+    return data.lstrip(b"\x00") if codec == "gzip" else data
+
+
+def blocks(
+    path: str | os.PathLike[str],
+    codec: Codec,
+    chunk_size: int,
+    block_size: int,
+    read: StageStats,
+    decompress: StageStats,
+) -> Iterator[bytes]:
+    """Blocks of whole decompressed lines out of ``path``, timing the read and decompress stages as it goes."""
+    decompressor = _DECOMPRESSORS[codec]()
+    pending = b""
+    empty = True
+    with open(path, "rb") as fp:
+        while True:
+            started = time.perf_counter()
+            raw = fp.read(chunk_size)
+            read.busy += time.perf_counter() - started
+            if not raw:
+                break
+            read.items += len(raw)
+            empty = False
+            started = time.perf_counter()
+            data = b""
+            if decompressor.eof:
+                # The previous chunk ended exactly at the end of a member or stream.
+                rest = _padding_skipped(codec, raw)
+            else:
+                data = decompressor.decompress(raw)
+                rest = _padding_skipped(codec, decompressor.unused_data) if decompressor.eof else b""
+            # A new member (gzip) or stream (bz2, lzma) may follow the end of the previous one.
+            while rest:
+                decompressor = _DECOMPRESSORS[codec]()
+                data += decompressor.decompress(rest)
+                rest = _padding_skipped(codec, decompressor.unused_data) if decompressor.eof else b""
+            decompress.busy += time.perf_counter() - started
+            decompress.items += len(data)
+            pending += data
+            while len(pending) >= block_size:
+                # Cut at the last newline within the block, or at the first one past it for longer lines.
+                cut = pending.rfind(b"\n", 0, block_size) + 1 or pending.find(b"\n", block_size) + 1
+                if not cut:
+                    break
+                yield pending[:cut]
+                pending = pending[cut:]
+    if codec != "none" and not empty and not decompressor.eof:
+        raise EOFError(path)
+    if pending:
+        yield pending
+
+
+class ProducerDiedError(RuntimeError):
+    def __init__(self, exitcode: int | None):
+        super().__init__(f"Decompression producer exited without finishing (exit code {exitcode})")
+
+
+class _StoppedError(Exception):
+    pass
+
+
+def _produce(
+    path: str | os.PathLike[str],
+    codec: Codec,
+    chunk_size: int,
+    block_size: int,
+    out: Any,
+    stop: Any,
+) -> None:
+    """Producer body, in a thread or a process: ``("block", bytes)`` messages, then ``("end", stats)`` or an error."""
+    read, decompress = StageStats("read", "B"), StageStats("decompress", "B")
+
+    def put(message: tuple[str, Any]) -> None:
+        started = time.perf_counter()
+        while True:
+            if stop.is_set():
+                raise _StoppedError
+            try:
+                out.put(message, timeout=POLL_INTERVAL)
+            except queue.Full:
+                continue
+            break
+        read.waiting += time.perf_counter() - started
+
+    try:
+        for block in blocks(path, codec, chunk_size, block_size, read, decompress):
+            put(("block", block))
+        put(("end", (read, decompress)))
+    except _StoppedError:
+        pass
+    except Exception as exc:  # noqa: BLE001
+        try:
+            put(("error", exc))
+        except _StoppedError:
+            pass
+
+
+class ArchiveReader[M: BaseModel]:
+    """Models of ``model_cls``, one per non-blank line of the NDJSON archive at ``path``, decompressed ahead."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        model_cls: type[M],
+        *,
+        codec: Codec | None = None,
+        mode: Mode | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        if chunk_size < 1:
+            raise ValueError(chunk_size)
+        if block_size < 1:
+            raise ValueError(block_size)
+        if max_pending < 1:
+            raise ValueError(max_pending)
+        self.path = path
+        self.model_cls = model_cls
+        self.codec: Codec = codec or detect_codec(path)
+        self.mode: Mode = mode or DEFAULT_MODES[self.codec]
+        self.chunk_size = chunk_size
+        self.block_size = block_size
+        self.max_pending = max_pending
+        self.stats = ArchiveStats()
+
+    def _validate(self, block: bytes) -> list[M]:
+        validate_json = self.model_cls.model_validate_json
+        started = time.perf_counter()
+        models = [validate_json(line) for line in block.splitlines() if line.strip()]
+        stage = self.stats.validate
+        stage.busy += time.perf_counter() - started
+        stage.items += len(models)
+        self.stats.blocks += 1
+        return models
+
+    def _inline(self) -> Iterator[M]:
+        stats = self.stats
+        for block in blocks(self.path, self.codec, self.chunk_size, self.block_size, stats.read, stats.decompress):
+            yield from self._validate(block)
+
+    @staticmethod
+    def _receive(messages: Any, worker: Any) -> tuple[str, Any]:
+        while True:
+            try:
+                return messages.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if not worker.is_alive():
+                    # The last messages may still be on their way when the producer exits.
+                    try:
+                        return messages.get(timeout=POLL_INTERVAL)
+                    except queue.Empty:
+                        raise ProducerDiedError(getattr(worker, "exitcode", None)) from None
+
+    def _pipelined(self) -> Iterator[M]:
+        args = (self.path, self.codec, self.chunk_size, self.block_size)
+        if self.mode == "process":
+            context = multiprocessing.get_context()
+            messages: Any = context.Queue(self.max_pending)
+            stop: Any = context.Event()
+            worker: Any = context.Process(target=_produce, args=(*args, messages, stop), daemon=True)
+        else:
+            messages = queue.Queue(self.max_pending)
+            stop = threading.Event()
+            worker = threading.Thread(target=_produce, args=(*args, messages, stop), daemon=True)
+        worker.start()
+        validate = self.stats.validate
+        try:
+            while True:
+                started = time.perf_counter()
+                kind, payload = self._receive(messages, worker)
+                validate.waiting += time.perf_counter() - started
+                if kind == "block":
+                    yield from self._validate(payload)
+                elif kind == "end":
+                    self.stats.read, self.stats.decompress = payload
+                    return
+                else:
+                    raise payload
+        finally:
+            # Stopping early (an error, or the caller closing the generator) must not leave the producer blocked.
+            # A process only exits once what it queued is consumed, so the queue is drained meanwhile.
+            stop.set()
+            while worker.is_alive():
+                try:
+                    messages.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    pass
+            worker.join()
+
+    def __iter__(self) -> Iterator[M]:
+        started = time.perf_counter()
+        try:
+            yield from self._inline() if self.mode == "inline" else self._pipelined()
+        finally:
+            self.stats.wall = time.perf_counter() - started
+
+
+def read_archive[M: BaseModel](path: str | os.PathLike[str], model_cls: type[M], **options: Any) -> Iterator[M]:
+    """Iterate an :class:`ArchiveReader`; its stats are lost, use the class to keep them."""
+    return iter(ArchiveReader(path, model_cls, **options))
@@ -0,0 +1,241 @@
+"""Micro-benchmark suite over the alias models, and a regression gate against a stored baseline.
+
+Every alias model is timed on ``model_validate``, ``model_validate_json``, ``model_dump(by_alias=True)`` and
+``model_dump_json(by_alias=True)``. Each case is run ``repeat`` times; results keep the median per-call time and its
+spread (median absolute deviation), and a case only counts as regressed when it is slower than the baseline by more
+than ``threshold`` *and* by more than the combined noise of both medians, their spread scaled down by the square root
+of their number of runs. Suspected regressions are re-measured once before being reported, to rule out a transient
+hiccup.
+
+Timings only compare on the same interpreter, GIL mode and library versions: the baseline records the environment it
+was measured in, and ``check`` warns about every difference with the current one (the target being CI's interpreter).
+Record baselines with more repeats than a check runs: on a noisy machine the spread does not narrow, but the noise of
+the median does.
+
+    python -m pydantic_notes.bench run --output benchmarks/baseline.json --repeat 21 --min-time 0.2
+    python -m pydantic_notes.bench check --baseline benchmarks/baseline.json --threshold 0.1
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import sysconfig
+import timeit
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import pydantic
+import pydantic_core
+from pydantic import BaseModel
+
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    func: Callable[[], object]
+
+
+@dataclass(frozen=True)
+class Measurement:
+    median: float
+    spread: float
+    runs: list[float]
+
+    @classmethod
+    def from_runs(cls, runs: Sequence[float]) -> "Measurement":
+        median = statistics.median(runs)
+        return cls(median=median, spread=statistics.median(abs(run - median) for run in runs), runs=list(runs))
+
+    @property
+    def error(self) -> float:
+        """The noise of the median: the spread of the runs, scaled down by the square root of their number."""
+        return self.spread / math.sqrt(len(self.runs))
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+    noise: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def measure(func: Callable[[], object], *, repeat: int = 7, min_time: float = 0.05) -> Measurement:
+    """Per-call seconds of ``func`` over ``repeat`` runs, each looping for at least ``min_time`` seconds."""
+    timer = timeit.Timer(func)
+    number = 1
+    while (elapsed := timer.timeit(number)) < min_time:
+        number = max(number * 2, int(number * min_time / elapsed) if elapsed else number * 10)
+    return Measurement.from_runs([elapsed / number for elapsed in timer.repeat(repeat, number)])
+
+
+def model_cases(name: str, model_cls: type[BaseModel], payload: Mapping[str, Any]) -> list[Case]:
+    raw = json.dumps(payload)
+    instance = model_cls.model_validate(payload)
+    return [
+        Case(f"{name}/model_validate", lambda: model_cls.model_validate(payload)),
+        Case(f"{name}/model_validate_json", lambda: model_cls.model_validate_json(raw)),
+        Case(f"{name}/model_dump", lambda: instance.model_dump(by_alias=True)),
+        Case(f"{name}/model_dump_json", lambda: instance.model_dump_json(by_alias=True)),
+    ]
+
+
+def suite() -> list[Case]:
+    return [
+        case for name, model_cls in ALIAS_MODELS.items() for case in model_cases(name, model_cls, SAMPLE_PAYLOADS[name])
+    ]
+
+
+def run_suite(cases: Sequence[Case], *, repeat: int = 7, min_time: float = 0.05) -> dict[str, Measurement]:
+    return {case.name: measure(case.func, repeat=repeat, min_time=min_time) for case in cases}
+
+
+def gil_label() -> str:
+    """``"gil"``, ``"free-threaded"``, or ``"free-threaded (gil re-enabled)"`` when a free-threaded build runs with the
+    GIL turned back on (``PYTHON_GIL=1``, or an extension module that does not declare free-threading support)."""
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return "gil"
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: False)
+    return "free-threaded (gil re-enabled)" if is_gil_enabled() else "free-threaded"
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "gil": gil_label(),
+        "pydantic": pydantic.VERSION,
+        "pydantic_core": pydantic_core.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+# Environment keys a baseline must share with the current run for timings to compare.
+COMPARED_ENVIRONMENT = ("python", "implementation", "gil", "pydantic", "pydantic_core", "machine")
+
+
+def save_results(path: str | os.PathLike[str], results: Mapping[str, Measurement]) -> None:
+    document = {"environment": environment(), "results": {name: asdict(m) for name, m in sorted(results.items())}}
+    Path(path).write_text(json.dumps(document, indent=2) + "\n")
+
+
+def load_environment(path: str | os.PathLike[str]) -> dict[str, str]:
+    return json.loads(Path(path).read_text()).get("environment", {})
+
+
+def environment_differences(recorded: Mapping[str, str], current: Mapping[str, str]) -> list[str]:
+    """``key: recorded != current`` for every compared key that differs (the platform string, which carries the
+    kernel version, is not compared)."""
+    return [
+        f"{key}: {recorded.get(key, 'not recorded')} != {current[key]}"
+        for key in COMPARED_ENVIRONMENT
+        if recorded.get(key) != current[key]
+    ]
+
+
+def load_results(path: str | os.PathLike[str]) -> dict[str, Measurement]:
+    document = json.loads(Path(path).read_text())
+    return {name: Measurement(**fields) for name, fields in document["results"].items()}
+
+
+def compare(
+    baseline: Mapping[str, Measurement],
+    current: Mapping[str, Measurement],
+    *,
+    threshold: float = 0.10,
+    noise_factor: float = 3.0,
+) -> list[Comparison]:
+    comparisons = []
+    for name in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[name], current[name]
+        noise = noise_factor * (before.error + after.error)
+        delta = after.median - before.median
+        regressed = delta > threshold * before.median and delta > noise
+        comparisons.append(Comparison(name, before.median, after.median, noise, regressed))
+    return comparisons
+
+
+def format_comparisons(comparisons: Sequence[Comparison]) -> str:
+    width = max((len(c.name) for c in comparisons), default=4)
+    lines = [f"{'case':<{width}}  {'baseline':>10}  {'current':>10}  {'ratio':>6}"]
+    lines += [
+        f"{c.name:<{width}}  {c.baseline * 1e6:>8.3f}us  {c.current * 1e6:>8.3f}us  {c.ratio:>6.2f}"
+        + ("  REGRESSED" if c.regressed else "")
+        for c in comparisons
+    ]
+    return "\n".join(lines)
+
+
+def check(
+    baseline: Mapping[str, Measurement],
+    cases: Sequence[Case],
+    *,
+    threshold: float = 0.10,
+    repeat: int = 7,
+    min_time: float = 0.05,
+) -> list[Comparison]:
+    cases = [case for case in cases if case.name in baseline]
+    current = run_suite(cases, repeat=repeat, min_time=min_time)
+    comparisons = compare(baseline, current, threshold=threshold)
+    suspects = [case for case in cases if any(c.regressed and c.name == case.name for c in comparisons)]
+    if suspects:
+        current |= run_suite(suspects, repeat=repeat, min_time=min_time)
+        comparisons = compare(baseline, current, threshold=threshold)
+    return comparisons
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pydantic_notes.bench", description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name in ("run", "check"):
+        sub = subparsers.add_parser(name)
+        sub.add_argument("--repeat", type=int, default=7)
+        sub.add_argument("--min-time", type=float, default=0.05, help="seconds per run")
+        sub.add_argument("--filter", default="", help="only run cases whose name contains this string")
+    subparsers.choices["run"].add_argument("--output", type=Path, help="write results as JSON (e.g. a new baseline)")
+    check_parser = subparsers.choices["check"]
+    check_parser.add_argument("--baseline", type=Path, default=Path("benchmarks/baseline.json"))
+    check_parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown tolerated")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in suite() if args.filter in case.name]
+    if args.command == "run":
+        results = run_suite(cases, repeat=args.repeat, min_time=args.min_time)
+        for name, measurement in results.items():
+            print(f"{name}: {measurement.median * 1e6:.3f}us +/- {measurement.spread * 1e6:.3f}us")
+        if args.output is not None:
+            save_results(args.output, results)
+        return 0
+
+    baseline = load_results(args.baseline)
+    differences = environment_differences(load_environment(args.baseline), environment())
+    if differences:
+        print(f"Baseline recorded in another environment ({'; '.join(differences)})", file=sys.stderr)
+    missing = sorted(case.name for case in cases if case.name not in baseline)
+    if missing:
+        print(f"Not in baseline (skipped): {', '.join(missing)}", file=sys.stderr)
+    comparisons = check(baseline, cases, threshold=args.threshold, repeat=args.repeat, min_time=args.min_time)
+    print(format_comparisons(comparisons))
+    regressions = [c.name for c in comparisons if c.regressed]
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed beyond {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,184 @@
+"""Content-addressed cache in front of ``model_validate_json``.
+
+Retried or fanned-out requests validate byte-identical documents over and over. :class:`ValidationCache` keys every
+document on a BLAKE2b digest of its bytes together with the model class (and so its config, which is fixed once the
+class is built) and the ``strict`` flag, and remembers the outcome:
+
+- valid documents map to the validated instance. Frozen models get the cached instance back, and are taken to be
+  immutable throughout: their field values must not be mutated in place either (use ``tuple`` or ``frozenset``
+  fields). Other models get a copy whose lists, dicts and nested (non-frozen) models are copied in depth, so that
+  mutating a result, or a list or nested model it holds, cannot leak into later hits; strings, numbers, dates and
+  other immutable values are shared rather than copied;
+- invalid documents map to their error list (e.g. the ``missing`` error raised when a payload uses the wrong alias),
+  and every hit raises a fresh ``ValidationError`` rebuilt from it.
+
+Memory is bounded by an entry count and by the summed size of the cached documents, evicting least recently used
+entries first.
+
+A hit costs a digest and a copy, less than validation from about 20 fields up (see ``benchmarks/bench_cache.py``):
+documents of a handful of fields are faster to validate again.
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from types import NoneType
+from typing import Any, get_args
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticCustomError
+from pydantic_core.core_schema import ErrorType
+
+_CORE_ERROR_TYPES = frozenset(get_args(ErrorType))
+
+# Types of values that cannot be mutated in place, shared between a cached instance and its copies.
+_ATOMIC = frozenset({str, int, float, bool, NoneType, bytes, Decimal, date, datetime, time, timedelta, UUID})
+
+type _Key = tuple[type[BaseModel], bool | None, bytes]
+
+# Rough per-entry cost on top of the document itself: key tuple, digest, OrderedDict node, instance.
+ENTRY_OVERHEAD = 256
+
+
+@dataclass(frozen=True)
+class _Failure:
+    title: str
+    errors: list[dict[str, Any]]
+
+    def error(self) -> ValidationError:
+        return ValidationError.from_exception_data(self.title, self.errors)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    negative_hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.negative_hits + self.misses
+        return (self.hits + self.negative_hits) / lookups if lookups else 0.0
+
+
+def _replayable(errors: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Errors raised as ``PydanticCustomError`` carry a type ``from_exception_data`` does not know; re-wrap them."""
+    return [
+        error
+        if error["type"] in _CORE_ERROR_TYPES
+        else {**error, "type": PydanticCustomError(error["type"], error["msg"], error.get("ctx"))}
+        for error in errors
+    ]
+
+
+def _copy_value(value: Any) -> Any:
+    value_type = type(value)
+    if value_type in _ATOMIC:
+        return value
+    if value_type is list:
+        return [_copy_value(item) for item in value]
+    if value_type is dict:
+        return _copy_values(value)
+    if isinstance(value, BaseModel):
+        return value if value.model_config.get("frozen") else _copy(value)
+    return copy.deepcopy(value)
+
+
+def _copy_values(values: dict[Any, Any]) -> dict[Any, Any]:
+    return {key: value if type(value) in _ATOMIC else _copy_value(value) for key, value in values.items()}
+
+
+def _copy[M: BaseModel](instance: M) -> M:
+    """``model_copy(deep=True)``, sharing the values that cannot be mutated in place (frozen models included).
+
+    The copy is built the way ``model_copy`` builds it, minus its generic ``__copy__`` / ``__deepcopy__`` machinery.
+    """
+    copied = instance.__class__.__new__(instance.__class__)
+    extra = instance.__pydantic_extra__
+    private = instance.__pydantic_private__
+    object.__setattr__(copied, "__dict__", _copy_values(instance.__dict__))
+    object.__setattr__(copied, "__pydantic_fields_set__", set(instance.__pydantic_fields_set__))
+    object.__setattr__(copied, "__pydantic_extra__", None if extra is None else _copy_values(extra))
+    object.__setattr__(copied, "__pydantic_private__", None if private is None else _copy_values(private))
+    return copied
+
+
+class ValidationCache:
+    def __init__(self, *, max_entries: int = 10_000, max_size: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries: OrderedDict[_Key, tuple[BaseModel | _Failure, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = self._negative_hits = self._misses = self._evictions = 0
+
+    def validate_json[M: BaseModel](
+        self, model_cls: type[M], json_data: str | bytes | bytearray, *, strict: bool | None = None
+    ) -> M:
+        raw = json_data.encode() if isinstance(json_data, str) else bytes(json_data)
+        key = (model_cls, strict, hashlib.blake2b(raw, digest_size=16).digest())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if isinstance(entry[0], _Failure):
+                    self._negative_hits += 1
+                else:
+                    self._hits += 1
+            else:
+                self._misses += 1
+        if entry is not None:
+            result = entry[0]
+            if isinstance(result, _Failure):
+                raise result.error()
+            return result if model_cls.model_config.get("frozen") else _copy(result)
+
+        try:
+            instance = model_cls.model_validate_json(raw, strict=strict)
+        except ValidationError as exc:
+            self._store(key, _Failure(exc.title, _replayable(exc.errors(include_url=False))), len(raw))
+            raise
+        self._store(key, instance, len(raw))
+        return instance if model_cls.model_config.get("frozen") else _copy(instance)
+
+    def _store(self, key: _Key, result: BaseModel | _Failure, size: int) -> None:
+        size += ENTRY_OVERHEAD
+        if size > self.max_size:
+            return
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._size -= previous[1]
+            self._entries[key] = (result, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                negative_hits=self._negative_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+            )
@@ -0,0 +1,282 @@
+"""Compact binary codec for alias models, keyed by field index instead of alias strings.
+
+A stream starts with a schema header, written once::
+
+    b"PNC1" | u32 length | JSON: model name and, per field index, the field name, its aliases and its kind
+
+followed by records::
+
+    u32 length | fields-set bitmask | per field, in index order: u8 tag | value
+
+Values of ``str``, ``int``, ``float`` and ``bool`` fields are ``struct``-packed (``str`` as u32 length + UTF-8);
+anything else, or an ``int`` that does not fit 64 bits, is stored as the field's own JSON serialization (u32 length +
+bytes) and restored with the field's ``TypeAdapter`` in JSON mode. Keys are never repeated per record.
+
+Decoding yields compact records (tuples of field values in index order) or models, either trusted (constructed without
+validation, which is what the data was when it was encoded) or fully validated again from alias-keyed input. Extra
+values of ``extra="allow"`` models are not encoded. Everything streams to and from binary file objects.
+"""
+
+import io
+import json
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache
+from types import NoneType, UnionType
+from typing import IO, Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from pydantic_notes.aliases import input_paths, place
+
+MAGIC = b"PNC1"
+
+U32 = struct.Struct("<I")
+INT64 = struct.Struct("<q")
+FLOAT64 = struct.Struct("<d")
+
+TAG_NONE = 0
+TAG_STR = 1
+TAG_INT = 2
+TAG_FLOAT = 3
+TAG_TRUE = 4
+TAG_FALSE = 5
+TAG_JSON = 6
+
+_KINDS = {str: "str", int: "int", float: "float", bool: "bool"}
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+
+class CodecError(Exception):
+    pass
+
+
+class NotACodecStreamError(CodecError):
+    def __init__(self, magic: bytes):
+        super().__init__(f"Stream starts with {magic!r}, expected {MAGIC!r}")
+
+
+class HeaderMismatchError(CodecError):
+    def __init__(self, expected: list[str], found: list[str]):
+        super().__init__(f"Stream holds fields {found}, model declares {expected}")
+
+
+class TruncatedStreamError(CodecError):
+    def __init__(self):
+        super().__init__("Stream ends in the middle of a record")
+
+
+@cache
+def field_adapter(model_cls: type[BaseModel], name: str) -> TypeAdapter:
+    return TypeAdapter(model_cls.model_fields[name].annotation)
+
+
+def union_members(annotation: Any) -> tuple[Any, ...]:
+    """The members of a ``Union`` / ``X | Y`` annotation; ``()`` for anything else."""
+    return get_args(annotation) if get_origin(annotation) in (Union, UnionType) else ()
+
+
+def optional_member(annotation: Any) -> Any:
+    """``X`` for ``X | None`` (``Optional[X]``); ``annotation`` itself for anything else."""
+    members = [arg for arg in union_members(annotation) if arg is not NoneType]
+    return members[0] if len(members) == 1 else annotation
+
+
+def field_kind(annotation: Any) -> str:
+    """``str``, ``int``, ``float`` or ``bool`` for these types, optional or not; ``json`` for anything else."""
+    return _KINDS.get(optional_member(annotation), "json")
+
+
+def schema_header(model_cls: type[BaseModel]) -> dict[str, Any]:
+    fields = []
+    for name, field in model_cls.model_fields.items():
+        validation_alias = field.validation_alias
+        fields.append(
+            {
+                "name": name,
+                "alias": field.alias,
+                "validation_alias": validation_alias
+                if isinstance(validation_alias, str | None)
+                else repr(validation_alias),
+                "serialization_alias": field.serialization_alias,
+                "kind": field_kind(field.annotation),
+            }
+        )
+    return {"model": f"{model_cls.__module__}.{model_cls.__qualname__}", "fields": fields}
+
+
+def _encoder(model_cls: type[BaseModel], name: str, kind: str) -> Callable[[Any, list[bytes]], None]:
+    serializer = field_adapter(model_cls, name).serializer
+    none, str_, int_, float_, true, false, json_ = (bytes((tag,)) for tag in range(TAG_NONE, TAG_JSON + 1))
+
+    def encode_json(value: Any, out: list[bytes]) -> None:
+        raw = serializer.to_json(value)
+        out.append(json_)
+        out.append(U32.pack(len(raw)))
+        out.append(raw)
+
+    def encode(value: Any, out: list[bytes]) -> None:
+        # Values are checked by exact type: a subclass (e.g. an ``IntEnum``) round-trips through JSON.
+        value_type = type(value)
+        if value is None:
+            out.append(none)
+        elif value_type is str and kind == "str":
+            raw = value.encode()
+            out.append(str_)
+            out.append(U32.pack(len(raw)))
+            out.append(raw)
+        elif value_type is bool and kind == "bool":
+            out.append(true if value else false)
+        elif value_type is int and kind == "int" and INT64_MIN <= value <= INT64_MAX:
+            out.append(int_)
+            out.append(INT64.pack(value))
+        elif value_type is float and kind == "float":
+            out.append(float_)
+            out.append(FLOAT64.pack(value))
+        else:
+            encode_json(value, out)
+
+    return encode
+
+
+class Encoder:
+    """Write a schema header to ``fp``, then one record per :meth:`write`."""
+
+    def __init__(self, model_cls: type[BaseModel], fp: IO[bytes]):
+        self.model_cls = model_cls
+        self.fp = fp
+        self.header = schema_header(model_cls)
+        self._names = [field["name"] for field in self.header["fields"]]
+        self._encoders = [_encoder(model_cls, field["name"], field["kind"]) for field in self.header["fields"]]
+        self._mask_size = (len(self._names) + 7) // 8
+        raw = json.dumps(self.header).encode()
+        fp.write(MAGIC + U32.pack(len(raw)) + raw)
+
+    def write(self, instance: BaseModel) -> None:
+        values = instance.__dict__
+        fields_set = instance.__pydantic_fields_set__
+        mask = 0
+        for index, name in enumerate(self._names):
+            if name in fields_set:
+                mask |= 1 << index
+        out = [mask.to_bytes(self._mask_size, "little")]
+        for name, encode in zip(self._names, self._encoders, strict=True):
+            encode(values[name], out)
+        body = b"".join(out)
+        self.fp.write(U32.pack(len(body)) + body)
+
+    def write_many(self, instances: Iterable[BaseModel]) -> int:
+        written = 0
+        for instance in instances:
+            self.write(instance)
+            written += 1
+        return written
+
+
+class Decoder:
+    """Read the schema header from ``fp`` and iterate over its records."""
+
+    def __init__(self, model_cls: type[BaseModel], fp: IO[bytes]):
+        if (magic := fp.read(len(MAGIC))) != MAGIC:
+            raise NotACodecStreamError(magic)
+        (size,) = U32.unpack(self._read(fp, U32.size))
+        self.header = json.loads(self._read(fp, size))
+        names = [field["name"] for field in self.header["fields"]]
+        if names != list(model_cls.model_fields):
+            raise HeaderMismatchError(list(model_cls.model_fields), names)
+        self.model_cls = model_cls
+        self.fp = fp
+        self._names = names
+        self._validators = [field_adapter(model_cls, name).validator for name in names]
+        self._mask_size = (len(names) + 7) // 8
+
+    @staticmethod
+    def _read(fp: IO[bytes], size: int) -> bytes:
+        data = fp.read(size)
+        if len(data) != size:
+            raise TruncatedStreamError
+        return data
+
+    def _decode(self, body: bytes) -> tuple[int, tuple[Any, ...]]:
+        mask = int.from_bytes(body[: self._mask_size], "little")
+        offset = self._mask_size
+        values = []
+        for validator in self._validators:
+            tag = body[offset]
+            offset += 1
+            if tag == TAG_NONE:
+                values.append(None)
+            elif tag == TAG_STR or tag == TAG_JSON:
+                (size,) = U32.unpack_from(body, offset)
+                offset += U32.size
+                raw = body[offset : offset + size]
+                offset += size
+                values.append(raw.decode() if tag == TAG_STR else validator.validate_json(raw))
+            elif tag == TAG_INT:
+                values.append(INT64.unpack_from(body, offset)[0])
+                offset += INT64.size
+            elif tag == TAG_FLOAT:
+                values.append(FLOAT64.unpack_from(body, offset)[0])
+                offset += FLOAT64.size
+            elif tag == TAG_TRUE or tag == TAG_FALSE:
+                values.append(tag == TAG_TRUE)
+            else:
+                raise CodecError(tag)
+        return mask, tuple(values)
+
+    def _bodies(self) -> Iterator[bytes]:
+        while prefix := self.fp.read(U32.size):
+            if len(prefix) != U32.size:
+                raise TruncatedStreamError
+            yield self._read(self.fp, U32.unpack(prefix)[0])
+
+    def records(self) -> Iterator[tuple[Any, ...]]:
+        """Field values in index order, without building models."""
+        for body in self._bodies():
+            yield self._decode(body)[1]
+
+    def models(self, *, validate: bool = False) -> Iterator[BaseModel]:
+        """Models built with ``model_construct`` (trusted), or validated again from alias-keyed input."""
+        model_cls = self.model_cls
+        names = self._names
+        if validate:
+            paths = input_paths(model_cls)
+            for body in self._bodies():
+                mask, values = self._decode(body)
+                data: dict[str, Any] = {}
+                # Only fields that were set are placed, so that the others take their defaults again.
+                for index, (name, value) in enumerate(zip(names, values, strict=True)):
+                    if mask >> index & 1:
+                        place(data, paths[name][0], value)
+                yield model_cls.model_validate(data)
+            return
+        for body in self._bodies():
+            mask, values = self._decode(body)
+            fields_set = {name for index, name in enumerate(names) if mask >> index & 1}
+            yield construct(model_cls, dict(zip(names, values, strict=True)), fields_set)
+
+
+def construct[M: BaseModel](model_cls: type[M], values: dict[str, Any], fields_set: set[str]) -> M:
+    """``model_construct`` for a complete set of field values, keyed by field name.
+
+    With every value at hand there are no defaults to fill in, so models without private attributes or
+    ``model_post_init`` are built directly, the way ``model_construct`` ends up building them.
+    """
+    if model_cls.__private_attributes__ or model_cls.__pydantic_post_init__ is not None:
+        return model_cls.model_construct(fields_set, **values)
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", {} if model_cls.model_config.get("extra") == "allow" else None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def dumps(model_cls: type[BaseModel], instances: Iterable[BaseModel]) -> bytes:
+    fp = io.BytesIO()
+    Encoder(model_cls, fp).write_many(instances)
+    return fp.getvalue()
+
+
+def loads(model_cls: type[BaseModel], data: bytes, *, validate: bool = False) -> list[BaseModel]:
+    return list(Decoder(model_cls, io.BytesIO(data)).models(validate=validate))
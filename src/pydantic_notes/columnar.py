@@ -0,0 +1,275 @@
+"""Validated batches handed between processes through shared memory, column by column.
+
+Returning validated models from a worker pickles every instance, and unpickling rebuilds them all in the parent,
+whether or not the parent reads them. :func:`pack` lays a batch out in one ``multiprocessing.shared_memory`` block
+instead, one column per field, keyed by field name:
+
+- ``int``, ``float`` and ``bool`` fields as fixed-width arrays (``int64``, ``float64``, ``uint8``);
+- ``str`` fields as a ``uint64`` offsets array into the column's UTF-8 heap;
+- any other field, and any column holding values that do not fit these (e.g. an ``int`` beyond 64 bits, an
+  ``IntEnum``), as offsets into a heap of each value's JSON serialization, restored with the field's ``TypeAdapter``;
+- a ``uint8`` validity array for columns holding ``None``, and a fields-set bitmask per record.
+
+Only a small picklable :class:`BatchHandle` (block name and layout) travels back. In the parent, :class:`ColumnarBatch`
+maps the block and serves zero-copy ``memoryview``s of the fixed-width arrays, lazy views of the text and JSON
+columns, and rebuilds compact records (tuples in field order) or models (constructed without validation, as they were
+packed) only when asked. The parent owns the block: leaving ``with ColumnarBatch(handle)`` (or calling :meth:`unlink`)
+releases the views and frees it.
+"""
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, overload
+
+from pydantic import BaseModel
+
+from pydantic_notes.codec import INT64_MAX, INT64_MIN, construct, field_adapter, field_kind
+
+_FORMATS = {"int": "q", "float": "d", "bool": "B", "str": "Q", "json": "Q"}
+_TYPES = {"int": int, "float": float, "bool": bool, "str": str}
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+    kind: str
+    offset: int
+    heap_offset: int | None = None
+    heap_size: int = 0
+    validity_offset: int | None = None
+
+
+@dataclass(frozen=True)
+class BatchHandle:
+    model_cls: type[BaseModel]
+    shm_name: str
+    count: int
+    columns: tuple[Column, ...]
+    fields_set_offset: int
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _column_kind(model_cls: type[BaseModel], name: str, values: Sequence[Any]) -> str:
+    kind = field_kind(model_cls.model_fields[name].annotation)
+    if kind == "json":
+        return kind
+    expected = _TYPES[kind]
+    for value in values:
+        if value is None:
+            continue
+        if type(value) is not expected or (kind == "int" and not INT64_MIN <= value <= INT64_MAX):
+            return "json"
+    return kind
+
+
+def _create(size: int) -> SharedMemory:
+    # The parent unlinks the block: the creating worker must not have it unlinked when it exits.
+    if sys.version_info >= (3, 13):
+        return SharedMemory(create=True, size=max(size, 1), track=False)
+    shm = SharedMemory(create=True, size=max(size, 1))
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def pack(model_cls: type[BaseModel], instances: Sequence[BaseModel]) -> BatchHandle:
+    """Copy ``instances`` into a new shared memory block; the caller's mapping is closed, the block is not freed."""
+    count = len(instances)
+    names = list(model_cls.model_fields)
+    mask_size = (len(names) + 7) // 8
+    parts: list[tuple[int, bytes]] = []
+    columns = []
+    offset = 0
+    for name in names:
+        values = [instance.__dict__[name] for instance in instances]
+        kind = _column_kind(model_cls, name, values)
+        validity_offset = None
+        if any(value is None for value in values):
+            validity = bytes(value is not None for value in values)
+            validity_offset, offset = offset, _align(offset + count)
+            parts.append((validity_offset, validity))
+        heap_offset = None
+        heap = b""
+        if kind in ("str", "json"):
+            if kind == "str":
+                encoded = [b"" if value is None else value.encode() for value in values]
+            else:
+                serializer = field_adapter(model_cls, name).serializer
+                encoded = [b"" if value is None else serializer.to_json(value) for value in values]
+            bounds = array("Q", [0])
+            position = 0
+            for item in encoded:
+                position += len(item)
+                bounds.append(position)
+            data = bounds.tobytes()
+            heap = b"".join(encoded)
+        else:
+            default = 0.0 if kind == "float" else 0
+            data = array(_FORMATS[kind], [default if value is None else value for value in values]).tobytes()
+        column_offset, offset = offset, _align(offset + len(data))
+        parts.append((column_offset, data))
+        if kind in ("str", "json"):
+            heap_offset, offset = offset, _align(offset + len(heap))
+            parts.append((heap_offset, heap))
+        columns.append(Column(name, kind, column_offset, heap_offset, len(heap), validity_offset))
+    fields_set = b"".join(
+        sum(1 << index for index, name in enumerate(names) if name in instance.__pydantic_fields_set__).to_bytes(
+            mask_size, "little"
+        )
+        for instance in instances
+    )
+    fields_set_offset, offset = offset, offset + len(fields_set)
+    parts.append((fields_set_offset, fields_set))
+
+    shm = _create(offset)
+    try:
+        for start, data in parts:
+            shm.buf[start : start + len(data)] = data
+        return BatchHandle(model_cls, shm.name, count, tuple(columns), fields_set_offset)
+    finally:
+        shm.close()
+
+
+class _HeapColumn(Sequence[Any]):
+    """Values of a ``str`` or JSON column, decoded on access."""
+
+    def __init__(self, bounds: memoryview, heap: memoryview, validity: memoryview | None, decode: Any):
+        self._bounds = bounds
+        self._heap = heap
+        self._validity = validity
+        self._decode = decode
+
+    def __len__(self) -> int:
+        return len(self._bounds) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        index %= len(self)
+        if self._validity is not None and not self._validity[index]:
+            return None
+        return self._decode(self._heap[self._bounds[index] : self._bounds[index + 1]])
+
+
+class ColumnarBatch:
+    def __init__(self, handle: BatchHandle):
+        self.handle = handle
+        self.model_cls = handle.model_cls
+        self._shm = SharedMemory(name=handle.shm_name)
+        # One view per array, shared by every caller: ``(start, size, format)`` -> (byte view, cast view).
+        self._views: dict[tuple[int, int, str], tuple[memoryview, memoryview]] = {}
+        self._columns = {column.name: column for column in handle.columns}
+
+    def __enter__(self) -> "ColumnarBatch":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.unlink()
+
+    def __len__(self) -> int:
+        return self.handle.count
+
+    def _view(self, start: int, size: int, fmt: str) -> memoryview:
+        key = (start, size, fmt)
+        views = self._views.get(key)
+        if views is None:
+            view = self._shm.buf[start : start + size]
+            views = self._views[key] = (view, view.cast(fmt))
+        return views[1]
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Zero-copy array of a fixed-width column, lazy sequence of a text or JSON column.
+
+        Fixed-width arrays hold ``0`` where the column's :meth:`validity` is ``0``.
+        """
+        column = self._columns[name]
+        count = self.handle.count
+        if column.kind not in ("str", "json"):
+            return self._view(column.offset, count * array(_FORMATS[column.kind]).itemsize, _FORMATS[column.kind])
+        bounds = self._view(column.offset, (count + 1) * 8, "Q")
+        heap = self._view(column.heap_offset or 0, column.heap_size, "B")
+        if column.kind == "str":
+            decode = lambda raw: str(raw, "utf-8")  # noqa: E731
+        else:
+            validate_json = field_adapter(self.model_cls, name).validator.validate_json
+            decode = lambda raw: validate_json(bytes(raw))  # noqa: E731
+        return _HeapColumn(bounds, heap, self.validity(name), decode)
+
+    def validity(self, name: str) -> memoryview | None:
+        """``uint8`` array, ``0`` where the column holds ``None``; ``None`` when it holds none."""
+        column = self._columns[name]
+        if column.validity_offset is None:
+            return None
+        return self._view(column.validity_offset, self.handle.count, "B")
+
+    def _decoded_columns(self) -> list[Sequence[Any]]:
+        columns = []
+        for name, column in self._columns.items():
+            values = self.column(name)
+            if column.kind in ("str", "json"):
+                columns.append(values)
+                continue
+            decoded: list[Any] = values.tolist()  # type: ignore[attr-defined]
+            if column.kind == "bool":
+                decoded = [bool(value) for value in decoded]
+            validity = self.validity(name)
+            if validity is not None:
+                decoded = [value if valid else None for value, valid in zip(decoded, validity, strict=True)]
+            columns.append(decoded)
+        return columns
+
+    def records(self) -> Iterator[tuple[Any, ...]]:
+        """Field values in field order, one tuple per record."""
+        columns = self._decoded_columns()
+        for index in range(self.handle.count):
+            yield tuple(column[index] for column in columns)
+
+    def models(self) -> Iterator[BaseModel]:
+        names = list(self._columns)
+        mask_size = (len(names) + 7) // 8
+        masks = self._view(self.handle.fields_set_offset, mask_size * len(self), "B")
+        for index, values in enumerate(self.records()):
+            mask = int.from_bytes(masks[index * mask_size : (index + 1) * mask_size], "little")
+            fields_set = {name for bit, name in enumerate(names) if mask >> bit & 1}
+            yield construct(self.model_cls, dict(zip(names, values, strict=True)), fields_set)
+
+    def close(self) -> None:
+        """Release every view handed out, then unmap the block."""
+        for view, cast in self._views.values():
+            cast.release()
+            view.release()
+        self._views.clear()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self.close()
+        self._shm.unlink()
+
+
+def unpack(handle: BatchHandle) -> list[BaseModel]:
+    """Every model of the batch, freeing its block."""
+    with ColumnarBatch(handle) as batch:
+        return list(batch.models())
+
+
+def validate_to_shared(model_cls: type[BaseModel], payloads: Iterable[str | bytes | dict[str, Any]]) -> BatchHandle:
+    """Validate JSON documents or dicts and :func:`pack` the models; meant to run in worker processes."""
+    instances = [
+        model_cls.model_validate(payload) if isinstance(payload, dict) else model_cls.model_validate_json(payload)
+        for payload in payloads
+    ]
+    return pack(model_cls, instances)
@@ -0,0 +1,138 @@
+"""Route heterogeneous records to the model they are meant for, by the keys they carry.
+
+Mixed streams often tell their record types apart only by their keys (``firstName`` vs ``f_name_pa`` vs ``names``),
+and trying model after model until one validates pays for a failed validation per wrong guess. A :class:`Dispatcher`
+precomputes each model's :class:`Signature` from its input paths (see :mod:`pydantic_notes.aliases`):
+
+- *required*: per required field, the top-level keys any one of which can supply it (an alias, each ``AliasChoices``
+  choice, the head of an ``AliasPath``, the field name under ``populate_by_name``);
+- *accepted*: every top-level key the model reads, and whether it forbids others (``extra="forbid"``).
+
+A record matches a model when each required field has one of its keys present (and, for ``extra="forbid"`` models,
+when it carries no other key); among matches, the model accepting most of the record's keys wins, ties going to the
+model listed first. The decision depends on the record's key set only, so it is memoized per key set: after the first
+record of a shape, routing is one ``frozenset`` build and one dict lookup. Values are not looked at; a routed record
+can still fail validation.
+
+Building a dispatcher checks, for each model, the minimal key sets that satisfy it: if one of them routes to another
+model, or ties with one, records of the first could be misrouted, and :class:`OverlappingSignaturesError` lists every
+such pair (pass ``allow_overlaps=True`` to keep them, as :attr:`Dispatcher.overlaps`, and let ties go to the first).
+"""
+
+import itertools
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+from pydantic_notes.aliases import input_paths
+
+# Key sets remembered at most; records with ever-new keys are still routed, just no longer memoized.
+MAX_SHAPES = 4096
+
+# Bound on the minimal key sets checked per model at build time (``AliasChoices`` multiply them).
+MAX_MINIMAL_SHAPES = 256
+
+
+class DispatchError(Exception):
+    pass
+
+
+class OverlappingSignaturesError(DispatchError):
+    def __init__(self, overlaps: list[tuple[type[BaseModel], type[BaseModel], frozenset[str]]]):
+        lines = [f"{a.__name__} records {sorted(keys)} route to {b.__name__}" for a, b, keys in overlaps]
+        super().__init__("; ".join(lines))
+        self.overlaps = overlaps
+
+
+class NoRouteError(DispatchError):
+    def __init__(self, keys: Iterable[str]):
+        super().__init__(f"No model matches keys {sorted(keys, key=str)}")
+
+
+@dataclass(frozen=True)
+class Signature:
+    model_cls: type[BaseModel]
+    required: tuple[frozenset[str], ...]
+    accepted: frozenset[str]
+    forbids_extra: bool
+
+    @classmethod
+    def of(cls, model_cls: type[BaseModel]) -> "Signature":
+        paths = input_paths(model_cls)
+        required = []
+        for name, field in model_cls.model_fields.items():
+            if field.is_required():
+                required.append(frozenset(str(path[0]) for path in paths[name]))
+        return cls(
+            model_cls=model_cls,
+            required=tuple(required),
+            accepted=frozenset(str(path[0]) for field_paths in paths.values() for path in field_paths),
+            forbids_extra=model_cls.model_config.get("extra") == "forbid",
+        )
+
+    def score(self, keys: frozenset[str]) -> int | None:
+        """How many of ``keys`` the model reads, ``None`` if ``keys`` cannot make a valid record for it."""
+        if self.forbids_extra and not keys <= self.accepted:
+            return None
+        if not all(choices & keys for choices in self.required):
+            return None
+        return len(keys & self.accepted)
+
+    def minimal_shapes(self) -> Iterable[frozenset[str]]:
+        """The smallest key sets satisfying every required field, one key per field."""
+        shapes = itertools.product(*(sorted(choices) for choices in self.required))
+        return (frozenset(shape) for shape in itertools.islice(shapes, MAX_MINIMAL_SHAPES))
+
+
+class Dispatcher:
+    def __init__(self, models: Iterable[type[BaseModel]], *, allow_overlaps: bool = False):
+        self.signatures = [Signature.of(model_cls) for model_cls in models]
+        self._routes: dict[frozenset[Any], type[BaseModel] | None] = {}
+        self.overlaps = self._find_overlaps()
+        if self.overlaps and not allow_overlaps:
+            raise OverlappingSignaturesError(self.overlaps)
+
+    def _find_overlaps(self) -> list[tuple[type[BaseModel], type[BaseModel], frozenset[str]]]:
+        overlaps = []
+        for signature in self.signatures:
+            for shape in signature.minimal_shapes():
+                own = signature.score(shape)
+                other = next(
+                    (
+                        candidate
+                        for candidate in self.signatures
+                        if candidate is not signature and (score := candidate.score(shape)) is not None and score >= own
+                    ),
+                    None,
+                )
+                if other is not None:
+                    overlaps.append((signature.model_cls, other.model_cls, shape))
+                    break
+        return overlaps
+
+    def _match(self, keys: frozenset[Any]) -> type[BaseModel] | None:
+        best, best_score = None, -1
+        for signature in self.signatures:
+            score = signature.score(keys)
+            if score is not None and score > best_score:
+                best, best_score = signature.model_cls, score
+        return best
+
+    def route(self, record: Mapping[str, Any]) -> type[BaseModel] | None:
+        keys = frozenset(record)
+        try:
+            return self._routes[keys]
+        except KeyError:
+            pass
+        model_cls = self._match(keys)
+        if len(self._routes) < MAX_SHAPES:
+            self._routes[keys] = model_cls
+        return model_cls
+
+    def validate(self, record: Mapping[str, Any]) -> BaseModel:
+        model_cls = self.route(record)
+        if model_cls is None:
+            raise NoRouteError(record)
+        return model_cls.model_validate(record)
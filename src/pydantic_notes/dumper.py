@@ -0,0 +1,134 @@
+"""JSON dumpers specialized for one ``(model, by_alias, include, exclude)`` shape.
+
+``model_dump_json(include=..., exclude=...)`` hands both masks to pydantic-core, which converts them into filters and
+consults them for every field, on every call. :func:`compile_dumper` resolves a top-level mask once instead: it copies
+the model's core schema, marks the fields the mask leaves out with ``serialization_exclude`` (computed fields are
+dropped from the copy), and returns a callable running the resulting serializer with no mask at all. Dumpers are
+cached per shape, keeping the ``MAX_DUMPERS`` most recently used (processes generating models would otherwise grow the
+cache for good), and their output is that of ``model_dump_json`` with the same arguments.
+
+Shapes a schema copy cannot express keep the generic path behind the same callable: masks reaching into nested
+values (``{"address": {"city"}}``), models with ``extra="allow"`` (whose extra keys the masks also filter), model
+serializers, and self-referencing models (whose schema the copy would change for nested instances too). Instances of
+other classes, subclasses included, are dumped by their own ``model_dump_json``.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Set
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import SchemaSerializer, core_schema
+
+from pydantic_notes.schema import model_fields_schema
+
+type Mask = Set[str] | Mapping[str, Any]
+type Dumper = Callable[[BaseModel], str]
+
+
+def _freeze(mask: Any) -> Any:
+    if isinstance(mask, Mapping):
+        return frozenset((key, _freeze(value)) for key, value in mask.items())
+    if isinstance(mask, Set):
+        return frozenset(mask)
+    return mask
+
+
+def _top_level(mask: Mask | None) -> frozenset[str] | None:
+    """The names a top-level mask selects, or ``None`` if it reaches into nested values."""
+    if isinstance(mask, Mapping):
+        if any(value is not True and value is not ... for value in mask.values()):
+            return None
+        return frozenset(mask)
+    return frozenset(mask)  # type: ignore[arg-type]
+
+
+def _fields_schema(schema: core_schema.CoreSchema) -> core_schema.ModelFieldsSchema | None:
+    """The ``model-fields`` schema of a model's (copied) top-level schema, unless serializing it takes more."""
+    if schema["type"] == "definitions":
+        # The model itself among the definitions is a self-referencing model.
+        schema = schema["schema"]
+    while schema["type"] != "model":
+        if schema["type"] == "definition-ref":
+            return None
+        schema = schema["schema"]  # type: ignore[typeddict-item]
+    if "serialization" in schema or schema.get("root_model"):
+        return None
+    return schema["schema"]  # type: ignore[return-value]
+
+
+def _specialized(model_cls: type[BaseModel], include: Mask | None, exclude: Mask | None) -> SchemaSerializer | None:
+    if model_cls.model_config.get("extra") == "allow":
+        return None
+    names = [*model_cls.model_fields, *model_cls.model_computed_fields]
+    kept = set(names)
+    if include is not None:
+        selected = _top_level(include)
+        if selected is None:
+            return None
+        kept &= selected
+    if exclude is not None:
+        selected = _top_level(exclude)
+        if selected is None:
+            return None
+        kept -= selected
+    schema = copy.deepcopy(model_cls.__pydantic_core_schema__)
+    fields_schema = _fields_schema(schema)
+    if fields_schema is None:
+        return None
+    for name, field in fields_schema["fields"].items():
+        if name not in kept:
+            field["serialization_exclude"] = True
+    fields_schema["computed_fields"] = [
+        computed for computed in fields_schema.get("computed_fields", []) if computed["property_name"] in kept
+    ]
+    _, _, config = model_fields_schema(model_cls)
+    return SchemaSerializer(schema, config)
+
+
+def _build(model_cls: type[BaseModel], by_alias: bool, include: Mask | None, exclude: Mask | None) -> Dumper:  # noqa: FBT001
+    def generic(instance: BaseModel) -> str:
+        return instance.model_dump_json(by_alias=by_alias, include=include, exclude=exclude)
+
+    serializer = _specialized(model_cls, include, exclude)
+    if serializer is None:
+        return generic
+    to_json = serializer.to_json
+
+    def dumper(instance: BaseModel) -> str:
+        if type(instance) is not model_cls:
+            return generic(instance)
+        return to_json(instance, by_alias=by_alias).decode()
+
+    return dumper
+
+
+MAX_DUMPERS = 1024
+
+_DUMPERS: OrderedDict[tuple[Any, ...], Dumper] = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def compile_dumper(
+    model_cls: type[BaseModel],
+    *,
+    by_alias: bool = False,
+    include: Mask | None = None,
+    exclude: Mask | None = None,
+) -> Dumper:
+    """A cached ``instance -> JSON`` callable, equivalent to ``instance.model_dump_json(by_alias=..., ...)``."""
+    key = (model_cls, by_alias, _freeze(include), _freeze(exclude))
+    with _LOCK:
+        dumper = _DUMPERS.get(key)
+        if dumper is not None:
+            _DUMPERS.move_to_end(key)
+            return dumper
+    # The dumper keeps its own copy of the masks: the caller's may change afterwards.
+    dumper = _build(model_cls, by_alias, copy.deepcopy(include), copy.deepcopy(exclude))
+    with _LOCK:
+        _DUMPERS[key] = dumper
+        while len(_DUMPERS) > MAX_DUMPERS:
+            _DUMPERS.popitem(last=False)
+    return dumper
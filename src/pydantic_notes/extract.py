@@ -0,0 +1,250 @@
+"""Extract the JSON a model reads out of a large document, skipping everything else.
+
+A model reading ``AliasPath("names", 0)`` and ``AliasPath("names", 1)`` out of a multi-megabyte document only needs a
+few bytes of it, yet ``model_validate_json`` parses the whole document first. An :class:`Extractor` compiles the
+model's input paths (see :mod:`pydantic_notes.aliases`: aliases, ``AliasChoices``, ``AliasPath``, field names under
+``populate_by_name``) into a trie, then walks the document once with a regex-driven tokenizer:
+
+- members and items the trie does not reference are skipped;
+- paths sharing a container share its traversal: ``names`` is entered once for both indices, and an array is left
+  as soon as its last referenced index has been read;
+- nested containers that are skipped whole are scanned for brackets only, everything between two brackets (strings
+  included) being matched by a single regex, and nothing is built; strings, numbers and literals are matched by regex;
+- referenced values are copied as raw JSON text, not decoded;
+- scanning stops as soon as every top-level key the model reads has been found, right after the last referenced
+  item of the last one (nested objects are read to their end, so that their last duplicate key wins, as in full
+  parsing).
+
+The result is a small JSON document holding the referenced paths only (unreferenced array items before a referenced
+one become ``null``), which :func:`validate_extracted` hands to ``model_validate_json``, so that validation follows
+JSON-mode rules. Should it fail, the whole document is validated again to raise errors identical to full validation,
+``input`` included; invalid documents therefore cost more than with full validation alone. Documents the extractor
+cannot walk (not an object, malformed before the last needed key) are validated in full instead. Arrays referenced
+through negative ``AliasPath`` indices are copied whole.
+
+Extraction runs in Python, full parsing in pydantic-core: it pays off in proportion to how much of the document lies
+after the last referenced path, and costs more than ``model_validate_json`` when that path comes last, after many
+nested containers (see ``benchmarks/bench_extract.py``).
+
+Differences from full validation, all traded for stopping early:
+
+- anything after the last needed top-level key goes unnoticed: malformed or trailing JSON, and duplicates of any
+  top-level key the model reads (full parsing keeps the last occurrence, extraction the first); a document read to
+  its end must not have anything but whitespace after it;
+- within skipped containers only the balance of brackets (not their kind) and the termination of strings are checked,
+  not the rest of the JSON grammar;
+- ``extra="forbid"`` / ``"allow"`` models never see other keys.
+"""
+
+import json
+import re
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from pydantic_notes.aliases import InputPath, input_paths
+
+# Trie nodes map object keys / array indices to child nodes; ``_WHOLE`` marks a value copied as a whole.
+type _Node = dict[str | int, Any]
+
+_WHOLE: Any = object()
+_ABSENT: Any = object()
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(r"[^,\]}\s]+")
+# Everything up to the next bracket, strings included, in a single match.
+_PLAIN = re.compile(r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*', re.DOTALL)
+
+
+class ExtractError(ValueError):
+    def __init__(self, position: int):
+        super().__init__(f"Unexpected JSON at position {position}")
+        self.position = position
+
+
+def compile_paths(paths: Iterable[InputPath]) -> _Node:
+    root: _Node = {}
+    for path in paths:
+        node = root
+        for item in path[:-1]:
+            child = node.get(item)
+            if child is _WHOLE:
+                break
+            if child is None:
+                child = node[item] = {}
+            node = child
+        else:
+            node[path[-1]] = _WHOLE
+    return root
+
+
+def _skip_rest(doc: str, i: int, depth: int = 1) -> int:
+    """Skip to the end of the container ``depth`` levels up from ``i``."""
+    size = len(doc)
+    while True:
+        i = _PLAIN.match(doc, i).end()
+        if i >= size:
+            raise ExtractError(i)
+        char = doc[i]
+        if char == '"':
+            # An unterminated string.
+            raise ExtractError(i)
+        if char in "[{":
+            depth += 1
+            i += 1
+        else:
+            depth -= 1
+            i += 1
+            if depth == 0:
+                return i
+
+
+def _skip(doc: str, i: int) -> int:
+    """Skip the value starting at ``i``."""
+    char = doc[i : i + 1]
+    if char == '"':
+        match = _STRING.match(doc, i)
+    elif char in ("[", "{"):
+        return _skip_rest(doc, i + 1)
+    else:
+        match = _SCALAR.match(doc, i)
+    if match is None:
+        raise ExtractError(i)
+    return match.end()
+
+
+def _value(doc: str, i: int, node: Any, out: list[str], *, last: bool = False) -> int:
+    """Copy what ``node`` references out of the value at ``i``; with ``last``, nothing after it is needed."""
+    char = doc[i : i + 1]
+    if node is not _WHOLE:
+        if char == "{":
+            return _object(doc, i, node, out)
+        if char == "[":
+            return _array(doc, i, node, out, last=last)
+    end = _skip(doc, i)
+    out.append(doc[i:end])
+    return end
+
+
+def _object(doc: str, i: int, node: _Node, out: list[str], *, top: bool = False) -> int:
+    remaining = {key for key in node if isinstance(key, str)} if top else set()
+    out.append("{")
+    first = True
+    i = _WHITESPACE.match(doc, i + 1).end()
+    if doc[i : i + 1] == "}":
+        out.append("}")
+        return i + 1
+    while True:
+        match = _STRING.match(doc, i)
+        if match is None:
+            raise ExtractError(i)
+        raw_key = match.group()
+        key = raw_key[1:-1] if "\\" not in raw_key else json.loads(raw_key)
+        i = _WHITESPACE.match(doc, match.end()).end()
+        if doc[i : i + 1] != ":":
+            raise ExtractError(i)
+        i = _WHITESPACE.match(doc, i + 1).end()
+        child = node.get(key, _ABSENT)
+        if child is _ABSENT:
+            i = _skip(doc, i)
+        else:
+            if not first:
+                out.append(",")
+            first = False
+            out.append(raw_key)
+            out.append(":")
+            i = _value(doc, i, child, out, last=top and remaining == {key})
+            if top:
+                remaining.discard(key)
+                if not remaining:
+                    out.append("}")
+                    return len(doc)
+        i = _WHITESPACE.match(doc, i).end()
+        char = doc[i : i + 1]
+        if char == "}":
+            out.append("}")
+            return i + 1
+        if char != ",":
+            raise ExtractError(i)
+        i = _WHITESPACE.match(doc, i + 1).end()
+
+
+def _array(doc: str, i: int, node: _Node, out: list[str], *, last: bool = False) -> int:
+    indices = [key for key in node if isinstance(key, int)]
+    if any(index < 0 for index in indices):
+        # Negative indices count from an end that is only known once the array has been read.
+        end = _skip(doc, i)
+        out.append(doc[i:end])
+        return end
+    if not indices:
+        out.append("[]")
+        return _skip(doc, i)
+    last_index = max(indices)
+    out.append("[")
+    i = _WHITESPACE.match(doc, i + 1).end()
+    if doc[i : i + 1] == "]":
+        out.append("]")
+        return i + 1
+    index = 0
+    while True:
+        if index:
+            out.append(",")
+        child = node.get(index, _ABSENT)
+        if child is _ABSENT:
+            out.append("null")
+            i = _skip(doc, i)
+        else:
+            i = _value(doc, i, child, out, last=last and index == last_index)
+        if index == last_index:
+            out.append("]")
+            return len(doc) if last else _skip_rest(doc, i)
+        i = _WHITESPACE.match(doc, i).end()
+        char = doc[i : i + 1]
+        if char == "]":
+            out.append("]")
+            return i + 1
+        if char != ",":
+            raise ExtractError(i)
+        i = _WHITESPACE.match(doc, i + 1).end()
+        index += 1
+
+
+class Extractor:
+    def __init__(self, model_cls: type[BaseModel]):
+        self.model_cls = model_cls
+        self.trie = compile_paths(path for paths in input_paths(model_cls).values() for path in paths)
+
+    def extract(self, json_data: str | bytes | bytearray) -> str:
+        """The JSON object holding the paths the model reads; :class:`ExtractError` if ``json_data`` is not usable."""
+        doc = json_data if isinstance(json_data, str) else bytes(json_data).decode()
+        i = _WHITESPACE.match(doc).end()
+        if doc[i : i + 1] != "{":
+            raise ExtractError(i)
+        out: list[str] = []
+        i = _WHITESPACE.match(doc, _object(doc, i, self.trie, out, top=True)).end()
+        if i != len(doc):
+            raise ExtractError(i)
+        return "".join(out)
+
+
+@cache
+def extractor(model_cls: type[BaseModel]) -> Extractor:
+    return Extractor(model_cls)
+
+
+def validate_extracted[M: BaseModel](
+    model_cls: type[M], json_data: str | bytes | bytearray, *, strict: bool | None = None
+) -> M:
+    """``model_validate_json`` on the paths ``model_cls`` reads, falling back to the whole document."""
+    try:
+        extracted = extractor(model_cls).extract(json_data)
+    except (ExtractError, UnicodeDecodeError):
+        return model_cls.model_validate_json(json_data, strict=strict)
+    try:
+        return model_cls.model_validate_json(extracted, strict=strict)
+    except ValidationError:
+        # Raise the errors of the whole document, whose ``input`` is the document rather than the extract.
+        return model_cls.model_validate_json(json_data, strict=strict)
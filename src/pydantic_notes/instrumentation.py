@@ -0,0 +1,233 @@
+"""Call counts, payload sizes and latency histograms for ``model_validate*`` / ``model_dump*``.
+
+Instrumentation works by patching the four methods on the selected model classes and restoring them afterwards, so a
+model that is not instrumented runs the untouched pydantic code path: disabled costs nothing.
+
+    with instrument(ModelWithPlainAlias) as recorder:
+        ModelWithPlainAlias.model_validate_json('{"firstName": "Mickey"}')
+    recorder.write_prometheus("pydantic.prom")
+
+Payload sizes are only recorded for the JSON methods: the size in bytes of the input, respectively of the output,
+document (UTF-8 encoded, for ``str`` documents).
+
+A model is instrumented at most once at a time: instrumenting it again, through the same recorder or another one, is
+a no-op, and a subclass of an instrumented model gets its own wrapper around the original method rather than around
+its parent's wrapper, so no call is counted twice.
+"""
+
+import json
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+CLASS_METHODS = ("model_validate", "model_validate_json")
+INSTANCE_METHODS = ("model_dump", "model_dump_json")
+JSON_METHODS = ("model_validate_json", "model_dump_json")
+
+# Bucket ``i`` counts calls that took at most ``2 ** (i + FIRST_BUCKET_EXPONENT)`` nanoseconds (first bucket: ~1us);
+# one more bucket, past the last bound (~17s), counts longer calls, which only the ``+Inf`` bucket includes.
+FIRST_BUCKET_EXPONENT = 10
+BUCKETS = 25
+OVERFLOW = BUCKETS
+
+_MISSING = object()
+
+
+def _size(document: str | bytes | bytearray) -> int:
+    """Size in bytes; ``isascii()`` is a flag check, sparing the encoding of ASCII documents."""
+    if isinstance(document, str) and not document.isascii():
+        return len(document.encode())
+    return len(document)
+
+
+def _instrumented(func: Any) -> bool:
+    return getattr(func, "__instrumented__", False)
+
+
+def bucket_index(elapsed_ns: int) -> int:
+    return min(OVERFLOW, max(0, (elapsed_ns - 1).bit_length() - FIRST_BUCKET_EXPONENT))
+
+
+def bucket_bounds() -> list[float]:
+    """Upper bound of every bucket but the overflow one, in seconds."""
+    return [2 ** (i + FIRST_BUCKET_EXPONENT) / 1e9 for i in range(BUCKETS)]
+
+
+@dataclass
+class MethodStats:
+    calls: int = 0
+    errors: int = 0
+    payload_bytes: int = 0
+    total_ns: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * (BUCKETS + 1))
+
+    def record(self, elapsed_ns: int, size: int, *, failed: bool) -> None:
+        self.calls += 1
+        self.errors += failed
+        self.payload_bytes += size
+        self.total_ns += elapsed_ns
+        self.buckets[bucket_index(elapsed_ns)] += 1
+
+
+class Instrumentation:
+    def __init__(self):
+        self.stats: dict[tuple[str, str], MethodStats] = {}
+        self._patched: list[tuple[type[BaseModel], str, Any]] = []
+
+    def _stats_for(self, model_name: str, method: str) -> MethodStats:
+        key = (model_name, method)
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = MethodStats()
+        return stats
+
+    def _timed(self, func: Callable[..., Any], method: str, owner: Any, args: tuple, kwargs: dict) -> Any:
+        model_name = owner.__name__ if isinstance(owner, type) else type(owner).__name__
+        start = time.perf_counter_ns()
+        failed = True
+        result = None
+        try:
+            result = func(owner, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            if method == "model_validate_json":
+                size = _size(args[0] if args else kwargs["json_data"])
+            elif method == "model_dump_json" and not failed:
+                size = _size(result)
+            else:
+                size = 0
+            self._stats_for(model_name, method).record(elapsed, size, failed=failed)
+
+    def instrument(self, *models: type[BaseModel]) -> None:
+        for model in models:
+            for method in CLASS_METHODS + INSTANCE_METHODS:
+                original = model.__dict__.get(method, _MISSING)
+                if original is not _MISSING and _instrumented(getattr(original, "__func__", original)):
+                    continue
+                func = getattr(model, method)
+                if method in CLASS_METHODS:
+                    func = func.__func__
+                if _instrumented(func):
+                    # Inherited from an instrumented parent: wrap the method the parent's wrapper wraps.
+                    func = func.__wrapped__
+                patched = self._wrapper(func, method)
+                if method in CLASS_METHODS:
+                    patched = classmethod(patched)
+                setattr(model, method, patched)
+                self._patched.append((model, method, original))
+
+    def _wrapper(self, func: Callable[..., Any], method: str) -> Callable[..., Any]:
+        def wrapper(owner: Any, *args: Any, **kwargs: Any) -> Any:
+            return self._timed(func, method, owner, args, kwargs)
+
+        wrapper.__name__ = method
+        wrapper.__wrapped__ = func
+        wrapper.__instrumented__ = True
+        return wrapper
+
+    def uninstrument(self) -> None:
+        while self._patched:
+            model, method, original = self._patched.pop()
+            if original is _MISSING:
+                delattr(model, method)
+            else:
+                setattr(model, method, original)
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Per model, per method: counters and the (non-cumulative) histogram bucket counts."""
+        snapshot: dict[str, dict[str, dict[str, Any]]] = {}
+        for (model_name, method), stats in sorted(self.stats.items()):
+            snapshot.setdefault(model_name, {})[method] = {
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "payload_bytes": stats.payload_bytes if method in JSON_METHODS else None,
+                "total_seconds": stats.total_ns / 1e9,
+                "buckets": dict(
+                    zip([*(f"{bound:.9g}" for bound in bucket_bounds()), "+Inf"], stats.buckets, strict=True)
+                ),
+            }
+        return snapshot
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix: str = "pydantic_notes") -> str:
+        lines = [
+            f"# HELP {prefix}_calls_total Calls per model and method.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        items = sorted(self.stats.items())
+        labels = {key: f'model="{key[0]}",method="{key[1]}"' for key, _ in items}
+        lines += [f"{prefix}_calls_total{{{labels[key]}}} {stats.calls}" for key, stats in items]
+        lines += [
+            f"# HELP {prefix}_errors_total Calls that raised, per model and method.",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        lines += [f"{prefix}_errors_total{{{labels[key]}}} {stats.errors}" for key, stats in items]
+        lines += [
+            f"# HELP {prefix}_payload_bytes_total JSON payload sizes, per model and method.",
+            f"# TYPE {prefix}_payload_bytes_total counter",
+        ]
+        lines += [
+            f"{prefix}_payload_bytes_total{{{labels[key]}}} {stats.payload_bytes}"
+            for key, stats in items
+            if key[1] in JSON_METHODS
+        ]
+        lines += [
+            f"# HELP {prefix}_latency_seconds Call latency, per model and method.",
+            f"# TYPE {prefix}_latency_seconds histogram",
+        ]
+        bounds = bucket_bounds()
+        for key, stats in items:
+            cumulative = 0
+            for bound, count in zip(bounds, stats.buckets[:BUCKETS], strict=True):
+                cumulative += count
+                lines.append(f'{prefix}_latency_seconds_bucket{{{labels[key]},le="{bound:.9g}"}} {cumulative}')
+            lines.append(f'{prefix}_latency_seconds_bucket{{{labels[key]},le="+Inf"}} {stats.calls}')
+            lines.append(f"{prefix}_latency_seconds_sum{{{labels[key]}}} {stats.total_ns / 1e9:.9g}")
+            lines.append(f"{prefix}_latency_seconds_count{{{labels[key]}}} {stats.calls}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | os.PathLike[str], prefix: str = "pydantic_notes") -> None:
+        """Write the text exposition format atomically, as the node exporter textfile collector expects."""
+        path = Path(path)
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(self.to_prometheus(prefix))
+        tmp.replace(path)
+
+    def write_json(self, path: str | os.PathLike[str]) -> None:
+        Path(path).write_text(self.to_json())
+
+
+@contextmanager
+def instrument(*models: type[BaseModel]) -> Iterator[Instrumentation]:
+    recorder = Instrumentation()
+    recorder.instrument(*models)
+    try:
+        yield recorder
+    finally:
+        recorder.uninstrument()
+
+
+_global = Instrumentation()
+
+
+def enable(*models: type[BaseModel]) -> Instrumentation:
+    """Process-wide switch: instrument ``models`` until :func:`disable` is called."""
+    _global.instrument(*models)
+    return _global
+
+
+def disable() -> Instrumentation:
+    _global.uninstrument()
+    return _global
@@ -0,0 +1,73 @@
+"""Lazy model proxy: validate a field only when it is first read.
+
+Consumers that read one or two fields out of a wide payload pay, with ``model_validate_json``, for validating and
+building every field. :class:`LazyModel` wraps the raw JSON document (or an already decoded dict) instead. Reading an
+attribute validates that single field, located through its alias, ``AliasChoices`` or ``AliasPath``, with a validator
+cut out of the model's own core schema (see :mod:`pydantic_notes.schema`), and caches the value. JSON documents are
+validated in JSON mode straight from the bytes, the parser skipping the values of every other field.
+
+Errors are those of full validation, located by alias (e.g. ``missing`` at ``("firstName",)``). ``materialize()``
+validates the whole input, model validators included, and returns a regular model instance. Proxies copy and pickle
+with the fields loaded so far (pickling needs an importable model class).
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import BaseModel
+
+from pydantic_notes.schema import fields_validator
+
+
+class LazyModel[M: BaseModel]:
+    __slots__ = ("_lazy_model_cls", "_lazy_data", "_lazy_values")
+
+    def __init__(self, model_cls: type[M], data: str | bytes | bytearray | Mapping[str, Any]):
+        object.__setattr__(self, "_lazy_model_cls", model_cls)
+        object.__setattr__(self, "_lazy_data", data)
+        object.__setattr__(self, "_lazy_values", {})
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not slots (or slots not set yet, on an instance being copied or unpickled):
+        # field names and unknown attributes.
+        if name.startswith(("__", "_lazy_")):
+            raise AttributeError(name)
+        values = self._lazy_values
+        if name not in values:
+            if name not in self._lazy_model_cls.model_fields:
+                raise AttributeError(name)
+            validator = fields_validator(self._lazy_model_cls, frozenset((name,)))
+            data = self._lazy_data
+            if isinstance(data, Mapping):
+                fields, _, _ = validator.validate_python(data)
+            else:
+                fields, _, _ = validator.validate_json(data)
+            values[name] = fields[name]
+        return values[name]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(name)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"model_cls": self._lazy_model_cls, "data": self._lazy_data, "values": self._lazy_values}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        object.__setattr__(self, "_lazy_model_cls", state["model_cls"])
+        object.__setattr__(self, "_lazy_data", state["data"])
+        object.__setattr__(self, "_lazy_values", dict(state["values"]))
+
+    def __dir__(self) -> list[str]:
+        return [*super().__dir__(), *self._lazy_model_cls.model_fields]
+
+    @property
+    def loaded_fields(self) -> frozenset[str]:
+        return frozenset(self._lazy_values)
+
+    def materialize(self) -> M:
+        if isinstance(self._lazy_data, Mapping):
+            return self._lazy_model_cls.model_validate(self._lazy_data)
+        return self._lazy_model_cls.model_validate_json(self._lazy_data)
+
+    def __repr__(self) -> str:
+        loaded = ", ".join(f"{name}={value!r}" for name, value in self._lazy_values.items())
+        return f"LazyModel[{self._lazy_model_cls.__name__}]({loaded})"
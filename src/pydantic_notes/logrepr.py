@@ -0,0 +1,122 @@
+"""Bounded, lazily formatted representations of model collections for logging.
+
+``logger.debug("batch %s", batch)`` formats nothing when the record is filtered out, but ``%s`` on a list still renders
+every field of every model once it is emitted, and ``f"{batch!r}"`` renders it up front either way. Passing
+``bounded(batch)`` (or ``summary(batch)``) as the argument instead defers all formatting to the moment a handler emits
+the record, and caps it:
+
+- at most ``max_models`` models, followed by ``...+N more``;
+- at most ``max_fields`` fields per model, taken from the model's own ``__repr_args__`` (so ``repr=False`` fields are
+  left out, as in ``repr()``), followed by ``...+N fields``;
+- field values through :class:`reprlib.Repr`, which shortens long strings and containers;
+- at most ``max_chars`` characters overall.
+
+``summary(batch)`` renders the size of the collection and its count per model class instead, e.g.
+``3 models: ModelWithPlainAlias=2, ModelWithValidationAlias=1``.
+"""
+
+import reprlib
+from collections import Counter
+from collections.abc import Collection
+from typing import Any
+
+from pydantic import BaseModel
+
+_ELLIPSIS = "..."
+
+
+class BoundedRepr:
+    """A collection of models, formatted within limits on first ``str()`` / ``repr()`` and then cached."""
+
+    __slots__ = ("models", "max_models", "max_fields", "max_chars", "_value_repr", "_text")
+
+    def __init__(
+        self,
+        models: Collection[BaseModel],
+        *,
+        max_models: int = 5,
+        max_fields: int = 10,
+        max_chars: int = 1000,
+        max_value_chars: int = 40,
+    ):
+        self.models = models
+        self.max_models = max_models
+        self.max_fields = max_fields
+        self.max_chars = max_chars
+        self._value_repr = reprlib.Repr(maxstring=max_value_chars, maxother=max_value_chars)
+        self._text: str | None = None
+
+    def _model(self, model: Any) -> str:
+        if not isinstance(model, BaseModel):
+            return self._value_repr.repr(model)
+        args = []
+        hidden = 0
+        for name, value in model.__repr_args__():
+            if len(args) < self.max_fields:
+                rendered = self._value_repr.repr(value)
+                args.append(rendered if name is None else f"{name}={rendered}")
+            else:
+                hidden += 1
+        if hidden:
+            args.append(f"{_ELLIPSIS}+{hidden} fields")
+        return f"{type(model).__name__}({', '.join(args)})"
+
+    def format(self) -> str:
+        parts = []
+        # Stop rendering models once the character budget is spent; the rest only count towards "+N more".
+        budget = self.max_chars
+        for model in self.models:
+            if len(parts) == self.max_models or budget <= 0:
+                break
+            parts.append(self._model(model))
+            budget -= len(parts[-1]) + 2
+        if len(self.models) > len(parts):
+            parts.append(f"{_ELLIPSIS}+{len(self.models) - len(parts)} more")
+        return _truncate(f"[{', '.join(parts)}]", self.max_chars)
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self.format()
+        return self._text
+
+    __repr__ = __str__
+
+
+class SummaryRepr:
+    """A collection of models, formatted on first ``str()`` / ``repr()`` as its size and counts by model class."""
+
+    __slots__ = ("models", "max_chars", "_text")
+
+    def __init__(self, models: Collection[BaseModel], *, max_chars: int = 1000):
+        self.models = models
+        self.max_chars = max_chars
+        self._text: str | None = None
+
+    def format(self) -> str:
+        counts = Counter(type(model).__name__ for model in self.models)
+        by_class = ", ".join(f"{name}={count}" for name, count in counts.most_common())
+        noun = "model" if len(self.models) == 1 else "models"
+        return _truncate(f"{len(self.models)} {noun}" + (f": {by_class}" if by_class else ""), self.max_chars)
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self.format()
+        return self._text
+
+    __repr__ = __str__
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return text[: max(max_chars - len(_ELLIPSIS), 0)] + _ELLIPSIS
+
+
+def bounded(models: Collection[BaseModel], **limits: int) -> BoundedRepr:
+    """Wrap ``models`` for a log call, e.g. ``logger.debug("batch %s", bounded(batch, max_models=3))``."""
+    return BoundedRepr(models, **limits)
+
+
+def summary(models: Collection[BaseModel], *, max_chars: int = 1000) -> SummaryRepr:
+    """Wrap ``models`` for a log call, rendering counts by model class only."""
+    return SummaryRepr(models, max_chars=max_chars)
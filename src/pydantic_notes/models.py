@@ -0,0 +1,133 @@
+"""Alias model catalogue.
+
+The models below are the ones exercised by the notes in ``tests/aliasing``. They live here, at module level, so that
+the tooling in this package (servers, benchmarks, process pools) can import and pickle them.
+"""
+
+from typing import Any
+
+from pydantic import AliasChoices, AliasGenerator, AliasPath, BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel, to_pascal
+
+
+class ModelWithPlainAlias(BaseModel):
+    first_name: str = Field(alias="firstName")
+
+
+class ModelWithSerializationAlias(BaseModel):
+    first_name: str = Field(serialization_alias="f_name")
+
+
+class ModelWithValidationAlias(BaseModel):
+    first_name: str = Field(validation_alias="firstName")
+
+
+class ModelWithValidationAliasChoices(BaseModel):
+    first_name: str = Field(validation_alias=AliasChoices("firstName", "givenName", "preferredName"))
+
+
+class ModelWithValidationAliasPath(BaseModel):
+    first_name: str = Field(validation_alias=AliasPath("names", 0))
+    last_name: str = Field(validation_alias=AliasPath("names", 1))
+
+
+class ModelWithPlainAndSerializationAlias(BaseModel):
+    first_name: str = Field(alias="firstName", serialization_alias="f_name")
+
+
+class ModelWithPlainAndValidationAlias(BaseModel):
+    first_name: str = Field(alias="f_name", validation_alias="firstName")
+
+
+class ModelWithPlainAndSerializationAndValidationAlias(BaseModel):
+    first_name: str = Field(alias="f_name_a", serialization_alias="f_name_s", validation_alias="firstName")
+
+
+class ModelWithPlainAliasPopByName(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    first_name: str = Field(alias="firstName")
+
+
+class ModelWithSerializationAliasPopByName(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    first_name: str = Field(serialization_alias="f_name")
+
+
+class ModelWithValidationAliasPopByName(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    first_name: str = Field(validation_alias="firstName")
+
+
+class ModelWithAliasGeneratorAndUnsetPriority(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(
+            alias=to_camel,
+            validation_alias=lambda x: x.upper(),
+            serialization_alias=to_pascal,
+        )
+    )
+    first_name_pa: str = Field(alias="f_name_pa")
+    first_name_va: str = Field(validation_alias="f_name_va")
+    first_name_sa: str = Field(serialization_alias="f_name_sa")
+
+
+class ModelWithAliasGeneratorAndAliasPriority1(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(
+            alias=to_camel,
+            validation_alias=lambda x: x.upper(),
+            serialization_alias=to_pascal,
+        )
+    )
+    first_name_pa: str = Field(alias="f_name_pa", alias_priority=1)
+    first_name_va: str = Field(validation_alias="f_name_va", alias_priority=1)
+    first_name_sa: str = Field(serialization_alias="f_name_sa", alias_priority=1)
+
+
+class ModelWithAliasGeneratorAndAliasPriority2(BaseModel):
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(
+            alias=to_camel,
+            validation_alias=lambda x: x.upper(),
+            serialization_alias=to_pascal,
+        )
+    )
+    first_name_pa: str = Field(alias="f_name_pa", alias_priority=2)
+    first_name_va: str = Field(validation_alias="f_name_va", alias_priority=2)
+    first_name_sa: str = Field(serialization_alias="f_name_sa", alias_priority=2)
+
+
+ALIAS_MODELS: dict[str, type[BaseModel]] = {
+    "plain_alias": ModelWithPlainAlias,
+    "serialization_alias": ModelWithSerializationAlias,
+    "validation_alias": ModelWithValidationAlias,
+    "validation_alias_choices": ModelWithValidationAliasChoices,
+    "validation_alias_path": ModelWithValidationAliasPath,
+    "plain_and_serialization_alias": ModelWithPlainAndSerializationAlias,
+    "plain_and_validation_alias": ModelWithPlainAndValidationAlias,
+    "plain_and_serialization_and_validation_alias": ModelWithPlainAndSerializationAndValidationAlias,
+    "plain_alias_and_pop_by_name_config": ModelWithPlainAliasPopByName,
+    "serialization_alias_and_pop_by_name_config": ModelWithSerializationAliasPopByName,
+    "validation_alias_and_pop_by_name_config": ModelWithValidationAliasPopByName,
+    "alias_generator_and_unset_priority": ModelWithAliasGeneratorAndUnsetPriority,
+    "alias_generator_and_priority_1": ModelWithAliasGeneratorAndAliasPriority1,
+    "alias_generator_and_priority_2": ModelWithAliasGeneratorAndAliasPriority2,
+}
+
+# One valid input per model, using the keys the notes in ``tests/aliasing`` instantiate them with.
+SAMPLE_PAYLOADS: dict[str, dict[str, Any]] = {
+    "plain_alias": {"firstName": "Mickey"},
+    "serialization_alias": {"first_name": "Mickey"},
+    "validation_alias": {"firstName": "Mickey"},
+    "validation_alias_choices": {"givenName": "Mickey"},
+    "validation_alias_path": {"names": ["Mickey", "Mouse"]},
+    "plain_and_serialization_alias": {"firstName": "Mickey"},
+    "plain_and_validation_alias": {"firstName": "Mickey"},
+    "plain_and_serialization_and_validation_alias": {"firstName": "Mickey"},
+    "plain_alias_and_pop_by_name_config": {"firstName": "Mickey"},
+    "serialization_alias_and_pop_by_name_config": {"first_name": "Mickey"},
+    "validation_alias_and_pop_by_name_config": {"firstName": "Mickey"},
+    "alias_generator_and_unset_priority": {"f_name_pa": "Mickey", "f_name_va": "Mickey", "FIRST_NAME_SA": "Mickey"},
+    "alias_generator_and_priority_1": {"FIRST_NAME_PA": "Mickey", "FIRST_NAME_VA": "Mickey", "FIRST_NAME_SA": "Mickey"},
+    "alias_generator_and_priority_2": {"f_name_pa": "Mickey", "f_name_va": "Mickey", "FIRST_NAME_SA": "Mickey"},
+}
@@ -0,0 +1,119 @@
+"""Case- and separator-insensitive input keys, rewritten to the keys a model validates from.
+
+Producers send the same key as ``FIRST_NAME``, ``firstname``, ``first-name`` or ``FirstName``. Listing every spelling
+in ``AliasChoices`` is slow (pydantic tries the choices one by one) and never complete. A :class:`KeyNormalizer`
+instead compiles, once per model, a table from the *normalized* form of each key the model reads (casefolded, with
+``_``, ``-``, ``.`` and spaces removed) to that key, and rewrites incoming top-level keys in a single pass before
+validation:
+
+- keys the model reads as they are (the canonical keys: validation aliases after ``AliasGenerator`` and
+  ``alias_priority`` resolution, each ``AliasChoices`` choice, the first segment of each ``AliasPath``, and field names
+  under ``populate_by_name``) are kept as they are;
+- other keys whose normalized form matches are renamed to the canonical key, unless that key is already in the input;
+- anything else passes through untouched, so that the model's ``extra`` behaviour still applies.
+
+Two canonical keys of *different* fields that normalize alike (``firstName`` and ``FIRST_NAME`` on two fields) make the
+table ambiguous, and building it raises :class:`AmbiguousKeyError`. Subclasses of :class:`NormalizedKeysModel` build
+theirs when the class is created, so the error surfaces at import time, and normalize every ``model_validate*`` input.
+Only top-level keys are normalized; keys nested under an ``AliasPath`` must match exactly.
+"""
+
+import re
+from collections.abc import Mapping
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, model_validator
+
+from pydantic_notes.aliases import input_paths
+
+_SEPARATORS = re.compile(r"[-_.\s]+")
+
+# Raw keys memoized per model at most: inputs keep bringing unknown keys, each normalized anew past that.
+MAX_MEMO = 4096
+
+
+def normalize_key(key: str) -> str:
+    return _SEPARATORS.sub("", key).casefold()
+
+
+class AmbiguousKeyError(Exception):
+    def __init__(self, model_cls: type[BaseModel], normalized: str, owners: dict[str, list[str]]):
+        keys = ", ".join(f"{key!r} ({', '.join(fields)})" for key, fields in owners.items())
+        super().__init__(f"{model_cls.__name__}: input keys {keys} all normalize to {normalized!r}")
+
+
+class KeyNormalizer:
+    def __init__(self, model_cls: type[BaseModel]):
+        owners: dict[str, dict[str, list[str]]] = {}
+        for name, paths in input_paths(model_cls).items():
+            for path in paths:
+                key = path[0]
+                if isinstance(key, str):
+                    fields = owners.setdefault(normalize_key(key), {}).setdefault(key, [])
+                    if name not in fields:
+                        fields.append(name)
+        table = {}
+        for normalized, keys in owners.items():
+            if len(keys) > 1 and len({name for fields in keys.values() for name in fields}) > 1:
+                raise AmbiguousKeyError(model_cls, normalized, keys)
+            # Several spellings of one field's keys: the first is the one pydantic tries first.
+            table[normalized] = next(iter(keys))
+        self.model_cls = model_cls
+        self.canonical = frozenset(key for keys in owners.values() for key in keys)
+        self.table = table
+        self._memo: dict[str, str | None] = {}
+
+    def canonical_key(self, key: str) -> str | None:
+        """The canonical key ``key`` stands for, ``None`` if it stands for none."""
+        memo = self._memo
+        try:
+            return memo[key]
+        except KeyError:
+            pass
+        canonical = self.table.get(normalize_key(key))
+        if len(memo) < MAX_MEMO:
+            memo[key] = canonical
+        return canonical
+
+    def rewrite(self, data: Mapping[str, Any]) -> dict[str, Any]:
+        canonical_keys = self.canonical
+        if canonical_keys.issuperset(data):
+            return dict(data)
+        rewritten: dict[str, Any] = {}
+        for key, value in data.items():
+            if key in canonical_keys or not isinstance(key, str):
+                rewritten[key] = value
+                continue
+            target = self.canonical_key(key)
+            if target is None or target in data or target in rewritten:
+                rewritten[key] = value
+            else:
+                rewritten[target] = value
+        return rewritten
+
+
+@cache
+def key_normalizer(model_cls: type[BaseModel]) -> KeyNormalizer:
+    return KeyNormalizer(model_cls)
+
+
+def normalize_keys(model_cls: type[BaseModel], data: Mapping[str, Any]) -> dict[str, Any]:
+    """``data`` with its top-level keys rewritten to the ones ``model_cls`` reads."""
+    return key_normalizer(model_cls).rewrite(data)
+
+
+class NormalizedKeysModel(BaseModel):
+    """Base class normalizing input keys before validation; its key table is built (and checked) with the class."""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        key_normalizer(cls)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_keys(cls, data: Any) -> Any:
+        if isinstance(data, Mapping):
+            return key_normalizer(cls).rewrite(data)
+        return data
@@ -0,0 +1,132 @@
+"""Compact pickles of models: a class reference, a tuple of field values and a fields-set bitmask.
+
+A model pickles by default as its class plus a state dict of ``__dict__`` (every field name next to its value),
+``__pydantic_fields_set__`` (a set of those names again), ``__pydantic_extra__`` and ``__pydantic_private__``, for each
+object. Subclasses of :class:`CompactPickleModel` reduce instead to their class and a row: the field values in field
+order, and an integer with bit ``i`` set when field ``i`` is in the fields set. Extra values (``extra="allow"``) and
+private attributes are appended to the row only when the instance has any, the fields-set bits of extra keys following
+those of the fields. Unpickling restores the row the way ``BaseModel.__setstate__`` restores its state dict, without
+validation; default pickles of the same class still load.
+
+:func:`compact_batch` wraps a list of models of one class, with or without the base class, in a :class:`CompactBatch`
+that pickles the class once and one row per model. Lists mixing classes pickle each model as it would on its own.
+"""
+
+import copyreg
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+# Bound on the fields sets cached per model class, one per bitmask seen.
+MAX_MASKS = 4096
+
+type Row = tuple[Any, ...]
+
+
+class _Layout:
+    """Field order and fields-set bits of a model class, with the fields sets seen so far by bitmask."""
+
+    def __init__(self, model_cls: type[BaseModel]):
+        self.names = tuple(model_cls.model_fields)
+        self.bits = {name: 1 << bit for bit, name in enumerate(self.names)}
+        self.field_mask = (1 << len(self.names)) - 1
+        self.allows_extra = model_cls.model_config.get("extra") == "allow"
+        self.has_private = bool(model_cls.__private_attributes__)
+        self._fields_sets: dict[int, frozenset[str]] = {}
+
+    def fields_set(self, mask: int) -> set[str]:
+        fields_set = self._fields_sets.get(mask)
+        if fields_set is None:
+            fields_set = frozenset(name for bit, name in enumerate(self.names) if mask >> bit & 1)
+            if len(self._fields_sets) < MAX_MASKS:
+                self._fields_sets[mask] = fields_set
+        return set(fields_set)
+
+
+@cache
+def _layout(model_cls: type[BaseModel]) -> _Layout:
+    return _Layout(model_cls)
+
+
+def _row(instance: BaseModel) -> Row:
+    layout = _layout(type(instance))
+    values = instance.__dict__
+    bits = layout.bits
+    mask = 0
+    has_extra_names = False
+    for name in instance.__pydantic_fields_set__:
+        bit = bits.get(name)
+        if bit is None:
+            has_extra_names = True
+        else:
+            mask |= bit
+    extra = instance.__pydantic_extra__
+    private = instance.__pydantic_private__
+    if private:
+        private = {key: value for key, value in private.items() if value is not PydanticUndefined}
+    if not (extra or private):
+        return tuple([values[name] for name in layout.names]), mask
+    if has_extra_names and extra:
+        fields_set = instance.__pydantic_fields_set__
+        for bit, name in enumerate(extra, start=len(layout.names)):
+            if name in fields_set:
+                mask |= 1 << bit
+    return tuple([values[name] for name in layout.names]), mask, extra, private
+
+
+def _restore(instance: BaseModel, values: tuple[Any, ...], mask: int, *state: Any) -> None:
+    layout = _layout(type(instance))
+    names = layout.names
+    fields_set = layout.fields_set(mask & layout.field_mask)
+    if state:
+        extra, private = state
+        if extra and mask > layout.field_mask:
+            fields_set.update(name for bit, name in enumerate(extra, start=len(names)) if mask >> bit & 1)
+    else:
+        extra = {} if layout.allows_extra else None
+        private = {} if layout.has_private else None
+    object.__setattr__(instance, "__dict__", dict(zip(names, values, strict=True)))
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", extra)
+    object.__setattr__(instance, "__pydantic_private__", private)
+
+
+class CompactPickleModel(BaseModel):
+    """Base class pickling instances as their class and a row of field values; combine it with other model bases."""
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # ``copyreg.__newobj__`` pickles as the NEWOBJ opcode: the class is the only global written.
+        return copyreg.__newobj__, (type(self),), _row(self)
+
+    def __setstate__(self, state: Any) -> None:
+        if isinstance(state, dict):  # a default pickle, written before the class switched to compact ones
+            super().__setstate__(state)
+        else:
+            _restore(self, *state)
+
+
+def _rebuild_batch(model_cls: type[BaseModel], rows: list[Row]) -> "CompactBatch":
+    batch = CompactBatch()
+    for row in rows:
+        instance = model_cls.__new__(model_cls)
+        _restore(instance, *row)
+        batch.append(instance)
+    return batch
+
+
+class CompactBatch(list[BaseModel]):
+    """List of models pickling, when they all share a class, that class once and a row per model."""
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        if self:
+            model_cls = type(self[0])
+            if all(type(instance) is model_cls for instance in self):
+                return _rebuild_batch, (model_cls, [_row(instance) for instance in self])
+        return CompactBatch, (list(self),)
+
+
+def compact_batch(instances: Iterable[BaseModel]) -> CompactBatch:
+    return CompactBatch(instances)
@@ -0,0 +1,278 @@
+"""Staged pipelines: parse, validate, transform and dump, each stage inline, in a thread pool or in a process pool.
+
+A :class:`Pipeline` chains :class:`Stage` functions, each applied to one item at a time and returning the item handed
+to the next stage. :meth:`Pipeline.run` cuts its source into batches of ``batch_size`` items and yields the items out
+of the last stage. Every stage has a driver thread that takes batches off its input queue and runs them:
+
+- ``inline``: in the driver thread itself;
+- ``thread``: in a ``ThreadPoolExecutor`` of ``workers`` threads;
+- ``process``: in a ``ProcessPoolExecutor`` of ``workers`` processes, started from a fork server, the stage function
+  and the items pickled both ways (the function must be importable: a module-level function, a model class method,
+  a ``functools.partial`` of these).
+
+Stages are connected by queues of at most ``max_pending`` batches, and a pool stage keeps at most ``2 * workers``
+batches in flight, so a slow stage blocks the ones before it, back to the source, and memory stays bounded. With
+``ordered=True`` pool stages hand batches on in source order; with ``ordered=False``, as soon as they are done.
+
+Each stage keeps :class:`StageMetrics`: batches and items done, seconds spent in the stage function (summed over
+workers), seconds its driver waited for input and seconds it was blocked on a full output queue. A stage whose
+driver is often blocked has a slow stage downstream; one that often waits has a slow stage upstream.
+
+The first error, in the source or in a stage, stops the pipeline: drivers stop taking batches, queued pool work is
+cancelled, every thread and pool is shut down, and :meth:`Pipeline.run` raises :class:`PipelineError`, chained to
+the original exception. Closing the generator early shuts the pipeline down the same way.
+
+:func:`json_pipeline` builds the usual job: NDJSON lines in (an open binary file will do), ``model_validate_json``,
+an optional transform, and ``model_dump_json(by_alias=True)`` bytes out.
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import batched
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_MAX_PENDING = 4
+# Seconds between checks of the stop flag while a thread waits on a queue.
+POLL_INTERVAL = 0.05
+
+type Mode = Literal["inline", "thread", "process"]
+
+MODES: tuple[Mode, ...] = ("inline", "thread", "process")
+
+_END = None
+
+
+class PipelineError(Exception):
+    def __init__(self, stage: str, batch: int):
+        self.stage = stage
+        self.batch = batch
+        super().__init__(f"Stage {stage!r} failed on batch {batch}")
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    func: Callable[[Any], Any]
+    mode: Mode = "inline"
+    workers: int = 1
+
+    def __post_init__(self) -> None:
+        if self.mode not in MODES:
+            raise ValueError(self.mode)
+        if self.workers < 1:
+            raise ValueError(self.workers)
+
+
+@dataclass
+class StageMetrics:
+    name: str
+    mode: Mode
+    batches: int = 0
+    items: int = 0
+    busy: float = 0.0
+    waiting: float = 0.0
+    blocked: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items per second spent in the stage function."""
+        return self.items / self.busy if self.busy else 0.0
+
+
+def _apply(func: Callable[[Any], Any], batch: tuple[Any, ...]) -> tuple[list[Any], float]:
+    started = time.perf_counter()
+    results = [func(item) for item in batch]
+    return results, time.perf_counter() - started
+
+
+def _executor(stage: Stage) -> Executor | None:
+    if stage.mode == "thread":
+        return ThreadPoolExecutor(stage.workers, thread_name_prefix=f"pipeline-{stage.name}")
+    if stage.mode == "process":
+        # Forking from a process running the pipeline's threads could copy locks they hold; the fork server has none.
+        return ProcessPoolExecutor(stage.workers, mp_context=multiprocessing.get_context("forkserver"))
+    return None
+
+
+class Pipeline:
+    def __init__(
+        self,
+        stages: Iterable[Stage],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        ordered: bool = True,
+    ):
+        if batch_size < 1:
+            raise ValueError(batch_size)
+        if max_pending < 1:
+            raise ValueError(max_pending)
+        self.stages = list(stages)
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.ordered = ordered
+        self.metrics = [StageMetrics(stage.name, stage.mode) for stage in self.stages]
+        self.wall = 0.0
+        self._failure: tuple[str, int, BaseException] | None = None
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        lines = [f"{len(self.stages)} stages in {self.wall:.3f}s, ordered={self.ordered}"]
+        for metrics in self.metrics:
+            lines.append(
+                f"  {metrics.name:<12} {metrics.mode:<7} {metrics.items:>10,} items  busy {metrics.busy:7.3f}s"
+                f"  {metrics.throughput:>12,.0f}/s  waited {metrics.waiting:7.3f}s  blocked {metrics.blocked:7.3f}s"
+            )
+        return "\n".join(lines)
+
+    def _fail(self, stage: str, batch: int, exc: BaseException, stop: threading.Event) -> None:
+        with self._lock:
+            if self._failure is None:
+                self._failure = (stage, batch, exc)
+        stop.set()
+
+    @staticmethod
+    def _put(out: queue.Queue, message: Any, stop: threading.Event) -> bool:
+        """Put ``message`` on ``out`` once there is room; ``False`` if the pipeline stopped first."""
+        while not stop.is_set():
+            try:
+                out.put(message, timeout=POLL_INTERVAL)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    @staticmethod
+    def _get(source: queue.Queue, stop: threading.Event) -> Any:
+        """The next message on ``source``; the end marker if the pipeline stopped first."""
+        while not stop.is_set():
+            try:
+                return source.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _feed(self, source: Iterable[Any], out: queue.Queue, stop: threading.Event) -> None:
+        index = 0
+        try:
+            for index, batch in enumerate(batched(source, self.batch_size)):
+                if not self._put(out, (index, batch), stop):
+                    return
+            self._put(out, _END, stop)
+        except Exception as exc:  # noqa: BLE001
+            self._fail("source", index, exc, stop)
+
+    def _drive(self, index: int, source: queue.Queue, out: queue.Queue, stop: threading.Event) -> None:
+        stage, metrics = self.stages[index], self.metrics[index]
+        executor = _executor(stage)
+        pending: deque[tuple[int, Future]] = deque()
+        current = -1
+
+        def emit(batch: int, results: list[Any], seconds: float) -> bool:
+            metrics.batches += 1
+            metrics.items += len(results)
+            metrics.busy += seconds
+            started = time.perf_counter()
+            sent = self._put(out, (batch, results), stop)
+            metrics.blocked += time.perf_counter() - started
+            return sent
+
+        def emit_done() -> bool:
+            nonlocal current
+            if self.ordered:
+                batch, future = pending.popleft()
+            else:
+                wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                batch, future = next((batch, future) for batch, future in pending if future.done())
+                pending.remove((batch, future))
+            current = batch
+            return emit(batch, *future.result())
+
+        try:
+            while True:
+                started = time.perf_counter()
+                message = self._get(source, stop)
+                metrics.waiting += time.perf_counter() - started
+                if message is _END:
+                    break
+                current, batch = message
+                if executor is None:
+                    if not emit(current, *_apply(stage.func, batch)):
+                        return
+                    continue
+                pending.append((current, executor.submit(_apply, stage.func, batch)))
+                while len(pending) >= 2 * stage.workers:
+                    if not emit_done():
+                        return
+            while pending and not stop.is_set():
+                if not emit_done():
+                    return
+            if not stop.is_set():
+                self._put(out, _END, stop)
+        except Exception as exc:  # noqa: BLE001
+            self._fail(stage.name, current, exc, stop)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """Items out of the last stage, for every item of ``source``; :attr:`metrics` start over on every run."""
+        started = time.perf_counter()
+        self._failure = None
+        self.metrics = [StageMetrics(stage.name, stage.mode) for stage in self.stages]
+        stop = threading.Event()
+        queues: list[queue.Queue] = [queue.Queue(self.max_pending) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._feed, args=(source, queues[0], stop), name="pipeline-source")]
+        threads.extend(
+            threading.Thread(
+                target=self._drive, args=(index, queues[index], queues[index + 1], stop), name=f"pipeline-{stage.name}"
+            )
+            for index, stage in enumerate(self.stages)
+        )
+        for thread in threads:
+            thread.start()
+        try:
+            while (message := self._get(queues[-1], stop)) is not _END:
+                yield from message[1]
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            self.wall = time.perf_counter() - started
+        if self._failure is not None:
+            stage, batch, exc = self._failure
+            raise PipelineError(stage, batch) from exc
+
+
+def dump_json(model: BaseModel) -> bytes:
+    return model.__pydantic_serializer__.to_json(model, by_alias=True)
+
+
+def json_pipeline(
+    model_cls: type[BaseModel],
+    transform: Callable[[Any], Any] | None = None,
+    *,
+    modes: Mapping[str, Mode] | None = None,
+    workers: Mapping[str, int] | None = None,
+    **options: Any,
+) -> Pipeline:
+    """``validate`` (``model_validate_json``), ``transform`` if given, and ``dump`` (``by_alias=True`` JSON bytes).
+
+    ``modes`` and ``workers`` are keyed by stage name; stages left out run inline, with one worker.
+    """
+    modes, workers = modes or {}, workers or {}
+    funcs: dict[str, Callable[[Any], Any]] = {"validate": model_cls.model_validate_json}
+    if transform is not None:
+        funcs["transform"] = transform
+    funcs["dump"] = dump_json
+    stages = [Stage(name, func, modes.get(name, "inline"), workers.get(name, 1)) for name, func in funcs.items()]
+    return Pipeline(stages, **options)
@@ -0,0 +1,323 @@
+"""Explain plans: what validating and serializing each field of a model involves, and what it is likely to cost.
+
+``explain(model_cls)`` walks the model's core schema, where aliases are already resolved (``AliasGenerator`` and
+``alias_priority`` applied, ``AliasChoices`` and ``AliasPath`` lowered to lists of paths), and prints one row per
+field:
+
+- the input paths validation tries, in order (``populate_by_name`` adding the field name last), how many there are
+  (the ``AliasChoices`` fan-out) and the deepest ``AliasPath``;
+- the serialization key;
+- the type, as the chain of core schemas (``default`` / ``nullable`` / ``list[...]`` / ...), and the Python validators
+  and serializers attached (``before``, ``after``, ``wrap``, ``plain``);
+- an estimated validation cost, in units of validating a plain ``str``, and its share of the model's total.
+
+Estimates come from a fixed table of per-schema weights (:data:`COSTS`), assume :data:`CONTAINER_ITEMS` items per
+container and add :data:`PYTHON_CALL` per Python function; they rank fields, they do not predict timings. Passing
+``samples`` (dicts or JSON documents) measures instead: each field is validated on its own, by a validator cut out of
+the model's schema (see :mod:`pydantic_notes.schema`), over every sample the model accepts, and the measured time
+replaces the share; the header counts the invalid samples left out. Isolated fields do not add up to the full model,
+which also builds the instance and runs model validators; the plan's header gives the full-model time for comparison.
+"""
+
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, TextIO
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import core_schema
+
+from pydantic_notes.aliases import InputPath
+from pydantic_notes.bench import measure
+from pydantic_notes.schema import fields_validator, model_fields_schema
+
+COSTS: dict[str, float] = {
+    "any": 0.5,
+    "none": 0.5,
+    "bool": 1.0,
+    "int": 1.0,
+    "float": 1.0,
+    "str": 1.0,
+    "bytes": 1.0,
+    "literal": 1.0,
+    "is-instance": 1.0,
+    "enum": 2.0,
+    "date": 3.0,
+    "time": 3.0,
+    "timedelta": 3.0,
+    "uuid": 3.0,
+    "datetime": 4.0,
+    "decimal": 4.0,
+    "url": 5.0,
+    "multi-host-url": 6.0,
+}
+DEFAULT_COST = 2.0
+CONTAINER_ITEMS = 5
+PYTHON_CALL = 5.0
+# Added per input path beyond the first, and per path segment beyond the first.
+EXTRA_PATH = 0.5
+EXTRA_SEGMENT = 0.25
+# Nested models are costed like fields; models referring back to themselves stop at this depth.
+MAX_DEPTH = 4
+
+type Payload = str | bytes | bytearray | Mapping[str, Any]
+
+_FUNCTION_KINDS = {
+    "function-before": "before",
+    "function-after": "after",
+    "function-wrap": "wrap",
+    "function-plain": "plain",
+}
+_CONTAINERS = ("list", "set", "frozenset", "generator")
+
+
+@dataclass
+class FieldPlan:
+    name: str
+    paths: tuple[InputPath, ...]
+    serialization_key: str
+    type: str
+    validators: list[str] = field(default_factory=list)
+    serializers: list[str] = field(default_factory=list)
+    cost: float = 0.0
+    measured: float | None = None
+
+    @property
+    def fan_out(self) -> int:
+        return len(self.paths)
+
+    @property
+    def depth(self) -> int:
+        return max((len(path) for path in self.paths), default=0)
+
+
+@dataclass
+class ModelPlan:
+    model_cls: type[BaseModel]
+    fields: list[FieldPlan]
+    model_validators: list[str] = field(default_factory=list)
+    computed_fields: dict[str, str] = field(default_factory=dict)
+    measured: float | None = None
+    invalid_samples: int = 0
+
+    @property
+    def cost(self) -> float:
+        return sum(plan.cost for plan in self.fields) + PYTHON_CALL * len(self.model_validators)
+
+    def __str__(self) -> str:
+        header = f"{self.model_cls.__name__}: estimated cost {self.cost:.1f}"
+        if self.measured is not None:
+            header += f", measured {self.measured * 1e6:.2f}us per sample (full model)"
+        if self.invalid_samples:
+            header += f", {self.invalid_samples} invalid sample(s) left out"
+        lines = [header]
+        if self.model_validators:
+            lines.append(f"  model validators: {', '.join(self.model_validators)}")
+        rows = [("field", "input paths", "n", "depth", "serialized as", "type", "python", "cost", "share")]
+        total = self.cost or 1.0
+        for plan in self.fields:
+            python = ", ".join([*plan.validators, *(f"ser:{kind}" for kind in plan.serializers)]) or "-"
+            if plan.measured is None:
+                share = f"{plan.cost / total:.0%}"
+            else:
+                share = f"{plan.measured * 1e6:.2f}us"
+            rows.append(
+                (
+                    plan.name,
+                    " | ".join(".".join(map(str, path)) for path in plan.paths),
+                    str(plan.fan_out),
+                    str(plan.depth),
+                    plan.serialization_key,
+                    plan.type,
+                    python,
+                    f"{plan.cost:.1f}",
+                    share,
+                )
+            )
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        lines.extend(
+            "  " + "  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True)) for row in rows
+        )
+        lines.extend(f"  computed {name}: serialized as {key}" for name, key in self.computed_fields.items())
+        return "\n".join(line.rstrip() for line in lines)
+
+
+def _paths(name: str, alias: Any, *, populate_by_name: bool) -> tuple[InputPath, ...]:
+    if alias is None:
+        return ((name,),)
+    if isinstance(alias, str):
+        paths = [(alias,)]
+    elif alias and isinstance(alias[0], list):
+        paths = [tuple(path) for path in alias]
+    else:
+        paths = [tuple(alias)]
+    if populate_by_name and (name,) not in paths:
+        paths.append((name,))
+    return tuple(paths)
+
+
+class _Walker:
+    def __init__(self, definitions: list[core_schema.CoreSchema]):
+        self._definitions = {definition["ref"]: definition for definition in definitions if "ref" in definition}
+
+    def describe(self, schema: Any, validators: list[str], depth: int = 0) -> tuple[str, float]:
+        """Type description and estimated cost of ``schema``; Python validators met on the way go to ``validators``."""
+        kind = schema["type"]
+        if kind in _FUNCTION_KINDS:
+            validators.append(_FUNCTION_KINDS[kind])
+            if kind == "function-plain":
+                return "plain", PYTHON_CALL
+            description, cost = self.describe(schema["schema"], validators, depth)
+            return description, cost + PYTHON_CALL
+        if kind == "definition-ref":
+            return self.describe(self._definitions[schema["schema_ref"]], validators, depth)
+        if kind == "definitions":
+            self._definitions.update({d["ref"]: d for d in schema["definitions"] if "ref" in d})
+            return self.describe(schema["schema"], validators, depth)
+        if kind == "default":
+            description, cost = self.describe(schema["schema"], validators, depth)
+            return f"{description} = default", cost
+        if kind == "nullable":
+            description, cost = self.describe(schema["schema"], validators, depth)
+            return f"{description} | None", cost + COSTS["none"]
+        if kind in _CONTAINERS:
+            if "items_schema" not in schema:
+                return kind, DEFAULT_COST
+            description, cost = self.describe(schema["items_schema"], [], depth)
+            return f"{kind}[{description}]", 1 + CONTAINER_ITEMS * cost
+        if kind == "dict":
+            key, key_cost = self.describe(schema.get("keys_schema", {"type": "any"}), [], depth)
+            value, value_cost = self.describe(schema.get("values_schema", {"type": "any"}), [], depth)
+            return f"dict[{key}, {value}]", 1 + CONTAINER_ITEMS * (key_cost + value_cost)
+        if kind == "tuple":
+            items = [self.describe(item, [], depth) for item in schema["items_schema"]]
+            return f"tuple[{', '.join(d for d, _ in items)}]", 1 + sum(c for _, c in items)
+        if kind == "union":
+            # Lax unions may try every choice before one succeeds.
+            choices = [self.describe(c[0] if isinstance(c, tuple) else c, [], depth) for c in schema["choices"]]
+            return " | ".join(d for d, _ in choices), sum(c for _, c in choices)
+        if kind == "tagged-union":
+            choices = [self.describe(c, [], depth) for c in schema["choices"].values()]
+            return " | ".join(d for d, _ in choices), 1 + max((c for _, c in choices), default=0)
+        if kind == "model":
+            name = schema["cls"].__name__
+            if depth >= MAX_DEPTH:
+                return name, DEFAULT_COST
+            fields = schema["schema"]
+            while fields["type"] != "model-fields":
+                fields = fields["schema"]
+            cost = sum(self.describe(f["schema"], [], depth + 1)[1] for f in fields["fields"].values())
+            return name, 1 + cost
+        if kind in ("lax-or-strict", "json-or-python"):
+            return self.describe(
+                schema["lax_schema" if kind == "lax-or-strict" else "python_schema"], validators, depth
+            )
+        if kind == "chain":
+            steps = [self.describe(step, validators, depth) for step in schema["steps"]]
+            return " -> ".join(d for d, _ in steps), sum(c for _, c in steps)
+        return kind, COSTS.get(kind, DEFAULT_COST)
+
+
+def _model_validators(model_cls: type[BaseModel]) -> list[str]:
+    return [decorator.info.mode for decorator in model_cls.__pydantic_decorators__.model_validators.values()]
+
+
+def _serializers(schema: Any) -> list[str]:
+    """Kinds of the field serializers found along ``schema``'s wrappers (``default``, ``nullable``, validators)."""
+    kinds = []
+    while isinstance(schema, dict):
+        serialization = schema.get("serialization")
+        if serialization is not None and serialization["type"] in ("function-plain", "function-wrap"):
+            kinds.append(_FUNCTION_KINDS[serialization["type"]])
+        schema = schema.get("schema")
+    return kinds
+
+
+def _measure(func: Any) -> float:
+    return measure(func, repeat=5, min_time=0.01).median
+
+
+def plan(model_cls: type[BaseModel], samples: Iterable[Payload] | None = None) -> ModelPlan:
+    """The plan :func:`explain` prints; measured when ``samples`` are given."""
+    fields_schema, definitions, config = model_fields_schema(model_cls)
+    walker = _Walker(definitions)
+    populate_by_name = bool(config.get("populate_by_name", False))
+    plans = []
+    for name, field_schema in fields_schema["fields"].items():
+        validators: list[str] = []
+        description, cost = walker.describe(field_schema["schema"], validators)
+        paths = _paths(name, field_schema.get("validation_alias"), populate_by_name=populate_by_name)
+        cost += EXTRA_PATH * (len(paths) - 1) + EXTRA_SEGMENT * sum(len(path) - 1 for path in paths)
+        serializers = _serializers(field_schema["schema"])
+        plans.append(
+            FieldPlan(
+                name=name,
+                paths=paths,
+                serialization_key=field_schema.get("serialization_alias", name),
+                type=description,
+                validators=validators,
+                serializers=serializers,
+                cost=cost,
+            )
+        )
+    computed = {
+        computed["property_name"]: computed.get("alias", computed["property_name"])
+        for computed in fields_schema.get("computed_fields", [])
+    }
+    model_plan = ModelPlan(model_cls, plans, _model_validators(model_cls), computed)
+    if samples is not None:
+        _measure_plan(model_plan, list(samples))
+    return model_plan
+
+
+def _is_valid(model_cls: type[BaseModel], sample: Payload) -> bool:
+    try:
+        if isinstance(sample, str | bytes | bytearray):
+            model_cls.model_validate_json(sample)
+        else:
+            model_cls.model_validate(sample)
+    except ValidationError:
+        return False
+    return True
+
+
+def _measure_plan(model_plan: ModelPlan, samples: list[Payload]) -> None:
+    """Measure on the samples the model accepts, counting the others as invalid."""
+    model_cls = model_plan.model_cls
+    valid = [sample for sample in samples if _is_valid(model_cls, sample)]
+    model_plan.invalid_samples = len(samples) - len(valid)
+    if not valid:
+        return
+    json_samples = [sample for sample in valid if isinstance(sample, str | bytes | bytearray)]
+    python_samples = [sample for sample in valid if not isinstance(sample, str | bytes | bytearray)]
+
+    def run(validate_python: Any, validate_json: Any) -> float:
+        def func() -> None:
+            # A field on its own may still fail where the model succeeds (``before`` model validators rewriting the
+            # input): the time spent failing counts.
+            for sample in python_samples:
+                try:
+                    validate_python(sample)
+                except ValidationError:
+                    pass
+            for sample in json_samples:
+                try:
+                    validate_json(sample)
+                except ValidationError:
+                    pass
+
+        return _measure(func) / len(valid)
+
+    model_plan.measured = run(model_cls.model_validate, model_cls.model_validate_json)
+    for field_plan in model_plan.fields:
+        validator = fields_validator(model_cls, frozenset((field_plan.name,)))
+        field_plan.measured = run(validator.validate_python, validator.validate_json)
+
+
+def explain(
+    model_cls: type[BaseModel], samples: Iterable[Payload] | None = None, *, file: TextIO | None = None
+) -> ModelPlan:
+    """Print the plan of ``model_cls`` (measured on ``samples``, if given) and return it."""
+    model_plan = plan(model_cls, samples)
+    print(model_plan, file=file or sys.stdout)
+    return model_plan
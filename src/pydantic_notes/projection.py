@@ -0,0 +1,67 @@
+"""Projection validation: validate only the fields a hot path reads.
+
+``validate_projection(model_cls, data, fields={...})`` validates ``data`` against a sub-model derived from
+``model_cls`` that declares the selected fields only, so the values of every other field are neither located nor
+validated (nor, for JSON input, built). Sub-models are derived once per ``(model, fields)`` and cached.
+
+The sub-model validates and serializes with the selected fields' entries cut out of ``model_cls``'s own core schema
+(see :mod:`pydantic_notes.schema`), so each field keeps its exact configuration: aliases resolved from
+``AliasGenerator`` and ``alias_priority``, ``AliasChoices`` and ``AliasPath``, field validators and field serializers.
+Model validators, model serializers and computed fields are left out, and keys of unselected fields are ignored
+whatever the model's ``extra`` setting.
+"""
+
+import copy
+from collections.abc import Iterable, Mapping
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, create_model
+from pydantic_core import SchemaSerializer, SchemaValidator, core_schema
+
+from pydantic_notes.schema import subset_schema
+
+
+@cache
+def projection_model(model_cls: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    unknown = fields - model_cls.model_fields.keys()
+    if unknown:
+        raise KeyError(sorted(unknown))
+    # The declared fields only serve ``model_fields`` (repr, introspection); the schema below replaces the one
+    # pydantic builds from them.
+    config = ConfigDict(**{key: value for key, value in model_cls.model_config.items() if key != "alias_generator"})
+    config["extra"] = "ignore"
+    names = sorted(fields)
+    projection = create_model(
+        f"{model_cls.__name__}Projection",
+        __config__=config,
+        __module__=model_cls.__module__,
+        **{name: (model_cls.model_fields[name].annotation, copy.copy(model_cls.model_fields[name])) for name in names},
+    )
+    schema, core_config = subset_schema(model_cls, names)
+    # The model serializer reads extra values off instances unless the config, not just the fields schema, ignores them.
+    core_config = {**core_config, "title": projection.__name__, "extra_fields_behavior": "ignore"}
+    if schema["type"] == "definitions":
+        model_schema = core_schema.model_schema(projection, schema["schema"], config=core_config)
+        schema = core_schema.definitions_schema(model_schema, schema["definitions"])
+    else:
+        schema = core_schema.model_schema(projection, schema, config=core_config)
+    projection.__pydantic_core_schema__ = schema
+    projection.__pydantic_validator__ = SchemaValidator(schema, core_config)
+    projection.__pydantic_serializer__ = SchemaSerializer(schema, core_config)
+    return projection
+
+
+def validate_projection(
+    model_cls: type[BaseModel],
+    data: str | bytes | bytearray | Mapping[str, Any],
+    fields: Iterable[str],
+    *,
+    strict: bool | None = None,
+    context: dict[str, Any] | None = None,
+) -> BaseModel:
+    """Validate ``data`` (a JSON document or a mapping) for ``fields`` only; returns a projection model instance."""
+    projection = projection_model(model_cls, frozenset(fields))
+    if isinstance(data, str | bytes | bytearray):
+        return projection.model_validate_json(data, strict=strict, context=context)
+    return projection.model_validate(data, strict=strict, context=context)
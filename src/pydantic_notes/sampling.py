@@ -0,0 +1,200 @@
+"""Sampled validation for trusted streams: validate some records, construct the rest.
+
+Pipelines fed by producers that already validate pay full validation for records that cannot fail. A
+:class:`SampledValidator` fully validates about one record in ``every`` (the gaps between samples are drawn uniformly
+around ``every``, so that periodic patterns upstream are not missed) and builds the others with a trusted,
+alias-aware construction: each field's value is looked up along its input paths (aliases, ``AliasChoices``,
+``AliasPath``, the field name under ``populate_by_name``; see :mod:`pydantic_notes.aliases`), nested model fields
+(optional or not) are constructed the same way, defaults fill in the missing fields, and the instance is built without
+validation (see :func:`pydantic_notes.codec.construct`). Records missing a required field are validated.
+
+A sampled record is also constructed, and its constructed twin compared with the validated model (field values,
+extra values and fields set). An :class:`Alert` is raised, through ``on_alert`` (by default, a warning logged by this
+module's logger), when the record fails validation (it is then dropped) or when the twins differ (the validated model
+is kept). Either way the interval between samples shrinks by :data:`BOOST`, down to every record, and grows back,
+doubling, after each :data:`RECOVERY` clean samples in a row.
+
+Construction keeps the input values as they are: producers must send what validation would yield (Python-mode
+values, e.g. ``model_dump(by_alias=True)``). Values needing conversion (JSON-mode strings for dates, lists of nested
+models, ...) make the twins differ, so the first sample after such drift reports it.
+"""
+
+import logging
+import random
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Literal
+
+from pydantic import BaseModel, ValidationError
+
+from pydantic_notes.aliases import MISSING, input_paths, resolve
+from pydantic_notes.codec import construct, optional_member
+
+logger = logging.getLogger(__name__)
+
+# Factor the sampling interval shrinks by after an alert.
+BOOST = 8
+# Clean samples in a row after which the interval doubles back towards ``every``.
+RECOVERY = 16
+
+
+@dataclass(frozen=True)
+class Alert:
+    model_cls: type[BaseModel]
+    index: int
+    kind: Literal["invalid", "mismatch"]
+    record: Mapping[str, Any]
+    error: ValidationError | None = None
+    fields: tuple[str, ...] = ()
+
+    def __str__(self) -> str:
+        if self.kind == "invalid":
+            return f"{self.model_cls.__name__}: sampled record {self.index} failed validation: {self.error}"
+        return f"{self.model_cls.__name__}: sampled record {self.index} constructs differently for {self.fields}"
+
+
+def _log_alert(alert: Alert) -> None:
+    logger.warning("%s", alert)
+
+
+def _nested_model(annotation: Any) -> type[BaseModel] | None:
+    annotation = optional_member(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+class TrustedBuilder:
+    """Alias-aware ``model_construct`` of raw input records; ``None`` when a required field is missing."""
+
+    def __init__(self, model_cls: type[BaseModel]):
+        self.model_cls = model_cls
+        paths = input_paths(model_cls)
+        self._fields = [
+            (name, paths[name], field, _nested_model(field.annotation))
+            for name, field in model_cls.model_fields.items()
+        ]
+
+        # Models whose fields all read one top-level key, none a nested model, take a shortcut when every key is there.
+        self._keys: list[tuple[str, str]] | None = None
+        if all(len(p) == 1 and len(p[0]) == 1 and isinstance(p[0][0], str) and not n for _, p, _, n in self._fields):
+            self._keys = [(name, path[0][0]) for name, path, _, _ in self._fields]
+        self._names = frozenset(model_cls.model_fields)
+
+    def build(self, record: Mapping[str, Any]) -> BaseModel | None:
+        if self._keys is not None:
+            try:
+                values = {name: record[key] for name, key in self._keys}
+            except KeyError:
+                pass
+            else:
+                return construct(self.model_cls, values, set(self._names))
+        values = {}
+        fields_set = set()
+        for name, paths, field, nested in self._fields:
+            value = resolve(record, paths)
+            if value is MISSING:
+                if field.is_required():
+                    return None
+                values[name] = field.get_default(call_default_factory=True)
+                continue
+            if nested is not None and isinstance(value, Mapping):
+                value = trusted_builder(nested).build(value)
+                if value is None:
+                    return None
+            values[name] = value
+            fields_set.add(name)
+        return construct(self.model_cls, values, fields_set)
+
+
+@cache
+def trusted_builder(model_cls: type[BaseModel]) -> TrustedBuilder:
+    return TrustedBuilder(model_cls)
+
+
+def differing_fields(constructed: BaseModel, validated: BaseModel) -> tuple[str, ...]:
+    """Fields whose values differ between the twins; ``__extra__`` and ``__fields_set__`` stand for the rest."""
+    fields = tuple(
+        name for name in validated.model_fields if constructed.__dict__.get(name) != validated.__dict__[name]
+    )
+    if constructed.__pydantic_extra__ != validated.__pydantic_extra__:
+        fields += ("__extra__",)
+    if constructed.__pydantic_fields_set__ != validated.__pydantic_fields_set__:
+        fields += ("__fields_set__",)
+    return fields
+
+
+class SampledValidator[M: BaseModel]:
+    def __init__(
+        self,
+        model_cls: type[M],
+        every: int = 100,
+        *,
+        on_alert: Callable[[Alert], None] | None = None,
+        seed: int | None = None,
+    ):
+        if every < 1:
+            raise ValueError(every)
+        self.model_cls = model_cls
+        self.every = every
+        self.interval = every
+        self.on_alert = on_alert or _log_alert
+        self._builder = trusted_builder(model_cls)
+        self._random = random.Random(seed)  # noqa: S311
+        self._countdown = self._gap()
+        self._clean_streak = 0
+        self.records = 0
+        self.sampled = 0
+        self.alerts = 0
+
+    def _gap(self) -> int:
+        """Records until the next sample: uniform on ``[1, 2 * interval - 1]``, ``interval`` on average."""
+        return self._random.randint(1, 2 * self.interval - 1)
+
+    def _alert(self, alert: Alert) -> None:
+        self.alerts += 1
+        self._clean_streak = 0
+        self.interval = max(1, self.interval // BOOST)
+        self._countdown = min(self._countdown, self._gap())
+        self.on_alert(alert)
+
+    def _clean(self) -> None:
+        self._clean_streak += 1
+        if self._clean_streak >= RECOVERY and self.interval < self.every:
+            self._clean_streak = 0
+            self.interval = min(self.every, self.interval * 2)
+
+    def _sample(self, index: int, record: Mapping[str, Any]) -> M | None:
+        self.sampled += 1
+        try:
+            validated = self.model_cls.model_validate(record)
+        except ValidationError as exc:
+            self._alert(Alert(self.model_cls, index, "invalid", record, error=exc))
+            return None
+        constructed = self._builder.build(record)
+        fields = differing_fields(constructed, validated) if constructed is not None else ("__required__",)
+        if fields:
+            self._alert(Alert(self.model_cls, index, "mismatch", record, fields=fields))
+        else:
+            self._clean()
+        return validated
+
+    def __call__(self, record: Mapping[str, Any]) -> M | None:
+        """The model for ``record``, or ``None`` for a sampled record failing validation."""
+        index = self.records
+        self.records += 1
+        self._countdown -= 1
+        if self._countdown <= 0:
+            self._countdown = self._gap()
+            return self._sample(index, record)
+        instance = self._builder.build(record)
+        if instance is None:
+            return self._sample(index, record)
+        return instance  # type: ignore[return-value]
+
+    def validate_many(self, records: Iterable[Mapping[str, Any]]) -> Iterator[M]:
+        for record in records:
+            instance = self(record)
+            if instance is not None:
+                yield instance
@@ -0,0 +1,71 @@
+"""Validators for a subset of a model's fields, cut out of the model's own core schema.
+
+Each ``model-field`` entry of a model's core schema already carries everything pydantic applies to that field: its
+validation alias (after ``AliasGenerator`` / ``alias_priority`` resolution, including ``AliasChoices`` and
+``AliasPath``), field validators, defaults and strictness. Keeping the entries of the selected fields, and the model's
+core config (``populate_by_name``, ``strict``, ...), yields a validator that behaves exactly like the model for those
+fields while ignoring every other key; in JSON mode, unused values are skipped by the parser rather than built.
+
+Model validators wrap the whole model and are left out.
+"""
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import CoreConfig, SchemaValidator, core_schema
+
+
+def _unwrap(schema: core_schema.CoreSchema, definitions: list[core_schema.CoreSchema]) -> core_schema.ModelSchema:
+    while schema["type"] != "model":
+        if schema["type"] == "definition-ref":
+            schema = next(d for d in definitions if d.get("ref") == schema["schema_ref"])
+        else:
+            # ``mode="after"`` / ``"wrap"`` model validators wrap the model schema.
+            schema = schema["schema"]
+    return schema
+
+
+def model_fields_schema(
+    model_cls: type[BaseModel],
+) -> tuple[core_schema.ModelFieldsSchema, list[core_schema.CoreSchema], CoreConfig]:
+    """The ``model-fields`` schema of ``model_cls``, the definitions it may refer to and the model's core config."""
+    schema = model_cls.__pydantic_core_schema__
+    definitions: list[core_schema.CoreSchema] = []
+    if schema["type"] == "definitions":
+        definitions = schema["definitions"]
+        schema = schema["schema"]
+    model_schema = _unwrap(schema, definitions)
+    fields_schema = model_schema["schema"]
+    while fields_schema["type"] != "model-fields":
+        # ``mode="before"`` model validators wrap the fields schema inside the model schema.
+        fields_schema = fields_schema["schema"]  # type: ignore[typeddict-item]
+    return fields_schema, definitions, model_schema.get("config", {})
+
+
+def subset_schema(model_cls: type[BaseModel], names: Iterable[str]) -> tuple[core_schema.CoreSchema, CoreConfig]:
+    fields_schema, definitions, config = model_fields_schema(model_cls)
+    subset: dict[str, Any] = {
+        **fields_schema,
+        "fields": {name: fields_schema["fields"][name] for name in names},
+        "computed_fields": [],
+        "extra_behavior": "ignore",
+    }
+    subset.pop("extras_schema", None)
+    if definitions:
+        return core_schema.definitions_schema(subset, definitions), config
+    return subset, config
+
+
+@cache
+def fields_validator(model_cls: type[BaseModel], names: frozenset[str]) -> SchemaValidator:
+    """Validate only ``names`` out of ``model_cls`` input.
+
+    Validation returns pydantic-core's ``model-fields`` triple: ``(values by field name, extra, fields set)``.
+    """
+    unknown = names - model_cls.model_fields.keys()
+    if unknown:
+        raise KeyError(sorted(unknown))
+    schema, config = subset_schema(model_cls, sorted(names))
+    return SchemaValidator(schema, config)
@@ -0,0 +1,343 @@
+"""Local asyncio ingestion server and load generator.
+
+Clients send length-prefixed frames (a 4-byte big-endian length followed by a JSON document). The server validates each
+frame against one alias model with ``model_validate_json`` and answers every frame, in order, with a one-byte status.
+
+Each connection gets a reader and a validator connected by a bounded queue: once validation falls behind and the queue
+is full, the reader stops pulling bytes off the socket and TCP flow control pushes back on the client.
+
+    python -m pydantic_notes.server serve --model plain_alias --port 8765
+    python -m pydantic_notes.server load --model plain_alias --port 8765 --frames 100000 --connections 4
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import struct
+import time
+from collections import deque
+from collections.abc import Sequence
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import cycle
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+STATUS_VALID = b"\x00"
+STATUS_INVALID = b"\x01"
+
+
+class FrameError(Exception):
+    pass
+
+
+class FrameTooLargeError(FrameError):
+    def __init__(self, size: int):
+        super().__init__(f"Frame of {size} bytes exceeds the {MAX_FRAME_SIZE} bytes limit")
+
+
+class TruncatedFrameError(FrameError):
+    def __init__(self):
+        super().__init__("Stream closed in the middle of a frame")
+
+
+def encode_frame(payload: bytes) -> bytes:
+    if len(payload) > MAX_FRAME_SIZE:
+        raise FrameTooLargeError(len(payload))
+    return HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes | None:
+    """Read one frame, or return ``None`` if the peer closed the stream between frames."""
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial:
+            raise TruncatedFrameError from exc
+        return None
+    (size,) = HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise FrameTooLargeError(size)
+    try:
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError as exc:
+        raise TruncatedFrameError from exc
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class IngestMetrics:
+    frames: int = 0
+    payload_bytes: int = 0
+    valid: int = 0
+    invalid: int = 0
+    stalls: int = 0
+    pending_high_water: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=10_000))
+
+    def record(self, size: int, *, valid: bool, latency: float) -> None:
+        self.frames += 1
+        self.payload_bytes += size
+        if valid:
+            self.valid += 1
+        else:
+            self.invalid += 1
+        self.latencies.append(latency)
+
+    def snapshot(self) -> dict[str, float]:
+        """Counters since start-up; latencies (receive to validated) cover the most recent frames only."""
+        elapsed = time.perf_counter() - self.started
+        latencies = list(self.latencies)
+        return {
+            "frames": self.frames,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "frames_per_s": self.frames / elapsed if elapsed else 0.0,
+            "mb_per_s": self.payload_bytes / elapsed / 1e6 if elapsed else 0.0,
+            "stalls": self.stalls,
+            "pending_high_water": self.pending_high_water,
+            "latency_p50_ms": _percentile(latencies, 0.5) * 1e3,
+            "latency_p99_ms": _percentile(latencies, 0.99) * 1e3,
+            "latency_max_ms": max(latencies, default=0.0) * 1e3,
+        }
+
+
+class IngestServer:
+    def __init__(
+        self,
+        model_cls: type[BaseModel],
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_pending: int = 1024,
+        flush_every: int = 64,
+    ):
+        self.model_cls = model_cls
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self.flush_every = flush_every
+        self.metrics = IngestMetrics()
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.metrics = IngestMetrics()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self, report_interval: float | None = None) -> None:
+        if self._server is None:
+            await self.start()
+        reporter = asyncio.create_task(self._report(report_interval)) if report_interval else None
+        try:
+            await self._server.serve_forever()
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+
+    async def _report(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            logger.info("ingest %s", json.dumps(self.metrics.snapshot()))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        queue: asyncio.Queue[tuple[bytes, float] | None] = asyncio.Queue(self.max_pending)
+        receiver = asyncio.create_task(self._receive(reader, queue))
+        try:
+            await self._validate(queue, writer)
+        finally:
+            # Validation stops early when the peer is gone; so does the receiver, or it would block on a full queue.
+            receiver.cancel()
+            await asyncio.wait([receiver])
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _receive(self, reader: asyncio.StreamReader, queue: asyncio.Queue[tuple[bytes, float] | None]) -> None:
+        try:
+            while (frame := await read_frame(reader)) is not None:
+                if queue.full():
+                    self.metrics.stalls += 1
+                await queue.put((frame, time.perf_counter()))
+                self.metrics.pending_high_water = max(self.metrics.pending_high_water, queue.qsize())
+        except (FrameError, ConnectionError) as exc:
+            logger.warning("Dropping connection: %s", exc)
+        await queue.put(None)
+
+    async def _validate(self, queue: asyncio.Queue[tuple[bytes, float] | None], writer: asyncio.StreamWriter) -> None:
+        processed = 0
+        while (item := await queue.get()) is not None:
+            frame, received = item
+            try:
+                self.model_cls.model_validate_json(frame)
+            except ValidationError:
+                valid = False
+            else:
+                valid = True
+            writer.write(STATUS_VALID if valid else STATUS_INVALID)
+            self.metrics.record(len(frame), valid=valid, latency=time.perf_counter() - received)
+            processed += 1
+            if queue.empty() or processed % self.flush_every == 0:
+                try:
+                    await writer.drain()
+                except ConnectionError as exc:
+                    logger.warning("Dropping connection: %s", exc)
+                    return
+                # Give the other connections (and this connection's reader) a turn.
+                await asyncio.sleep(0)
+
+
+@dataclass
+class LoadReport:
+    frames: int = 0
+    valid: int = 0
+    invalid: int = 0
+    payload_bytes: int = 0
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict[str, float]:
+        """Client-side view: latencies go from the frame being written to its status being read back."""
+        latencies = self.latencies
+        return {
+            "frames": self.frames,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "elapsed_s": self.elapsed,
+            "frames_per_s": self.frames / self.elapsed if self.elapsed else 0.0,
+            "mb_per_s": self.payload_bytes / self.elapsed / 1e6 if self.elapsed else 0.0,
+            "latency_p50_ms": statistics.median(latencies) * 1e3 if latencies else 0.0,
+            "latency_p99_ms": _percentile(latencies, 0.99) * 1e3,
+        }
+
+
+async def _drive_connection(host: str, port: int, payloads: Sequence[bytes], window: int, report: LoadReport) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    in_flight = asyncio.Semaphore(window)
+    sent_at: deque[float] = deque()
+
+    async def send() -> None:
+        for payload in payloads:
+            await in_flight.acquire()
+            sent_at.append(time.perf_counter())
+            writer.write(encode_frame(payload))
+            await writer.drain()
+
+    async def receive() -> None:
+        for payload in payloads:
+            status = await reader.readexactly(1)
+            report.latencies.append(time.perf_counter() - sent_at.popleft())
+            report.frames += 1
+            report.payload_bytes += len(payload)
+            if status == STATUS_VALID:
+                report.valid += 1
+            else:
+                report.invalid += 1
+            in_flight.release()
+
+    tasks = [asyncio.create_task(send()), asyncio.create_task(receive())]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # Once either side fails (the server hanging up, say) the other would wait forever on a window slot or a status.
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks)
+        writer.close()
+        with suppress(ConnectionError):
+            await writer.wait_closed()
+
+
+async def run_load(
+    host: str,
+    port: int,
+    payloads: Sequence[bytes],
+    *,
+    frames: int,
+    connections: int = 1,
+    window: int = 256,
+) -> LoadReport:
+    """Send ``frames`` frames, cycling through ``payloads``, over ``connections`` concurrent connections."""
+    source = cycle(payloads)
+    per_connection = [frames // connections + (i < frames % connections) for i in range(connections)]
+    batches = [[next(source) for _ in range(count)] for count in per_connection]
+    report = LoadReport()
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(_drive_connection(host, port, batch, window, report)) for batch in batches if batch]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def _load_payloads(model: str, path: Path | None) -> list[bytes]:
+    if path is None:
+        return [json.dumps(SAMPLE_PAYLOADS[model]).encode()]
+    with path.open("rb") as f:
+        return [line.rstrip(b"\r\n") for line in f if line.strip()]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pydantic_notes.server", description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name in ("serve", "load"):
+        sub = subparsers.add_parser(name)
+        sub.add_argument("--model", choices=sorted(ALIAS_MODELS), default="plain_alias")
+        sub.add_argument("--host", default="127.0.0.1")
+        sub.add_argument("--port", type=int, default=8765)
+    serve = subparsers.choices["serve"]
+    serve.add_argument("--max-pending", type=int, default=1024, help="per-connection queue bound")
+    serve.add_argument("--report-interval", type=float, default=1.0, help="seconds between metrics log lines")
+    load = subparsers.choices["load"]
+    load.add_argument("--frames", type=int, default=100_000)
+    load.add_argument("--connections", type=int, default=1)
+    load.add_argument("--window", type=int, default=256, help="max in-flight frames per connection")
+    load.add_argument("--input", type=Path, help="NDJSON file to take payloads from (default: the model's sample)")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+        server = IngestServer(ALIAS_MODELS[args.model], host=args.host, port=args.port, max_pending=args.max_pending)
+        try:
+            asyncio.run(server.serve_forever(report_interval=args.report_interval))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    payloads = _load_payloads(args.model, args.input)
+    report = asyncio.run(
+        run_load(args.host, args.port, payloads, frames=args.frames, connections=args.connections, window=args.window)
+    )
+    print(json.dumps(report.summary(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,218 @@
+"""Sharded NDJSON export in a process pool, with a manifest and a deterministic merge.
+
+``model_dump_json`` runs on one core. :func:`export` cuts a stream of models, or of raw validated rows (dicts of field
+values by field name, as in ``instance.__dict__``), into partitions of ``shard_size`` records and has a process pool
+serialize each into its own NDJSON shard, ``shard-00000.ndjson``, ``shard-00001.ndjson``, ... Every line is the
+record's ``model_dump_json(by_alias=...)`` output, produced as bytes straight from the model's serializer; raw rows
+are serialized without building instances (see :func:`row_serializer`), or rebuilt without validation when they miss
+fields or the model needs its instances. Either way they are meant to be rows that already went through validation;
+rows with keys other than field names (keyed by alias, say) are not, and go through ``model_validate`` first.
+Each shard is built in memory and written, and hashed, at once.
+
+At most ``2 * workers`` partitions are in flight, so memory stays bounded whatever the stream length. When every shard
+is written, ``manifest.json`` lists them in record order with their record ranges, sizes and SHA-256 checksums.
+:func:`merge` concatenates the shards in manifest order into a single file, byte-identical to a sequential export,
+after checking ranges and (optionally) checksums.
+
+The model class is sent to workers by reference, so it must be importable (module level).
+"""
+
+import hashlib
+import itertools
+import json
+import os
+from collections import deque
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import cache
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic import BaseModel
+from pydantic_core import SchemaSerializer, core_schema
+
+from pydantic_notes.codec import construct
+from pydantic_notes.schema import model_fields_schema
+
+MANIFEST = "manifest.json"
+
+# Merge copy buffer.
+CHUNK_SIZE = 1024 * 1024
+
+
+class ShardError(Exception):
+    pass
+
+
+class ChecksumMismatchError(ShardError):
+    def __init__(self, file: str):
+        super().__init__(f"{file} does not match its manifest checksum")
+
+
+class RangeGapError(ShardError):
+    def __init__(self, file: str, expected: int, found: int):
+        super().__init__(f"{file} starts at record {found}, expected {expected}")
+
+
+@dataclass(frozen=True)
+class Shard:
+    file: str
+    start: int
+    stop: int
+    size: int
+    sha256: str
+
+    @property
+    def records(self) -> int:
+        return self.stop - self.start
+
+
+@dataclass(frozen=True)
+class Manifest:
+    model: str
+    by_alias: bool
+    records: int
+    shards: list[Shard]
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2)
+
+    @classmethod
+    def from_json(cls, data: str) -> "Manifest":
+        raw = json.loads(data)
+        return cls(**{**raw, "shards": [Shard(**shard) for shard in raw["shards"]]})
+
+
+def shard_name(index: int) -> str:
+    return f"shard-{index:05d}.ndjson"
+
+
+@cache
+def row_serializer(model_cls: type[BaseModel]) -> SchemaSerializer | None:
+    """A serializer of raw rows, cut out of the model's core schema; ``None`` if the model needs its instances.
+
+    The ``model-fields`` part of a model's schema serializes a dict of values by field name exactly as the model
+    serializes its ``__dict__``, aliases included. Computed fields, field serializers and model serializers may read
+    the instance itself, so models using them get rows rebuilt as instances instead.
+    """
+    decorators = model_cls.__pydantic_decorators__
+    if model_cls.model_computed_fields or decorators.field_serializers or decorators.model_serializers:
+        return None
+    fields_schema, definitions, config = model_fields_schema(model_cls)
+    schema = core_schema.definitions_schema(fields_schema, definitions) if definitions else fields_schema
+    return SchemaSerializer(schema, config)
+
+
+def write_shard(
+    model_cls: type[BaseModel],
+    records: list[BaseModel] | list[Mapping[str, Any]],
+    path: str | os.PathLike[str],
+    start: int,
+    *,
+    by_alias: bool = True,
+) -> Shard:
+    """Serialize ``records`` to ``path``, one JSON document per line; runs in the worker processes."""
+    to_json = model_cls.__pydantic_serializer__.to_json
+    rows = row_serializer(model_cls)
+    fields = model_cls.model_fields.keys()
+    lines = []
+    for record in records:
+        if isinstance(record, BaseModel):
+            pass
+        elif record.keys() == fields:
+            if rows is not None:
+                lines.append(rows.to_json(record, by_alias=by_alias))
+                continue
+            record = construct(model_cls, dict(record), set(record))
+        elif record.keys() <= fields:
+            record = model_cls.model_construct(**record)
+        else:
+            record = model_cls.model_validate(record)
+        lines.append(to_json(record, by_alias=by_alias))
+    lines.append(b"")
+    data = b"\n".join(lines)
+    Path(path).write_bytes(data)
+    return Shard(
+        file=Path(path).name,
+        start=start,
+        stop=start + len(records),
+        size=len(data),
+        sha256=hashlib.sha256(data).hexdigest(),
+    )
+
+
+def _partitions(records: Iterable[Any], shard_size: int) -> Iterable[list[Any]]:
+    iterator = iter(records)
+    while batch := list(itertools.islice(iterator, shard_size)):
+        yield batch
+
+
+def export(
+    model_cls: type[BaseModel],
+    records: Iterable[BaseModel] | Iterable[Mapping[str, Any]],
+    out_dir: str | os.PathLike[str],
+    *,
+    shard_size: int = 100_000,
+    workers: int | None = None,
+    by_alias: bool = True,
+) -> Manifest:
+    """Write ``records`` as NDJSON shards plus ``manifest.json`` into ``out_dir``.
+
+    ``workers`` defaults to ``os.cpu_count()``; ``workers=0`` serializes in the calling process.
+    """
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    shards: list[Shard] = []
+    partitions = enumerate(_partitions(records, shard_size))
+    if workers == 0:
+        for index, batch in partitions:
+            shards.append(write_shard(model_cls, batch, out / shard_name(index), index * shard_size, by_alias=by_alias))
+    else:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: deque[Future[Shard]] = deque()
+            for index, batch in partitions:
+                path = out / shard_name(index)
+                pending.append(pool.submit(write_shard, model_cls, batch, path, index * shard_size, by_alias=by_alias))
+                # Partitions are submitted in order and collected in order, ``2 * workers`` at a time at most.
+                if len(pending) >= 2 * workers:
+                    shards.append(pending.popleft().result())
+            shards.extend(future.result() for future in pending)
+    manifest = Manifest(
+        model=f"{model_cls.__module__}.{model_cls.__qualname__}",
+        by_alias=by_alias,
+        records=sum(shard.records for shard in shards),
+        shards=shards,
+    )
+    tmp = out / f".{MANIFEST}.tmp"
+    tmp.write_text(manifest.to_json())
+    tmp.replace(out / MANIFEST)
+    return manifest
+
+
+def load_manifest(out_dir: str | os.PathLike[str]) -> Manifest:
+    return Manifest.from_json((Path(out_dir) / MANIFEST).read_text())
+
+
+def merge(out_dir: str | os.PathLike[str], fp: IO[bytes], *, verify: bool = True) -> Manifest:
+    """Concatenate the shards of ``out_dir`` into ``fp`` in record order.
+
+    A shard is checked while it is copied: on :class:`ShardError`, ``fp`` holds the output up to the faulty shard.
+    """
+    out = Path(out_dir)
+    manifest = load_manifest(out)
+    expected = 0
+    for shard in manifest.shards:
+        if shard.start != expected:
+            raise RangeGapError(shard.file, expected, shard.start)
+        expected = shard.stop
+        digest = hashlib.sha256()
+        with (out / shard.file).open("rb") as src:
+            while chunk := src.read(CHUNK_SIZE):
+                if verify:
+                    digest.update(chunk)
+                fp.write(chunk)
+        if verify and digest.hexdigest() != shard.sha256:
+            raise ChecksumMismatchError(shard.file)
+    return manifest
@@ -0,0 +1,344 @@
+"""Bulk loading of models into SQLite, with the standard library's ``sqlite3``.
+
+:func:`table_schema` derives a ``CREATE TABLE`` statement from a model: one column per field, in declaration order,
+named after the field or, with ``by_alias=True``, its serialization key (the key ``model_dump(by_alias=True)``
+writes), and typed after the field's kind (see :func:`pydantic_notes.codec.field_kind`): ``INTEGER`` for ``int`` and
+``bool``, ``REAL`` for ``float``, ``TEXT`` for ``str`` and, holding the field's own JSON serialization, for anything
+else. Fields that cannot be ``None`` are ``NOT NULL``.
+
+A :class:`SQLiteSink` streams models, or raw validated rows (dicts of field values by field name, as in
+``instance.__dict__``, or sequences already in column order), into that table. Insert parameters are read straight
+off the field values, with no ``model_dump`` per row (only ``json`` columns go through the field's serializer), and
+written ``batch_size`` rows at a time, one ``executemany`` and one transaction per batch. ``pragmas`` are set on the
+connection first; :data:`BULK_PRAGMAS` trade durability for speed, for loads that can be rerun from scratch. Pragma
+statements cannot take parameters, so names must be among :data:`PRAGMAS` and values integers or bare keywords.
+
+A :class:`SQLiteSource` reads them back from any cursor. Result columns are mapped to fields once, from the cursor's
+description: a column named after one of the keys the model accepts as input (aliases, ``AliasChoices`` keys, the
+field name under ``populate_by_name``; see :func:`pydantic_notes.aliases.input_paths`) feeds that field, and so does,
+failing that, a column named after the field or its serialization key, as :class:`SQLiteSink` writes them; other
+columns are ignored. Rows are fetched ``batch_size`` at a time with ``fetchmany`` and models yielded one by one, so
+memory stays bounded whatever the result size. ``INTEGER`` columns of ``bool`` fields become ``bool`` and ``json``
+columns are validated with the field's ``TypeAdapter`` in JSON mode; the rest is taken as SQLite returns it. Each row
+then goes through full validation, placed at each field's first input path, or, for tables the sink wrote from
+validated models, is trusted and constructed without validation (see :func:`pydantic_notes.codec.construct`), fields
+without a column taking their defaults.
+"""
+
+import itertools
+import re
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from functools import partial
+from operator import itemgetter
+from types import NoneType
+from typing import Any
+
+from pydantic import BaseModel
+
+from pydantic_notes.aliases import input_paths, place
+from pydantic_notes.codec import construct, field_adapter, field_kind, union_members
+
+DEFAULT_BATCH_SIZE = 10_000
+BULK_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": -64_000,
+}
+
+# Pragmas a sink may set: the bulk ones, and the other connection settings that tune loads.
+PRAGMAS = frozenset(
+    {
+        *BULK_PRAGMAS,
+        "automatic_index",
+        "busy_timeout",
+        "cache_spill",
+        "foreign_keys",
+        "locking_mode",
+        "mmap_size",
+        "page_size",
+        "wal_autocheckpoint",
+    }
+)
+_PRAGMA_KEYWORD = re.compile(r"[A-Za-z_]+")
+
+_COLUMN_TYPES = {"int": "INTEGER", "bool": "INTEGER", "float": "REAL", "str": "TEXT", "json": "TEXT"}
+
+type Row = Mapping[str, Any] | Sequence[Any]
+
+
+class UnsupportedPragmaError(ValueError):
+    def __init__(self, name: str, value: object):
+        super().__init__(f"Unsupported pragma {name} = {value!r}")
+
+
+class MissingColumnsError(ValueError):
+    def __init__(self, model_cls: type[BaseModel], fields: list[str]):
+        super().__init__(f"{model_cls.__name__}: no column for required fields {fields}")
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+    field: str
+    kind: str
+    nullable: bool
+
+    @property
+    def type(self) -> str:
+        return _COLUMN_TYPES[self.kind]
+
+
+def quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _nullable(annotation: Any) -> bool:
+    if annotation in (Any, None, NoneType):
+        return True
+    return NoneType in union_members(annotation)
+
+
+def columns(model_cls: type[BaseModel], *, by_alias: bool = False) -> list[Column]:
+    return [
+        Column(
+            name=(field.serialization_alias or name) if by_alias else name,
+            field=name,
+            kind=field_kind(field.annotation),
+            nullable=_nullable(field.annotation),
+        )
+        for name, field in model_cls.model_fields.items()
+    ]
+
+
+def table_schema(
+    model_cls: type[BaseModel], table: str | None = None, *, by_alias: bool = False, if_not_exists: bool = False
+) -> str:
+    """The ``CREATE TABLE`` statement for ``model_cls``, in a table named after the model by default."""
+    definitions = ", ".join(
+        f"{quote(column.name)} {column.type}{'' if column.nullable else ' NOT NULL'}"
+        for column in columns(model_cls, by_alias=by_alias)
+    )
+    exists = " IF NOT EXISTS" if if_not_exists else ""
+    return f"CREATE TABLE{exists} {quote(table or model_cls.__name__)} ({definitions})"
+
+
+def row_builder(model_cls: type[BaseModel]) -> Callable[[Mapping[str, Any]], Sequence[Any]]:
+    """Insert parameters, in column order, out of field values by field name (a model's ``__dict__`` or a raw row)."""
+    names = list(model_cls.model_fields)
+    if len(names) == 1:
+        name = names[0]
+
+        def getter(values: Mapping[str, Any]) -> Sequence[Any]:
+            return (values[name],)
+    else:
+        getter = itemgetter(*names)
+    to_json = [
+        (index, field_adapter(model_cls, name).serializer.to_json)
+        for index, (name, field) in enumerate(model_cls.model_fields.items())
+        if field_kind(field.annotation) == "json"
+    ]
+    if not to_json:
+        return getter
+
+    def build(values: Mapping[str, Any]) -> Sequence[Any]:
+        row = list(getter(values))
+        for index, serialize in to_json:
+            value = row[index]
+            if value is not None:
+                row[index] = serialize(value).decode()
+        return row
+
+    return build
+
+
+class SQLiteSink[M: BaseModel]:
+    """Stream models or raw rows of ``model_cls`` into ``table``, ``batch_size`` rows per transaction."""
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        model_cls: type[M],
+        table: str | None = None,
+        *,
+        by_alias: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        pragmas: Mapping[str, str | int] | None = None,
+        create: bool = True,
+    ):
+        if batch_size < 1:
+            raise ValueError(batch_size)
+        self.connection = connection
+        self.model_cls = model_cls
+        self.table = table or model_cls.__name__
+        self.columns = columns(model_cls, by_alias=by_alias)
+        self.batch_size = batch_size
+        self.insert_sql = (
+            f"INSERT INTO {quote(self.table)} ({', '.join(quote(column.name) for column in self.columns)}) "  # noqa: S608
+            f"VALUES ({', '.join('?' * len(self.columns))})"
+        )
+        self._row = row_builder(model_cls)
+        self._nulls = dict.fromkeys(model_cls.model_fields)
+        self.rows = 0
+        for name, value in (pragmas or {}).items():
+            if name not in PRAGMAS or not (
+                isinstance(value, int) or (isinstance(value, str) and _PRAGMA_KEYWORD.fullmatch(value))
+            ):
+                raise UnsupportedPragmaError(name, value)
+        for name, value in (pragmas or {}).items():
+            connection.execute(f"PRAGMA {name} = {value}")
+        if create:
+            with connection:
+                connection.execute(table_schema(model_cls, self.table, by_alias=by_alias, if_not_exists=True))
+
+    def params(self, record: M | Row) -> Sequence[Any]:
+        if isinstance(record, BaseModel):
+            return self._row(record.__dict__)
+        if not isinstance(record, Mapping):
+            return record
+        try:
+            return self._row(record)
+        except KeyError:
+            # Rows missing fields get their defaults, or NULL for required fields (which NOT NULL then rejects).
+            return self._row(self._nulls | self.model_cls.model_construct(**record).__dict__)
+
+    def write(self, records: Iterable[M | Row]) -> int:
+        """Insert ``records``, committing every ``batch_size`` rows; the number of rows written."""
+        written = 0
+        params = self.params
+        for batch in itertools.batched(records, self.batch_size):
+            with self.connection:
+                self.connection.executemany(self.insert_sql, [params(record) for record in batch])
+            written += len(batch)
+        self.rows += written
+        return written
+
+
+def load(
+    connection: sqlite3.Connection,
+    model_cls: type[BaseModel],
+    records: Iterable[BaseModel | Row],
+    table: str | None = None,
+    **options: Any,
+) -> int:
+    """Create ``table`` if needed and write ``records`` into it with a :class:`SQLiteSink`; rows written."""
+    return SQLiteSink(connection, model_cls, table, **options).write(records)
+
+
+def column_fields(model_cls: type[BaseModel], names: Sequence[str]) -> list[str | None]:
+    """The field each column feeds, by column position; ``None`` for columns no field reads."""
+    keys: dict[str, str] = {}
+    for name, paths in input_paths(model_cls).items():
+        for path in paths:
+            if len(path) == 1 and isinstance(path[0], str):
+                keys.setdefault(path[0], name)
+    for name, field in model_cls.model_fields.items():
+        keys.setdefault(name, name)
+        if field.serialization_alias is not None:
+            keys.setdefault(field.serialization_alias, name)
+    fields: list[str | None] = []
+    for column in names:
+        field_name = keys.get(column)
+        # A field fed by an earlier column keeps it.
+        fields.append(field_name if field_name not in fields else None)
+    return fields
+
+
+def _converter(model_cls: type[BaseModel], name: str) -> Callable[[Any], Any] | None:
+    kind = field_kind(model_cls.model_fields[name].annotation)
+    if kind == "bool":
+        return bool
+    if kind == "json":
+        return field_adapter(model_cls, name).validator.validate_json
+    return None
+
+
+class SQLiteSource[M: BaseModel]:
+    """Models of ``model_cls``, validated or trusted, out of the rows of ``cursor``, ``batch_size`` rows per fetch."""
+
+    def __init__(
+        self,
+        cursor: sqlite3.Cursor,
+        model_cls: type[M],
+        *,
+        validate: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        if batch_size < 1:
+            raise ValueError(batch_size)
+        self.cursor = cursor
+        self.model_cls = model_cls
+        self.validate = validate
+        self.batch_size = batch_size
+        self.names = [description[0] for description in cursor.description or ()]
+        self.fields = column_fields(model_cls, self.names)
+        mapped = [(index, name) for index, name in enumerate(self.fields) if name is not None]
+        self._mapped = [name for _, name in mapped]
+        self._getter = itemgetter(*(index for index, _ in mapped)) if len(mapped) > 1 else None
+        self._indices = [index for index, _ in mapped]
+        self._converters = [
+            (position, converter)
+            for position, (_, name) in enumerate(mapped)
+            if (converter := _converter(model_cls, name)) is not None
+        ]
+        self._defaults = [(name, field) for name, field in model_cls.model_fields.items() if name not in self._mapped]
+        if not validate:
+            if missing := [name for name, field in self._defaults if field.is_required()]:
+                raise MissingColumnsError(model_cls, missing)
+        self._fields_set = frozenset(self._mapped)
+        paths = input_paths(model_cls)
+        self._paths = [paths[name][0] for name in self._mapped]
+        self._keys = [path[0] for path in self._paths] if all(len(path) == 1 for path in self._paths) else None
+
+    def values(self, row: Sequence[Any]) -> list[Any]:
+        """Values of the mapped fields, in column order, out of one row."""
+        if self._getter is not None:
+            values = list(self._getter(row))
+        else:
+            values = [row[index] for index in self._indices]
+        for position, converter in self._converters:
+            value = values[position]
+            if value is not None:
+                values[position] = converter(value)
+        return values
+
+    def build(self, row: Sequence[Any]) -> M:
+        if not self.validate and self._getter is not None and not self._converters and not self._defaults:
+            return construct(
+                self.model_cls, dict(zip(self._mapped, self._getter(row), strict=True)), set(self._fields_set)
+            )
+        values = self.values(row)
+        if self.validate:
+            if self._keys is not None:
+                data = dict(zip(self._keys, values, strict=True))
+            else:
+                data = {}
+                for path, value in zip(self._paths, values, strict=True):
+                    place(data, path, value)
+            return self.model_cls.model_validate(data)
+        fields = dict(zip(self._mapped, values, strict=True))
+        for name, field in self._defaults:
+            fields[name] = field.get_default(call_default_factory=True)
+        return construct(self.model_cls, fields, set(self._fields_set))
+
+    def __iter__(self) -> Iterator[M]:
+        build = self.build
+        for rows in iter(partial(self.cursor.fetchmany, self.batch_size), []):
+            for row in rows:
+                yield build(row)
+
+
+def read[M: BaseModel](
+    connection: sqlite3.Connection,
+    model_cls: type[M],
+    table: str | None = None,
+    *,
+    sql: str | None = None,
+    parameters: Sequence[Any] | Mapping[str, Any] = (),
+    **options: Any,
+) -> Iterator[M]:
+    """Models out of ``table`` (named after the model by default), or out of the rows of ``sql``."""
+    cursor = connection.execute(sql or f"SELECT * FROM {quote(table or model_cls.__name__)}", parameters)  # noqa: S608
+    return iter(SQLiteSource(cursor, model_cls, **options))
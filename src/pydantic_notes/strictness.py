@@ -0,0 +1,165 @@
+"""Which fields ever need lax-mode coercion, and strict variants of models for those that do not.
+
+A :class:`CoercionProfiler` validates a sample of payloads (dicts or JSON documents) in lax mode, as the model does,
+and checks each valid payload against a copy of the model with every field ``strict=True``. A payload passing that
+copy needed no coercion at all; otherwise each field is checked on its own, with a validator cut out of the strict
+copy's schema (see :mod:`pydantic_notes.schema`), and the fields failing it are counted as coerced. Those validators
+leave model validators out, so fields fed by a ``mode="before"`` model validator count as coerced whenever the
+payload needed any coercion. Payloads invalid in lax mode are counted and left out.
+
+:meth:`CoercionProfiler.report` returns a :class:`CoercionReport`; its :meth:`~CoercionReport.strict_model` is
+:func:`strict_variant` of the fields that never coerced: a subclass of the model redeclaring them with
+``strict=True``. Redeclared fields keep their resolved aliases (``AliasGenerator`` and ``alias_priority`` included,
+``AliasChoices`` and ``AliasPath`` too); validators, serializers and config are inherited. pydantic does not take
+``strict=True`` on some field types (``list[int]``, ``dict[str, int]``, ...): those fields are reported as unsupported
+and stay lax.
+"""
+
+import copy
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Annotated, Any
+
+from pydantic import BaseModel, Strict, TypeAdapter, ValidationError, create_model
+
+from pydantic_notes.schema import fields_validator
+
+type Payload = str | bytes | bytearray | Mapping[str, Any]
+
+
+class StrictModeUnsupportedError(TypeError):
+    def __init__(self, model_cls: type[BaseModel], fields: frozenset[str]):
+        super().__init__(f"{model_cls.__name__}: no per-field strict mode for {', '.join(sorted(fields))}")
+
+
+@cache
+def accepts_strict(annotation: Any) -> bool:
+    """Whether pydantic takes ``Strict()`` on a field of type ``annotation`` (it does not on e.g. ``list[int]``)."""
+    try:
+        TypeAdapter(Annotated[annotation, Strict()])
+    except TypeError:
+        return False
+    return True
+
+
+def strict_capable_fields(model_cls: type[BaseModel]) -> frozenset[str]:
+    return frozenset(name for name, field in model_cls.model_fields.items() if accepts_strict(field.annotation))
+
+
+@cache
+def strict_variant[M: BaseModel](model_cls: type[M], fields: frozenset[str]) -> type[M]:
+    """Subclass of ``model_cls`` validating ``fields`` in strict mode."""
+    unknown = fields - model_cls.model_fields.keys()
+    if unknown:
+        raise KeyError(sorted(unknown))
+    incapable = fields - strict_capable_fields(model_cls)
+    if incapable:
+        raise StrictModeUnsupportedError(model_cls, incapable)
+    definitions: dict[str, Any] = {}
+    for name in sorted(fields):
+        strict = copy.copy(model_cls.model_fields[name])
+        strict.metadata = [*strict.metadata, Strict()]
+        # The aliases are already resolved: an inherited alias generator must not apply again.
+        strict.alias_priority = 2
+        definitions[name] = (strict.annotation, strict)
+    return create_model(  # type: ignore[call-overload]
+        f"{model_cls.__name__}Strict",
+        __base__=model_cls,
+        __module__=model_cls.__module__,
+        **definitions,
+    )
+
+
+@dataclass
+class CoercionReport:
+    model_cls: type[BaseModel]
+    samples: int
+    invalid: int
+    coerced: dict[str, int] = field(default_factory=dict)
+    unsupported: frozenset[str] = frozenset()
+
+    @property
+    def strict_fields(self) -> frozenset[str]:
+        """Fields no valid sample needed coercion for."""
+        return frozenset(name for name, count in self.coerced.items() if not count)
+
+    def strict_model(self) -> type[BaseModel]:
+        return strict_variant(self.model_cls, self.strict_fields)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "model": f"{self.model_cls.__module__}.{self.model_cls.__qualname__}",
+            "samples": self.samples,
+            "invalid": self.invalid,
+            "coerced": dict(self.coerced),
+            "strict_fields": sorted(self.strict_fields),
+            "unsupported": sorted(self.unsupported),
+        }
+
+    def __str__(self) -> str:
+        valid = self.samples - self.invalid
+        width = max((len(name) for name in self.model_cls.model_fields), default=0)
+        lines = [f"{self.model_cls.__name__}: {self.samples} samples, {self.invalid} invalid"]
+        for name in self.model_cls.model_fields:
+            if name in self.unsupported:
+                lines.append(f"  {name:<{width}}  {'lax':<6}  no per-field strict mode")
+                continue
+            count = self.coerced[name]
+            share = f"{count / valid:.1%}" if valid else "-"
+            lines.append(f"  {name:<{width}}  {'strict' if not count else 'lax':<6}  {count} coerced ({share})")
+        return "\n".join(lines)
+
+
+class CoercionProfiler:
+    def __init__(self, model_cls: type[BaseModel]):
+        self.model_cls = model_cls
+        capable = strict_capable_fields(model_cls)
+        self._strict_cls = strict_variant(model_cls, capable)
+        self.samples = 0
+        self.invalid = 0
+        self.coerced = {name: 0 for name in model_cls.model_fields if name in capable}
+        self.unsupported = frozenset(model_cls.model_fields.keys() - capable)
+
+    def observe(self, payload: Payload) -> None:
+        self.samples += 1
+        is_json = isinstance(payload, str | bytes | bytearray)
+        try:
+            if is_json:
+                self.model_cls.model_validate_json(payload)
+            else:
+                self.model_cls.model_validate(payload)
+        except ValidationError:
+            self.invalid += 1
+            return
+        try:
+            if is_json:
+                self._strict_cls.model_validate_json(payload)
+            else:
+                self._strict_cls.model_validate(payload)
+        except ValidationError:
+            pass
+        else:
+            return
+        for name in self.coerced:
+            validator = fields_validator(self._strict_cls, frozenset((name,)))
+            try:
+                if is_json:
+                    validator.validate_json(payload)
+                else:
+                    validator.validate_python(payload)
+            except ValidationError:
+                self.coerced[name] += 1
+
+    def observe_many(self, payloads: Iterable[Payload]) -> None:
+        for payload in payloads:
+            self.observe(payload)
+
+    def report(self) -> CoercionReport:
+        return CoercionReport(self.model_cls, self.samples, self.invalid, dict(self.coerced), self.unsupported)
+
+
+def profile_coercion(model_cls: type[BaseModel], payloads: Iterable[Payload]) -> CoercionReport:
+    profiler = CoercionProfiler(model_cls)
+    profiler.observe_many(payloads)
+    return profiler.report()
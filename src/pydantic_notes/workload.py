@@ -0,0 +1,153 @@
+"""Deterministic synthetic workloads shaped like the payloads in ``tests/aliasing``.
+
+Every record picks, per field, one of the input paths pydantic accepts (see :mod:`pydantic_notes.aliases`): plain
+alias keys, each ``AliasChoices`` variant, ``names`` lists for ``AliasPath`` and field-name keys under
+``populate_by_name``. A configurable share of records is broken the way the notes break them: a key the model does not
+accept (reported by pydantic as ``missing``) or a value of the wrong type. The same seed always yields the same stream,
+and streams are generated lazily, so they can be arbitrarily long.
+
+    python -m pydantic_notes.workload --model validation_alias_choices --count 1000000 --format ndjson > records.ndjson
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import count as counter
+from typing import Any, TextIO
+
+from pydantic import BaseModel
+from pydantic.alias_generators import to_camel, to_pascal
+
+from pydantic_notes.aliases import input_keys, input_paths, place
+from pydantic_notes.models import ALIAS_MODELS
+
+NAMES = ("Mickey", "Minnie", "Donald", "Daisy", "Goofy", "Pluto", "Scrooge", "Huey", "Dewey", "Louie")
+FORMATS = ("ndjson", "json", "csv")
+
+
+def _scalar(rng: random.Random, annotation: Any) -> Any:
+    if annotation is str:
+        return f"{rng.choice(NAMES)}{rng.randrange(10_000)}"
+    if annotation is bool:
+        return rng.random() < 0.5
+    if annotation is int:
+        return rng.randrange(-(2**31), 2**31)
+    if annotation is float:
+        return rng.uniform(-1e6, 1e6)
+    raise TypeError(annotation)
+
+
+class Workload:
+    def __init__(self, model_cls: type[BaseModel], *, seed: int = 0, invalid_ratio: float = 0.0):
+        if not 0.0 <= invalid_ratio <= 1.0:
+            raise ValueError(invalid_ratio)
+        for name, field in model_cls.model_fields.items():
+            if field.annotation not in (str, bool, int, float):
+                raise TypeError(name, field.annotation)
+        for paths in input_paths(model_cls).values():
+            if any(isinstance(item, int) and item < 0 for path in paths for item in path):
+                raise ValueError(paths)
+        self.model_cls = model_cls
+        self.seed = seed
+        self.invalid_ratio = invalid_ratio
+        self._paths = input_paths(model_cls)
+        accepted = input_keys(model_cls)
+        self._wrong_keys = {
+            name: next(
+                key for key in (name, to_camel(name), to_pascal(name), name.upper(), f"{name}_") if key not in accepted
+            )
+            for name in self._paths
+        }
+
+    @property
+    def keys(self) -> list[str]:
+        """Every top-level key a record may carry, including the keys used to break invalid records."""
+        return sorted(input_keys(self.model_cls) | set(self._wrong_keys.values()))
+
+    def labelled(self, count: int | None = None) -> Iterator[tuple[dict[str, Any], bool]]:
+        """Yield ``(record, is_valid)`` pairs; endless when ``count`` is ``None``."""
+        rng = random.Random(self.seed)  # noqa: S311
+        fields = self.model_cls.model_fields
+        for _ in counter() if count is None else range(count):
+            broken = rng.choice(list(fields)) if rng.random() < self.invalid_ratio else None
+            record: dict[str, Any] = {}
+            for name, paths in self._paths.items():
+                value = _scalar(rng, fields[name].annotation)
+                path = rng.choice(paths)
+                if name == broken:
+                    if rng.random() < 0.5:
+                        path = (self._wrong_keys[name],)
+                    else:
+                        value = None
+                place(record, path, value)
+            yield record, broken is None
+
+    def records(self, count: int | None = None) -> Iterator[dict[str, Any]]:
+        return (record for record, _ in self.labelled(count))
+
+
+def write_ndjson(records: Iterable[dict[str, Any]], fp: TextIO) -> int:
+    written = 0
+    for record in records:
+        fp.write(json.dumps(record))
+        fp.write("\n")
+        written += 1
+    return written
+
+
+def write_json_array(records: Iterable[dict[str, Any]], fp: TextIO) -> int:
+    written = 0
+    fp.write("[")
+    for record in records:
+        fp.write(",\n" if written else "\n")
+        fp.write(json.dumps(record))
+        written += 1
+    fp.write("\n]\n" if written else "]\n")
+    return written
+
+
+def write_csv(records: Iterable[dict[str, Any]], fp: TextIO, fieldnames: Sequence[str]) -> int:
+    """One column per top-level key: nested values (``AliasPath`` containers) are JSON-encoded, absent keys empty."""
+    writer = csv.DictWriter(fp, fieldnames=fieldnames, restval="")
+    writer.writeheader()
+    written = 0
+    for record in records:
+        writer.writerow(
+            {key: json.dumps(value) if isinstance(value, list | dict) else value for key, value in record.items()}
+        )
+        written += 1
+    return written
+
+
+def write(workload: Workload, fp: TextIO, *, fmt: str = "ndjson", count: int | None = None) -> int:
+    records = workload.records(count)
+    if fmt == "ndjson":
+        return write_ndjson(records, fp)
+    if fmt == "json":
+        return write_json_array(records, fp)
+    if fmt == "csv":
+        return write_csv(records, fp, workload.keys)
+    raise ValueError(fmt)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pydantic_notes.workload", description=__doc__.splitlines()[0])
+    parser.add_argument("--model", choices=sorted(ALIAS_MODELS), default="plain_alias")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--invalid-ratio", type=float, default=0.0)
+    parser.add_argument("--format", choices=FORMATS, default="ndjson")
+    parser.add_argument("--output", type=argparse.FileType("w"), default=sys.stdout)
+    args = parser.parse_args(argv)
+
+    workload = Workload(ALIAS_MODELS[args.model], seed=args.seed, invalid_ratio=args.invalid_ratio)
+    write(workload, args.output, fmt=args.format, count=args.count)
+    args.output.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
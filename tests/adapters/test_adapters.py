@@ -0,0 +1,105 @@
+import threading
+import time
+from typing import Annotated, Any, Literal
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+from pydantic_notes import adapters
+from pydantic_notes.adapters import DEFAULT_SHAPES, T, TypeAdapterRegistry
+from pydantic_notes.models import ALIAS_MODELS
+
+MODEL = ALIAS_MODELS["validation_alias_choices"]
+
+
+class TestTypeAdapterRegistry:
+    def test_should_share_adapters_per_type_and_config(self):
+        registry = TypeAdapterRegistry()
+        adapter = registry.get(list[MODEL])
+        assert registry.get(list[MODEL]) is adapter
+        assert adapter.validate_python([{"givenName": "Mickey"}]) == [MODEL(givenName="Mickey")]
+        strict = registry.get(dict[str, int], ConfigDict(strict=True))
+        assert strict is not registry.get(dict[str, int])
+        assert registry.get(dict[str, int], {"strict": True}) is strict
+        with pytest.raises(ValidationError):
+            strict.validate_python({"a": "1"})
+        stats = registry.stats
+        assert (stats.hits, stats.misses, stats.builds, stats.entries) == (2, 3, 3, 3)
+        assert stats.hit_ratio == pytest.approx(2 / 5)
+        assert stats.build_time > 0
+        assert stats.mean_build_time == pytest.approx(stats.build_time / 3)
+
+    def test_should_evict_the_least_recently_used(self):
+        registry = TypeAdapterRegistry(max_entries=2)
+        first = registry.get(list[int])
+        registry.get(list[str])
+        registry.get(list[int])
+        registry.get(list[float])
+        assert list[int] in registry
+        assert list[str] not in registry
+        assert registry.get(list[int]) is first
+        assert (registry.stats.evictions, len(registry)) == (1, 2)
+
+    def test_should_build_unhashable_types_every_time(self):
+        registry = TypeAdapterRegistry()
+        unhashable: Any = Annotated[int, []]
+        assert registry.get(unhashable) is not registry.get(unhashable)
+        assert (registry.stats.uncached, registry.stats.entries) == (2, 0)
+
+    def test_should_share_adapters_of_equal_field_annotations(self):
+        registry = TypeAdapterRegistry()
+        adapter = registry.get(Annotated[int, Field(gt=0)])
+        assert registry.get(Annotated[int, Field(gt=0)]) is adapter
+        assert registry.get(list[Annotated[int, Field(gt=0)]]) is registry.get(list[Annotated[int, Field(gt=0)]])
+        assert registry.get(Annotated[int, Field(gt=1)]) is not adapter
+        assert registry.get(Annotated[int, Field(gt=0), Field(lt=9)]) is not adapter
+        assert Annotated[int, Field(gt=0)] in registry
+        assert registry.get(Literal[1]) is not registry.get(Literal[True])
+        with pytest.raises(ValidationError):
+            registry.get(Annotated[int, Field(gt=1)]).validate_python(1)
+        assert (registry.stats.hits, registry.stats.misses) == (3, 6)
+
+    def test_should_build_once_for_concurrent_requests(self, monkeypatch: pytest.MonkeyPatch):
+        built = []
+
+        def slow_adapter(type_: Any, **kwargs: Any) -> TypeAdapter:
+            built.append(type_)
+            time.sleep(0.05)
+            return TypeAdapter(type_, **kwargs)
+
+        monkeypatch.setattr(adapters, "TypeAdapter", slow_adapter)
+        registry = TypeAdapterRegistry()
+        results: list[TypeAdapter] = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get(list[MODEL]))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert built == [list[MODEL]]
+        assert len({id(adapter) for adapter in results}) == 1
+        assert (registry.stats.misses, registry.stats.hits) == (1, 7)
+
+    def test_should_forget_failed_builds(self):
+        class Broken(BaseModel):
+            value: int
+
+        registry = TypeAdapterRegistry()
+        with pytest.raises(Exception, match="config"):
+            registry.get(Broken, ConfigDict(strict=True))
+        assert len(registry) == 0
+        with pytest.raises(Exception, match="config"):
+            registry.get(Broken, ConfigDict(strict=True))
+        assert registry.stats.misses == 2
+
+    def test_should_prebuild_registered_models(self):
+        registry = TypeAdapterRegistry()
+        models = list(ALIAS_MODELS.values())[:3]
+        built = registry.register(models, shapes=(*DEFAULT_SHAPES, T | None))
+        assert len(built) == 9
+        assert all(list[model] in registry and dict[str, model] in registry for model in models)
+        assert registry.get(models[0] | None) is built[2]
+        assert registry.stats.hits == 1
+
+    def test_should_reject_invalid_sizes(self):
+        with pytest.raises(ValueError, match="0"):
+            TypeAdapterRegistry(max_entries=0)
@@ -0,0 +1,62 @@
+import pytest
+
+from pydantic_notes.aliases import MISSING, input_keys, input_paths, lookup, resolve
+from pydantic_notes.models import ALIAS_MODELS
+
+
+class TestInputPaths:
+    @pytest.mark.parametrize(
+        "model, expected",
+        [
+            ("plain_alias", {"first_name": (("firstName",),)}),
+            ("serialization_alias", {"first_name": (("first_name",),)}),
+            ("validation_alias", {"first_name": (("firstName",),)}),
+            ("validation_alias_choices", {"first_name": (("firstName",), ("givenName",), ("preferredName",))}),
+            ("validation_alias_path", {"first_name": (("names", 0),), "last_name": (("names", 1),)}),
+            ("plain_and_validation_alias", {"first_name": (("firstName",),)}),
+            ("plain_alias_and_pop_by_name_config", {"first_name": (("firstName",), ("first_name",))}),
+            ("serialization_alias_and_pop_by_name_config", {"first_name": (("first_name",),)}),
+            (
+                "alias_generator_and_unset_priority",
+                {
+                    "first_name_pa": (("f_name_pa",),),
+                    "first_name_va": (("f_name_va",),),
+                    "first_name_sa": (("FIRST_NAME_SA",),),
+                },
+            ),
+            (
+                "alias_generator_and_priority_1",
+                {
+                    "first_name_pa": (("FIRST_NAME_PA",),),
+                    "first_name_va": (("FIRST_NAME_VA",),),
+                    "first_name_sa": (("FIRST_NAME_SA",),),
+                },
+            ),
+        ],
+    )
+    def test_should_resolve_effective_validation_aliases(self, model: str, expected: dict):
+        assert input_paths(ALIAS_MODELS[model]) == expected
+
+    def test_should_collect_top_level_keys(self):
+        assert input_keys(ALIAS_MODELS["validation_alias_path"]) == {"names"}
+        assert input_keys(ALIAS_MODELS["validation_alias_and_pop_by_name_config"]) == {"firstName", "first_name"}
+
+
+class TestLookup:
+    @pytest.mark.parametrize(
+        "data, path, expected",
+        [
+            ({"firstName": "Mickey"}, ("firstName",), "Mickey"),
+            ({"names": ["Mickey", "Mouse"]}, ("names", 1), "Mouse"),
+            ({"names": ["Mickey"]}, ("names", 1), MISSING),
+            ({"names": "Mickey"}, ("names", 0), MISSING),
+            ({"first_name": "Mickey"}, ("firstName",), MISSING),
+        ],
+    )
+    def test_should_follow_paths(self, data: dict, path: tuple, expected):
+        assert lookup(data, path) is expected or lookup(data, path) == expected
+
+    def test_should_resolve_first_matching_path(self):
+        paths = input_paths(ALIAS_MODELS["validation_alias_choices"])["first_name"]
+        assert resolve({"preferredName": "Mick", "givenName": "Mickey"}, paths) == "Mickey"
+        assert resolve({"name": "Mickey"}, paths) is MISSING
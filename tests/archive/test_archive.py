@@ -0,0 +1,133 @@
+import bz2
+import gzip
+import io
+import json
+import lzma
+import threading
+import zlib
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pydantic_notes.archive import ArchiveReader, detect_codec, read_archive
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload, write_ndjson
+
+MODEL = ALIAS_MODELS["validation_alias_choices"]
+COMPRESS = {"gzip": gzip.compress, "bz2": bz2.compress, "lzma": lzma.compress, "none": bytes}
+
+
+def _ndjson(count: int) -> bytes:
+    fp = io.StringIO()
+    write_ndjson(Workload(MODEL, seed=6).records(count), fp)
+    return fp.getvalue().encode()
+
+
+def _archive(tmp_path: Path, codec: str, data: bytes) -> Path:
+    path = tmp_path / f"records.{codec}"
+    path.write_bytes(COMPRESS[codec](data))
+    return path
+
+
+def _validated(data: bytes) -> list[BaseModel]:
+    return [MODEL.model_validate_json(line) for line in data.splitlines() if line.strip()]
+
+
+class TestArchiveReader:
+    @pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+    @pytest.mark.parametrize("codec", sorted(COMPRESS))
+    def test_should_validate_every_line(self, tmp_path: Path, codec: str, mode: str):
+        data = _ndjson(500)
+        path = _archive(tmp_path, codec, data)
+        reader = ArchiveReader(path, MODEL, mode=mode, chunk_size=1000, block_size=4000, max_pending=2)
+        assert reader.codec == codec
+        assert list(reader) == _validated(data)
+        stats = reader.stats
+        assert (stats.read.items, stats.decompress.items, stats.validate.items) == (path.stat().st_size, len(data), 500)
+        assert stats.blocks > 1
+        assert stats.bottleneck in ("read", "decompress", "validate")
+
+    @pytest.mark.parametrize("codec", ["gzip", "bz2", "lzma"])
+    def test_should_read_concatenated_members(self, tmp_path: Path, codec: str):
+        first, second = _ndjson(20), b"\n\n" + _ndjson(30)
+        path = tmp_path / "records"
+        path.write_bytes(COMPRESS[codec](first) + COMPRESS[codec](second))
+        reader = ArchiveReader(path, MODEL, mode="inline", chunk_size=64, block_size=100)
+        assert list(reader) == _validated(first + second)
+        assert reader.stats.blocks > 1
+
+    @pytest.mark.parametrize("mode", ["inline", "thread"])
+    @pytest.mark.parametrize("codec", ["gzip", "bz2", "lzma"])
+    def test_should_read_members_ending_at_chunk_boundaries(self, tmp_path: Path, codec: str, mode: str):
+        first, second = COMPRESS[codec](_ndjson(20)), COMPRESS[codec](_ndjson(30))
+        path = tmp_path / "records"
+        path.write_bytes(first + second)
+        reader = ArchiveReader(path, MODEL, mode=mode, chunk_size=len(first))
+        assert list(reader) == _validated(_ndjson(20) + _ndjson(30))
+
+    @pytest.mark.parametrize("chunk_size", [16, 1000, 100_000])
+    def test_should_skip_nul_padding_after_gzip_members(self, tmp_path: Path, chunk_size: int):
+        first, second = _ndjson(20), _ndjson(30)
+        path = tmp_path / "records.gz"
+        path.write_bytes(gzip.compress(first) + b"\0" * 1000 + gzip.compress(second) + b"\0" * 1000)
+        with gzip.open(path) as fp:
+            assert fp.read() == first + second
+        assert list(ArchiveReader(path, MODEL, mode="inline", chunk_size=chunk_size)) == _validated(first + second)
+
+    def test_should_reject_data_after_gzip_padding(self, tmp_path: Path):
+        path = tmp_path / "records.gz"
+        path.write_bytes(gzip.compress(_ndjson(20)) + b"\0" * 10 + b"garbage")
+        with pytest.raises(zlib.error):
+            list(ArchiveReader(path, MODEL, mode="inline"))
+
+    @pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+    @pytest.mark.parametrize("codec", ["gzip", "bz2", "lzma"])
+    def test_should_reject_truncated_archives(self, tmp_path: Path, codec: str, mode: str):
+        compressed = COMPRESS[codec](_ndjson(200))
+        path = tmp_path / "records"
+        path.write_bytes(compressed[: len(compressed) // 2])
+        with pytest.raises(EOFError):
+            list(ArchiveReader(path, MODEL, mode=mode, chunk_size=256))
+
+    def test_should_cut_blocks_at_newlines(self, tmp_path: Path):
+        data = b"".join(json.dumps({"givenName": "x" * i}).encode() + b"\n" for i in range(0, 300, 7))
+        reader = ArchiveReader(_archive(tmp_path, "none", data), MODEL, mode="inline", chunk_size=50, block_size=128)
+        assert list(reader) == _validated(data)
+
+    def test_should_read_a_last_line_without_newline(self, tmp_path: Path):
+        data = _ndjson(3).rstrip(b"\n")
+        assert len(list(read_archive(_archive(tmp_path, "gzip", data), MODEL))) == 3
+
+    def test_should_stop_the_producer_on_validation_errors(self, tmp_path: Path):
+        data = _ndjson(2000) + json.dumps({"unknown": 1}).encode() + b"\n" + _ndjson(2000)
+        path = _archive(tmp_path, "gzip", data)
+        threads = threading.active_count()
+        with pytest.raises(ValidationError):
+            list(read_archive(path, MODEL, chunk_size=256, max_pending=1))
+        assert threading.active_count() == threads
+
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    def test_should_stop_the_producer_when_closed_early(self, tmp_path: Path, mode: str):
+        path = _archive(tmp_path, "bz2", _ndjson(5000))
+        models = iter(ArchiveReader(path, MODEL, mode=mode, chunk_size=256, max_pending=1))
+        next(models)
+        threads = threading.active_count()
+        models.close()  # type: ignore[attr-defined]
+        assert threading.active_count() <= threads
+
+    def test_should_report_per_stage_throughput(self, tmp_path: Path):
+        reader = ArchiveReader(_archive(tmp_path, "lzma", _ndjson(100)), MODEL, mode="thread")
+        list(reader)
+        lines = str(reader.stats).splitlines()
+        assert lines[0].endswith(f"bottleneck: {reader.stats.bottleneck}")
+        assert [line.split()[0] for line in lines[1:]] == ["read", "decompress", "validate"]
+        assert reader.stats.validate.throughput > 0
+
+    def test_should_detect_codecs_by_magic_bytes(self, tmp_path: Path):
+        for codec in COMPRESS:
+            assert detect_codec(_archive(tmp_path, codec, b'{"a": 1}\n')) == codec
+
+    def test_should_reject_invalid_sizes(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="0"):
+            ArchiveReader(_archive(tmp_path, "none", b""), MODEL, chunk_size=0)
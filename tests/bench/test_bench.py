@@ -0,0 +1,128 @@
+import json
+
+import pytest
+
+from pydantic_notes import bench
+from pydantic_notes.bench import (
+    Measurement,
+    compare,
+    environment,
+    environment_differences,
+    gil_label,
+    load_results,
+    main,
+    measure,
+    save_results,
+    suite,
+)
+from pydantic_notes.models import ALIAS_MODELS
+
+
+def _measurement(median: float, spread: float = 0.0) -> Measurement:
+    return Measurement(median=median, spread=spread, runs=[median])
+
+
+class TestSuite:
+    def test_should_cover_every_alias_model_and_method(self):
+        names = {case.name for case in suite()}
+        assert len(names) == 4 * len(ALIAS_MODELS)
+        assert "validation_alias_choices/model_validate_json" in names
+        assert "validation_alias_path/model_dump_json" in names
+
+    def test_should_run_every_case(self):
+        for case in suite():
+            case.func()
+
+    def test_should_measure_per_call_time(self):
+        measurement = measure(lambda: None, repeat=3, min_time=0.001)
+        assert len(measurement.runs) == 3
+        assert 0 < measurement.median < 1e-3
+        assert measurement.spread >= 0
+
+
+class TestCompare:
+    @pytest.mark.parametrize(
+        "baseline, current, expected",
+        [
+            (_measurement(1.0), _measurement(1.05), False),
+            (_measurement(1.0), _measurement(1.5), True),
+            (_measurement(1.0, spread=0.1), _measurement(1.5, spread=0.1), False),
+            (_measurement(1.0), _measurement(0.5), False),
+        ],
+    )
+    def test_should_flag_regressions_beyond_threshold_and_noise(
+        self, baseline: Measurement, current: Measurement, expected: bool
+    ):
+        [comparison] = compare({"case": baseline}, {"case": current}, threshold=0.10)
+        assert comparison.regressed is expected
+
+    def test_should_narrow_the_noise_gate_with_more_runs(self):
+        few = Measurement(median=1.0, spread=0.1, runs=[1.0] * 4)
+        many = Measurement(median=1.0, spread=0.1, runs=[1.0] * 36)
+        current = Measurement(median=1.25, spread=0.1, runs=[1.25] * 4)
+        assert not compare({"case": few}, {"case": current})[0].regressed
+        assert compare({"case": many}, {"case": current})[0].regressed
+
+    def test_should_ignore_cases_missing_on_either_side(self):
+        assert compare({"a": _measurement(1.0)}, {"b": _measurement(1.0)}) == []
+
+    def test_should_round_trip_results(self, tmp_path):
+        results = {"case": Measurement(median=1.0, spread=0.1, runs=[0.9, 1.0, 1.1])}
+        save_results(tmp_path / "baseline.json", results)
+        assert load_results(tmp_path / "baseline.json") == results
+
+
+class TestCheck:
+    @pytest.mark.parametrize("baseline_median, expected_exit_code", [(1e-12, 1), (1.0, 0)])
+    def test_should_exit_non_zero_on_regression(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch, baseline_median: float, expected_exit_code: int
+    ):
+        # Fixed timings: the noise gate would otherwise depend on the spread of real measurements.
+        monkeypatch.setattr(bench, "run_suite", lambda cases, **_: {case.name: _measurement(1e-6) for case in cases})
+        baseline = tmp_path / "baseline.json"
+        save_results(baseline, {"plain_alias/model_validate": _measurement(baseline_median)})
+        argv = ["check", "--baseline", str(baseline), "--filter", "plain_alias/model_validate", "--repeat", "3"]
+        assert main([*argv, "--min-time", "0.001"]) == expected_exit_code
+
+    def test_should_warn_about_baselines_from_another_environment(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(bench, "run_suite", lambda cases, **_: {case.name: _measurement(1e-6) for case in cases})
+        baseline = tmp_path / "baseline.json"
+        save_results(baseline, {"plain_alias/model_validate": _measurement(1e-6)})
+        argv = ["check", "--baseline", str(baseline), "--filter", "plain_alias/model_validate"]
+        assert main(argv) == 0
+        assert "another environment" not in capsys.readouterr().err
+        document = json.loads(baseline.read_text())
+        document["environment"]["python"] = "3.0.0"
+        baseline.write_text(json.dumps(document))
+        assert main(argv) == 0
+        assert f"python: 3.0.0 != {environment()['python']}" in capsys.readouterr().err
+
+
+class TestEnvironment:
+    def test_should_label_the_interpreter(self):
+        assert environment()["gil"] in {"gil", "free-threaded", "free-threaded (gil re-enabled)"}
+
+    @pytest.mark.parametrize(
+        "build_flag, gil_enabled, expected",
+        [(0, True, "gil"), (1, False, "free-threaded"), (1, True, "free-threaded (gil re-enabled)")],
+    )
+    def test_should_tell_free_threaded_builds_apart(
+        self, monkeypatch, build_flag: int, gil_enabled: bool, expected: str
+    ):
+        monkeypatch.setattr("sysconfig.get_config_var", lambda name: build_flag if name == "Py_GIL_DISABLED" else None)
+        monkeypatch.setattr("sys._is_gil_enabled", lambda: gil_enabled, raising=False)
+        assert gil_label() == expected
+
+    def test_should_list_environment_differences(self):
+        current = environment()
+        assert environment_differences(current, current) == []
+        assert environment_differences({**current, "platform": "other"}, current) == []
+        recorded = {key: value for key, value in current.items() if key != "pydantic"}
+        assert environment_differences(recorded, current) == [f"pydantic: not recorded != {current['pydantic']}"]
+
+    def test_should_tell_baselines_of_another_gil_mode_apart(self):
+        current = environment()
+        recorded = {**current, "gil": "free-threaded" if current["gil"] == "gil" else "gil"}
+        assert environment_differences(recorded, current) == [f"gil: {recorded['gil']} != {current['gil']}"]
+        without_gil = {key: value for key, value in current.items() if key != "gil"}
+        assert environment_differences(without_gil, current) == [f"gil: not recorded != {current['gil']}"]
@@ -0,0 +1,132 @@
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationError, field_validator
+from pydantic_core import PydanticCustomError
+
+from pydantic_notes.cache import ENTRY_OVERHEAD, ValidationCache
+from pydantic_notes.models import ModelWithPlainAlias, ModelWithPlainAliasPopByName
+
+
+class FrozenModelWithPlainAlias(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    first_name: str = Field(alias="firstName")
+
+
+class ModelWithCustomError(BaseModel):
+    first_name: str = Field(alias="firstName")
+
+    @field_validator("first_name")
+    @classmethod
+    def reject(cls, value: str) -> str:
+        raise PydanticCustomError("not_mickey", "{name} is not Mickey", {"name": value})
+
+
+class TestValidationCache:
+    def test_should_validate_once_per_payload(self):
+        cache = ValidationCache()
+        first = cache.validate_json(ModelWithPlainAlias, b'{"firstName": "Mickey"}')
+        second = cache.validate_json(ModelWithPlainAlias, '{"firstName": "Mickey"}')
+        assert first == second == ModelWithPlainAlias(firstName="Mickey")
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_ratio == 0.5
+
+    def test_should_copy_mutable_models(self):
+        cache = ValidationCache()
+        first = cache.validate_json(ModelWithPlainAlias, b'{"firstName": "Mickey"}')
+        first.first_name = "Minnie"
+        assert cache.validate_json(ModelWithPlainAlias, b'{"firstName": "Mickey"}').first_name == "Mickey"
+
+    def test_should_copy_nested_values(self):
+        class ModelWithTags(BaseModel):
+            tags: list[str]
+            nested: dict[str, list[int]]
+
+        cache = ValidationCache()
+        first = cache.validate_json(ModelWithTags, b'{"tags": ["t"], "nested": {"a": [1]}}')
+        first.tags.append("LEAK")
+        first.nested["a"].append(2)
+        assert cache.validate_json(ModelWithTags, b'{"tags": ["t"], "nested": {"a": [1]}}') == ModelWithTags(
+            tags=["t"], nested={"a": [1]}
+        )
+
+    def test_should_copy_extra_values(self):
+        class ModelWithExtra(BaseModel):
+            model_config = ConfigDict(extra="allow")
+            name: str
+
+        cache = ValidationCache()
+        first = cache.validate_json(ModelWithExtra, b'{"name": "Mickey", "tags": ["t"]}')
+        first.tags.append("LEAK")
+        assert cache.validate_json(ModelWithExtra, b'{"name": "Mickey", "tags": ["t"]}').tags == ["t"]
+
+    def test_should_copy_private_attributes(self):
+        class ModelWithPrivate(BaseModel):
+            name: str
+            _seen: list[str] = PrivateAttr(default_factory=list)
+
+        cache = ValidationCache()
+        first = cache.validate_json(ModelWithPrivate, b'{"name": "Mickey"}')
+        first._seen.append("LEAK")
+        second = cache.validate_json(ModelWithPrivate, b'{"name": "Mickey"}')
+        assert second._seen == []
+        assert second.model_fields_set == {"name"}
+
+    def test_should_share_frozen_instances(self):
+        cache = ValidationCache()
+        first = cache.validate_json(FrozenModelWithPlainAlias, b'{"firstName": "Mickey"}')
+        assert cache.validate_json(FrozenModelWithPlainAlias, b'{"firstName": "Mickey"}') is first
+
+    def test_should_key_on_model_class_and_strictness(self):
+        cache = ValidationCache()
+        cache.validate_json(ModelWithPlainAlias, b'{"firstName": "Mickey"}')
+        cache.validate_json(ModelWithPlainAliasPopByName, b'{"firstName": "Mickey"}')
+        cache.validate_json(ModelWithPlainAlias, b'{"firstName": "Mickey"}', strict=True)
+        assert cache.stats.misses == 3
+
+    def test_should_cache_wrong_alias_errors(self):
+        cache = ValidationCache()
+        expected = [
+            {"type": "missing", "loc": ("firstName",), "msg": "Field required", "input": {"first_name": "Mickey"}}
+        ]
+        for _ in range(2):
+            with pytest.raises(ValidationError) as exc_info:
+                cache.validate_json(ModelWithPlainAlias, b'{"first_name": "Mickey"}')
+            assert exc_info.value.errors(include_url=False) == expected
+        assert (cache.stats.negative_hits, cache.stats.misses) == (1, 1)
+
+    def test_should_replay_custom_errors(self):
+        cache = ValidationCache()
+        errors = []
+        for _ in range(2):
+            with pytest.raises(ValidationError) as exc_info:
+                cache.validate_json(ModelWithCustomError, b'{"firstName": "Minnie"}')
+            errors.append(exc_info.value.errors(include_url=False))
+        assert errors[0][0]["msg"] == errors[1][0]["msg"] == "Minnie is not Mickey"
+        assert errors[1][0]["type"] == "not_mickey"
+        assert errors[1] == errors[0]
+        assert errors[1][0]["ctx"] == {"name": "Minnie"}
+
+    def test_should_evict_least_recently_used_entries(self):
+        cache = ValidationCache(max_entries=2)
+        payloads = [b'{"firstName": "Mickey"}', b'{"firstName": "Minnie"}', b'{"firstName": "Donald"}']
+        cache.validate_json(ModelWithPlainAlias, payloads[0])
+        cache.validate_json(ModelWithPlainAlias, payloads[1])
+        cache.validate_json(ModelWithPlainAlias, payloads[0])
+        cache.validate_json(ModelWithPlainAlias, payloads[2])
+        cache.validate_json(ModelWithPlainAlias, payloads[0])
+        cache.validate_json(ModelWithPlainAlias, payloads[1])
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (2, 4, 2)
+
+    def test_should_bound_cached_size(self):
+        payload = b'{"firstName": "Mickey"}'
+        cache = ValidationCache(max_size=2 * (len(payload) + ENTRY_OVERHEAD))
+        for name in ("Mickey", "Minnie", "Donald"):
+            cache.validate_json(ModelWithPlainAlias, f'{{"firstName": "{name}"}}')
+        assert len(cache) == 2
+        assert cache.stats.size <= cache.max_size
+
+    def test_should_clear(self):
+        cache = ValidationCache()
+        cache.validate_json(ModelWithPlainAlias, b'{"firstName": "Mickey"}')
+        cache.clear()
+        assert (len(cache), cache.stats.size) == (0, 0)
@@ -0,0 +1,155 @@
+import io
+from datetime import datetime
+from types import NoneType
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel, Field, PrivateAttr
+
+from pydantic_notes.codec import (
+    Decoder,
+    Encoder,
+    HeaderMismatchError,
+    NotACodecStreamError,
+    TruncatedStreamError,
+    construct,
+    dumps,
+    field_kind,
+    loads,
+    optional_member,
+    schema_header,
+    union_members,
+)
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload
+
+
+class Event(BaseModel):
+    name: str = Field(alias="eventName")
+    count: int = Field(alias="eventCount")
+    ratio: float | None = None
+    flag: bool = False
+    at: datetime = Field(alias="occurredAt")
+    tags: list[str] = Field(default_factory=list)
+
+
+EVENTS = [
+    Event(eventName="signup", eventCount=1, ratio=0.5, flag=True, occurredAt="2024-01-01T00:00:00", tags=["a"]),
+    Event(eventName="ünïcödé", eventCount=-(2**63), occurredAt="2024-01-02T12:30:00"),
+    Event(eventName="", eventCount=2**80, ratio=None, occurredAt="2024-01-03T00:00:00"),
+]
+
+
+def _models(model: str, count: int = 50) -> list[BaseModel]:
+    model_cls = ALIAS_MODELS[model]
+    return [model_cls.model_validate(record) for record in Workload(model_cls, seed=3).records(count)]
+
+
+class TestRoundTrip:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    @pytest.mark.parametrize("validate", [False, True])
+    def test_should_round_trip_every_alias_model(self, model: str, validate: bool):
+        model_cls = ALIAS_MODELS[model]
+        instances = _models(model)
+        decoded = loads(model_cls, dumps(model_cls, instances), validate=validate)
+        assert decoded == instances
+        assert [instance.model_dump_json(by_alias=True) for instance in decoded] == [
+            instance.model_dump_json(by_alias=True) for instance in instances
+        ]
+
+    @pytest.mark.parametrize("validate", [False, True])
+    def test_should_round_trip_packed_and_json_kinds(self, validate: bool):
+        decoded = loads(Event, dumps(Event, EVENTS), validate=validate)
+        assert decoded == EVENTS
+        assert all(
+            instance.model_fields_set == original.model_fields_set
+            for instance, original in zip(decoded, EVENTS, strict=True)
+        )
+
+    def test_should_yield_compact_records_in_field_order(self):
+        records = list(Decoder(Event, io.BytesIO(dumps(Event, EVENTS[:1]))).records())
+        assert records == [("signup", 1, 0.5, True, EVENTS[0].at, ["a"])]
+
+    def test_should_stream_from_file_objects(self, tmp_path):
+        path = tmp_path / "events.pnc"
+        with path.open("wb") as fp:
+            encoder = Encoder(Event, fp)
+            for event in EVENTS:
+                encoder.write(event)
+        with path.open("rb") as fp:
+            assert list(Decoder(Event, fp).models()) == EVENTS
+
+    def test_should_not_repeat_keys_per_record(self):
+        data = dumps(Event, EVENTS * 100)
+        assert data.count(b"eventName") == dumps(Event, []).count(b"eventName")
+        assert len(data) < sum(len(event.model_dump_json(by_alias=True)) + 1 for event in EVENTS * 100) * 2 / 3
+
+
+class TestConstruct:
+    def test_should_match_model_construct(self):
+        values = dict(EVENTS[0])
+        constructed = construct(Event, values, {"name", "count"})
+        assert constructed == Event.model_construct({"name", "count"}, **values)
+        assert constructed.model_fields_set == {"name", "count"}
+
+    def test_should_initialize_private_attributes(self):
+        class WithPrivate(BaseModel):
+            name: str
+            _seen: int = PrivateAttr(default=0)
+
+        assert construct(WithPrivate, {"name": "Mickey"}, {"name"})._seen == 0
+
+
+class TestHeader:
+    def test_should_map_field_indices_to_names_and_aliases(self):
+        header = schema_header(ALIAS_MODELS["plain_and_serialization_and_validation_alias"])
+        assert header["fields"] == [
+            {
+                "name": "first_name",
+                "alias": "f_name_a",
+                "validation_alias": "firstName",
+                "serialization_alias": "f_name_s",
+                "kind": "str",
+            }
+        ]
+
+    def test_should_describe_alias_path_and_choices(self):
+        header = schema_header(ALIAS_MODELS["validation_alias_path"])
+        assert "AliasPath" in header["fields"][0]["validation_alias"]
+
+    @pytest.mark.parametrize(
+        ("annotation", "kind"),
+        [(str, "str"), (int | None, "int"), (bool, "bool"), (float, "float"), (datetime, "json"), (int | str, "json")],
+    )
+    def test_should_classify_field_kinds(self, annotation, kind: str):
+        assert field_kind(annotation) == kind
+
+    @pytest.mark.parametrize(
+        ("annotation", "members", "member"),
+        [
+            (int | None, (int, NoneType), int),
+            (Optional[int], (int, NoneType), int),  # noqa: UP007
+            (int | str | None, (int, str, NoneType), int | str | None),
+            (list[int], (), list[int]),
+            (int, (), int),
+        ],
+    )
+    def test_should_unwrap_optional_annotations(self, annotation, members: tuple, member):
+        assert union_members(annotation) == members
+        assert optional_member(annotation) == member
+
+
+class TestErrors:
+    def test_should_reject_other_streams(self):
+        with pytest.raises(NotACodecStreamError):
+            Decoder(Event, io.BytesIO(b'{"eventName": "signup"}'))
+
+    def test_should_reject_header_of_another_model(self):
+        data = dumps(Event, EVENTS)
+        with pytest.raises(HeaderMismatchError):
+            Decoder(ALIAS_MODELS["plain_alias"], io.BytesIO(data))
+
+    def test_should_detect_truncated_records(self):
+        data = dumps(Event, EVENTS)
+        with pytest.raises(TruncatedStreamError):
+            loads(Event, data[:-3])
@@ -0,0 +1,120 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+from pydantic import BaseModel, Field
+
+from pydantic_notes.columnar import ColumnarBatch, pack, unpack, validate_to_shared
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload
+
+
+class Event(BaseModel):
+    name: str = Field(alias="eventName")
+    count: int = Field(alias="eventCount")
+    ratio: float | None = None
+    flag: bool = False
+    level: int = 0
+    at: datetime = Field(alias="occurredAt")
+    tags: list[str] = Field(default_factory=list)
+    note: str | None = None
+
+
+EVENTS = [
+    Event(eventName="signup", eventCount=1, ratio=0.5, flag=True, occurredAt="2024-01-01T00:00:00", tags=["a"]),
+    Event(eventName="ünïcödé", eventCount=-(2**63), level=2, occurredAt="2024-01-02T12:30:00", note="n"),
+    Event(eventName="", eventCount=2**80, ratio=None, occurredAt="2024-01-03T00:00:00"),
+]
+
+
+def _models(model: str, count: int = 40) -> list[BaseModel]:
+    model_cls = ALIAS_MODELS[model]
+    return [model_cls.model_validate(record) for record in Workload(model_cls, seed=4).records(count)]
+
+
+class TestRoundTrip:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_round_trip_every_alias_model(self, model: str):
+        instances = _models(model)
+        rebuilt = unpack(pack(ALIAS_MODELS[model], instances))
+        assert rebuilt == instances
+        assert [m.model_dump_json(by_alias=True) for m in rebuilt] == [
+            m.model_dump_json(by_alias=True) for m in instances
+        ]
+
+    def test_should_round_trip_every_column_kind(self):
+        rebuilt = unpack(pack(Event, EVENTS))
+        assert rebuilt == EVENTS
+        assert [m.model_fields_set for m in rebuilt] == [m.model_fields_set for m in EVENTS]
+
+    def test_should_round_trip_empty_batches(self):
+        assert unpack(pack(Event, [])) == []
+
+    def test_should_transfer_from_worker_processes(self):
+        model_cls = ALIAS_MODELS["validation_alias_path"]
+        payloads = list(Workload(model_cls, seed=4).records(40))
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            handle = pool.submit(validate_to_shared, model_cls, payloads).result()
+        assert unpack(handle) == [model_cls.model_validate(payload) for payload in payloads]
+
+
+class TestColumnarBatch:
+    def test_should_serve_zero_copy_columns_by_field_name(self):
+        with ColumnarBatch(pack(Event, EVENTS[:2])) as batch:
+            counts = batch.column("count")
+            assert isinstance(counts, memoryview)
+            assert counts.tolist() == [1, -(2**63)]
+            assert batch.column("flag").tolist() == [1, 0]
+            assert list(batch.column("name")) == ["signup", "ünïcödé"]
+            assert list(batch.column("at")) == [EVENTS[0].at, EVENTS[1].at]
+            assert list(batch.column("note")) == [None, "n"]
+            assert batch.validity("note").tolist() == [0, 1]
+            assert batch.validity("name") is None
+
+    def test_should_fall_back_to_json_for_values_beyond_fixed_width(self):
+        handle = pack(Event, EVENTS)
+        assert {column.name: column.kind for column in handle.columns}["count"] == "json"
+        with ColumnarBatch(handle) as batch:
+            assert list(batch.column("count")) == [1, -(2**63), 2**80]
+
+    def test_should_slice_text_and_json_columns(self):
+        with ColumnarBatch(pack(Event, EVENTS)) as batch:
+            names = batch.column("name")
+            assert names[1:] == list(names)[1:]
+            assert names[::-1] == list(names)[::-1]
+            assert batch.column("note")[:2] == [None, "n"]
+            assert names[-1] == list(names)[-1]
+            with pytest.raises(IndexError):
+                names[len(names)]
+
+    def test_should_yield_compact_records(self):
+        with ColumnarBatch(pack(Event, EVENTS[:1])) as batch:
+            assert list(batch.records()) == [("signup", 1, 0.5, True, 0, EVENTS[0].at, ["a"], None)]
+
+    def test_should_share_one_view_per_array(self):
+        with ColumnarBatch(pack(Event, EVENTS)) as batch:
+            assert batch.column("level") is batch.column("level")
+            list(batch.records())
+            views = len(batch._views)
+            for _ in range(3):
+                list(batch.records())
+                batch.column("name")
+                batch.validity("note")
+            assert len(batch._views) == views
+
+    def test_should_close_with_models_left_unread(self):
+        handle = pack(Event, EVENTS)
+        batch = ColumnarBatch(handle)
+        models = batch.models()
+        assert next(models) == EVENTS[0]
+        batch.unlink()
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=handle.shm_name)
+
+    def test_should_free_the_block_on_exit(self):
+        handle = pack(Event, EVENTS)
+        with ColumnarBatch(handle) as batch:
+            batch.column("count")
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=handle.shm_name)
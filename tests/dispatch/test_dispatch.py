@@ -0,0 +1,114 @@
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from pydantic_notes.dispatch import Dispatcher, NoRouteError, OverlappingSignaturesError, Signature
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+from pydantic_notes.workload import Workload
+
+# Alias models that no record shape can confuse with one another.
+DISTINCT = [
+    "plain_alias",
+    "serialization_alias",
+    "validation_alias_path",
+    "alias_generator_and_priority_1",
+    "alias_generator_and_unset_priority",
+]
+
+
+class Person(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    first_name: str = Field(alias="firstName")
+    last_name: str = Field(alias="lastName")
+    nickname: str | None = None
+
+
+class TestSignature:
+    def test_should_list_keys_supplying_each_required_field(self):
+        signature = Signature.of(ALIAS_MODELS["validation_alias_choices"])
+        assert len(signature.required) == 1
+        assert signature.required[0] == signature.accepted
+        assert "givenName" in signature.accepted
+
+    def test_should_include_field_names_under_populate_by_name(self):
+        signature = Signature.of(ALIAS_MODELS["plain_alias_and_pop_by_name_config"])
+        assert signature.required == (frozenset({"firstName", "first_name"}),)
+
+    def test_should_score_records(self):
+        signature = Signature.of(Person)
+        assert signature.required == (frozenset({"firstName"}), frozenset({"lastName"}))
+        assert signature.score(frozenset({"firstName", "lastName", "nickname"})) == 3
+        assert signature.score(frozenset({"firstName"})) is None
+        assert signature.score(frozenset({"firstName", "lastName", "age"})) is None
+
+
+class TestDispatcher:
+    def test_should_route_every_sample_to_its_model(self):
+        dispatcher = Dispatcher(ALIAS_MODELS[model] for model in DISTINCT)
+        for model in DISTINCT:
+            assert dispatcher.route(SAMPLE_PAYLOADS[model]) is ALIAS_MODELS[model]
+            assert dispatcher.validate(SAMPLE_PAYLOADS[model]) == ALIAS_MODELS[model].model_validate(
+                SAMPLE_PAYLOADS[model]
+            )
+
+    def test_should_match_try_each_validation_on_valid_records(self):
+        dispatcher = Dispatcher(ALIAS_MODELS[model] for model in DISTINCT)
+        for model in DISTINCT:
+            for record in Workload(ALIAS_MODELS[model], seed=5).records(50):
+                assert type(dispatcher.validate(record)) is ALIAS_MODELS[model]
+
+    def test_should_prefer_the_model_accepting_most_keys(self):
+        dispatcher = Dispatcher([ALIAS_MODELS["plain_alias"], Person])
+        assert dispatcher.route({"firstName": "Mickey", "lastName": "Mouse"}) is Person
+        assert dispatcher.route({"firstName": "Mickey", "lastName": "Mouse", "age": 95}) is ALIAS_MODELS["plain_alias"]
+        assert dispatcher.route({"firstName": "Mickey"}) is ALIAS_MODELS["plain_alias"]
+
+    def test_should_memoize_routes_per_key_set(self):
+        dispatcher = Dispatcher(ALIAS_MODELS[model] for model in DISTINCT)
+        for _ in range(3):
+            dispatcher.route({"firstName": "Mickey"})
+            dispatcher.route({"names": ["Mickey"]})
+        assert len(dispatcher._routes) == 2
+
+    def test_should_raise_without_route(self):
+        dispatcher = Dispatcher(ALIAS_MODELS[model] for model in DISTINCT)
+        assert dispatcher.route({"givenName": "Mickey"}) is None
+        with pytest.raises(NoRouteError, match="givenName"):
+            dispatcher.validate({"givenName": "Mickey"})
+
+    def test_should_leave_values_to_validation(self):
+        dispatcher = Dispatcher(ALIAS_MODELS[model] for model in DISTINCT)
+        with pytest.raises(ValidationError):
+            dispatcher.validate({"names": []})
+
+
+class TestOverlaps:
+    @pytest.mark.parametrize(
+        ("extra", "overlapping"),
+        [
+            (
+                "alias_generator_and_priority_2",
+                ("alias_generator_and_unset_priority", "alias_generator_and_priority_2"),
+            ),
+            ("validation_alias_choices", ("plain_alias", "validation_alias_choices")),
+            ("plain_alias_and_pop_by_name_config", ("plain_alias", "plain_alias_and_pop_by_name_config")),
+            ("validation_alias", ("plain_alias", "validation_alias")),
+        ],
+    )
+    def test_should_report_overlapping_signatures(self, extra: str, overlapping: tuple[str, str]):
+        models = [ALIAS_MODELS[model] for model in [*DISTINCT, extra]]
+        with pytest.raises(OverlappingSignaturesError) as excinfo:
+            Dispatcher(models)
+        assert {ALIAS_MODELS[overlapping[0]], ALIAS_MODELS[overlapping[1]]} <= {
+            model for overlap in excinfo.value.overlaps for model in overlap[:2]
+        }
+
+    def test_should_route_ties_to_first_model_when_allowed(self):
+        dispatcher = Dispatcher(
+            [ALIAS_MODELS["plain_alias"], ALIAS_MODELS["validation_alias"]],
+            allow_overlaps=True,
+        )
+        assert dispatcher.overlaps
+        assert dispatcher.route({"firstName": "Mickey"}) is ALIAS_MODELS["plain_alias"]
+
+    def test_should_not_report_models_told_apart_by_extra_keys(self):
+        assert not Dispatcher([ALIAS_MODELS["plain_alias"], Person]).overlaps
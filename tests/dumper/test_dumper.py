@@ -0,0 +1,128 @@
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, RootModel, computed_field, field_serializer, model_serializer
+
+from pydantic_notes import dumper
+from pydantic_notes.dumper import compile_dumper
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload
+
+
+class Address(BaseModel):
+    city: str = Field(alias="cityName")
+    zip_code: str = Field(alias="zipCode")
+
+
+class Person(BaseModel):
+    first_name: str = Field(alias="firstName")
+    last_name: str = Field(default="Mouse", alias="lastName")
+    address: Address | None = None
+    secret: str = Field(default="s", exclude=True)
+
+    @field_serializer("first_name")
+    def shout(self, value: str) -> str:
+        return value.upper()
+
+    @computed_field(alias="fullName")
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+
+
+class Employee(Person):
+    badge: int = 0
+
+
+class Node(BaseModel):
+    name: str
+    children: list["Node"] = Field(default_factory=list)
+
+
+class Open(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    name: str
+
+
+class Custom(BaseModel):
+    name: str
+
+    @model_serializer(mode="wrap")
+    def wrap(self, handler: Any) -> dict:
+        return {**handler(self), "kind": "custom"}
+
+
+PERSON = Person(firstName="Mickey", address=Address(cityName="Toontown", zipCode="00001"))
+
+MASKS = [
+    {},
+    {"include": {"first_name"}},
+    {"include": {"first_name", "full_name", "unknown"}},
+    {"exclude": {"address", "full_name"}},
+    {"include": {"first_name": True, "address": ...}, "exclude": {"first_name"}},
+    {"include": set()},
+]
+
+
+def _generic(instance: BaseModel, **kwargs: Any) -> str:
+    return instance.model_dump_json(**kwargs)
+
+
+class TestCompileDumper:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    @pytest.mark.parametrize("by_alias", [False, True])
+    @pytest.mark.parametrize("mask", [{}, {"include": {"first_name"}}, {"exclude": {"first_name"}}])
+    def test_should_match_model_dump_json_on_alias_models(self, model: str, by_alias: bool, mask: dict):
+        model_cls = ALIAS_MODELS[model]
+        dump = compile_dumper(model_cls, by_alias=by_alias, **mask)
+        for record in Workload(model_cls, seed=6).records(10):
+            instance = model_cls.model_validate(record)
+            assert dump(instance) == _generic(instance, by_alias=by_alias, **mask)
+
+    @pytest.mark.parametrize("mask", MASKS)
+    @pytest.mark.parametrize("by_alias", [False, True])
+    def test_should_match_with_serializers_and_computed_fields(self, mask: dict, by_alias: bool):
+        assert compile_dumper(Person, by_alias=by_alias, **mask)(PERSON) == _generic(PERSON, by_alias=by_alias, **mask)
+
+    @pytest.mark.parametrize(
+        ("instance", "mask"),
+        [
+            (PERSON, {"include": {"first_name": True, "address": {"city"}}}),
+            (PERSON, {"exclude": {"address": {"zip_code"}}}),
+            (Node(name="a", children=[Node(name="b")]), {"exclude": {"children"}}),
+            (Node(name="a", children=[Node(name="b")]), {"include": {"name"}}),
+            (Open(name="a", extra_key=1), {"exclude": {"extra_key"}}),
+            (Custom(name="a"), {"include": {"name"}}),
+            (RootModel[list[int]]([1, 2]), {"exclude": {0}}),
+        ],
+    )
+    def test_should_keep_the_generic_path_for_other_shapes(self, instance: BaseModel, mask: dict):
+        assert compile_dumper(type(instance), by_alias=True, **mask)(instance) == _generic(
+            instance, by_alias=True, **mask
+        )
+
+    def test_should_dump_subclass_instances_as_themselves(self):
+        employee = Employee(firstName="Goofy", badge=7)
+        dump = compile_dumper(Person, exclude={"address"})
+        assert dump(employee) == _generic(employee, exclude={"address"})
+        assert "badge" in dump(employee)
+
+    def test_should_cache_dumpers_per_shape(self):
+        include = {"first_name"}
+        dump = compile_dumper(Person, by_alias=True, include=include)
+        assert compile_dumper(Person, by_alias=True, include={"first_name"}) is dump
+        assert compile_dumper(Person, by_alias=True, include={"first_name": True}) is not dump
+        assert compile_dumper(Person, include=include) is not dump
+        include.add("last_name")
+        assert dump(PERSON) == '{"firstName":"MICKEY"}'
+
+    def test_should_keep_the_most_recently_used_dumpers(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(dumper, "MAX_DUMPERS", 2)
+        monkeypatch.setattr(dumper, "_DUMPERS", type(dumper._DUMPERS)())
+        first = compile_dumper(Person, include={"first_name"})
+        second = compile_dumper(Person, include={"last_name"})
+        assert compile_dumper(Person, include={"first_name"}) is first
+        compile_dumper(Person, exclude={"address"})
+        assert len(dumper._DUMPERS) == 2
+        assert compile_dumper(Person, include={"first_name"}) is first
+        assert compile_dumper(Person, include={"last_name"}) is not second
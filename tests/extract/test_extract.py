@@ -0,0 +1,128 @@
+import json
+
+import pytest
+from pydantic import AliasPath, BaseModel, Field, ValidationError
+
+from pydantic_notes.extract import ExtractError, compile_paths, extractor, validate_extracted
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+
+KEYS = ["firstName", "first_name", "FirstName", "f_name", "f_name_a", "f_name_s", "givenName", "preferredName"]
+
+NOISE = {
+    "blob": {"nested": [{"a": [1, 2, {"b": "}]{["}]}, 'quote " and \\ backslash'], "empty": {}, "list": []},
+    "numbers": list(range(50)),
+    "flags": [True, False, None, -1.5e3],
+}
+
+
+def _documents(model: str) -> list[str]:
+    inputs = [SAMPLE_PAYLOADS[model], *({key: "Mickey"} for key in KEYS), {"names": ["Mickey"]}, {}]
+    documents = []
+    for data in inputs:
+        documents.append(json.dumps(data))
+        documents.append(json.dumps({**NOISE, **data, "tail": NOISE}, indent=2))
+    return documents
+
+
+def _outcome(validate, document):
+    try:
+        return validate(document), None
+    except ValidationError as exc:
+        return None, exc.errors(include_url=False)
+
+
+class Names(BaseModel):
+    first_name: str = Field(validation_alias=AliasPath("names", 0))
+    last_name: str = Field(validation_alias=AliasPath("names", 2))
+    city: str = Field(validation_alias=AliasPath("address", "city"))
+
+
+class TestValidateExtracted:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_match_full_validation(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        for document in _documents(model):
+            assert _outcome(lambda d: validate_extracted(model_cls, d), document) == _outcome(
+                model_cls.model_validate_json, document
+            )
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            '{"names": ["Mickey", {"x": [1]}, "Mouse", "extra"], "address": {"zip": "}", "city": "Toontown"}}',
+            '{"address": {"city": "Toontown"}, "names": ["Mickey", "Minnie"]}',
+            '{"address": {"city": 1}, "names": "Mickey"}',
+            '{"address": [], "names": []}',
+            '{"names": ["Mickey", null, "Mouse"], "address": {"city": "Toontown", "city": "Duckburg"}}',
+            '{"n\\u0061mes": ["Mickey", 0, "Mouse"], "address": {"city": "Toontown"}}',
+            '["Mickey"]',
+            '{"names": ["Mickey", ',
+            '{"names" ["Mickey"]}',
+            "",
+        ],
+    )
+    def test_should_match_full_validation_for_alias_paths(self, document: str):
+        assert _outcome(lambda d: validate_extracted(Names, d), document) == _outcome(
+            Names.model_validate_json, document
+        )
+
+    def test_should_accept_bytes(self):
+        document = '{"names": ["Mickey", 0, "Mouse"], "address": {"city": "Töontown"}}'.encode()
+        assert validate_extracted(Names, document) == Names.model_validate_json(document)
+
+
+class TestExtractor:
+    def test_should_share_containers_between_paths(self):
+        trie = compile_paths([("names", 0), ("names", 2), ("address", "city"), ("address",)])
+        assert trie.keys() == {"names", "address"}
+        assert trie["names"].keys() == {0, 2}
+        assert not isinstance(trie["address"], dict)
+
+    def test_should_copy_only_referenced_paths(self):
+        document = json.dumps({**NOISE, "names": ["Mickey", NOISE, "Mouse", NOISE], "address": {**NOISE, "city": "T"}})
+        extracted = extractor(Names).extract(document)
+        assert json.loads(extracted) == {"names": ["Mickey", None, "Mouse"], "address": {"city": "T"}}
+
+    def test_should_stop_once_every_key_is_found(self):
+        document = '{"names": ["Mickey", 0, "Mouse"], "address": {"city": "T"}, "rest": not even json'
+        assert json.loads(extractor(Names).extract(document))["address"] == {"city": "T"}
+        document = '{"address": {"city": "T"}, "names": ["Mickey", 0, "Mouse", not even json'
+        assert json.loads(extractor(Names).extract(document))["names"] == ["Mickey", None, "Mouse"]
+
+    def test_should_keep_the_first_of_duplicates_after_stopping(self):
+        # A documented difference: full parsing keeps the last occurrence.
+        document = '{"names": ["Mickey", 0, "Mouse"], "address": {"city": "T"}, "names": ["Minnie", 0, "M"]}'
+        assert validate_extracted(Names, document).first_name == "Mickey"
+        assert Names.model_validate_json(document).first_name == "Minnie"
+
+    def test_should_keep_the_last_of_duplicates_before_stopping(self):
+        document = '{"address": {"city": "T", "city": "U"}, "names": ["Mickey", 0, "Mouse"]}'
+        assert validate_extracted(Names, document) == Names.model_validate_json(document)
+
+    def test_should_reject_trailing_content_of_documents_read_to_their_end(self):
+        with pytest.raises(ExtractError, match="position 45"):
+            extractor(Names).extract('{"names": ["Mickey", 0, "Mouse"], "rest": 1} trailing')
+        with pytest.raises(ValidationError):
+            validate_extracted(Names, '{"names": ["Mickey", 0, "Mouse"], "rest": 1} trailing')
+        assert extractor(Names).extract('{"names": ["Mickey", 0, "Mouse"]}\n ') == '{"names":["Mickey",null,"Mouse"]}'
+
+    def test_should_only_check_brackets_and_strings_of_skipped_containers(self):
+        # A documented difference: full parsing rejects these documents.
+        document = '{"rest": [1 2 : }, "names": ["Mickey", 0, "Mouse"], "address": {"city": "T"}}'
+        assert validate_extracted(Names, document).first_name == "Mickey"
+        document = '{"rest": [1 2 :, {"a" "b"}], "names": ["Mickey", 0, "Mouse"], "address": {"city": "T"}}'
+        assert validate_extracted(Names, document).first_name == "Mickey"
+
+    def test_should_copy_arrays_read_from_the_end_whole(self):
+        class Last(BaseModel):
+            last_name: str = Field(validation_alias=AliasPath("names", -1))
+
+        assert extractor(Last).extract('{"names": ["Mickey", "Mouse"]}') == '{"names":["Mickey", "Mouse"]}'
+        assert validate_extracted(Last, '{"names": ["Mickey", "Mouse"]}').last_name == "Mouse"
+
+    @pytest.mark.parametrize(
+        "document", ['["Mickey"]', '{"names": ["Mickey"', '{"names": "Mickey}', '{"rest": [{"a": "]}', '{"rest": [[}']
+    )
+    def test_should_reject_documents_it_cannot_walk(self, document: str):
+        with pytest.raises(ExtractError):
+            extractor(Names).extract(document)
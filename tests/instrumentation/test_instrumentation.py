@@ -0,0 +1,122 @@
+import json
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+from pydantic_notes import instrumentation
+from pydantic_notes.instrumentation import BUCKETS, OVERFLOW, Instrumentation, bucket_index, instrument
+from pydantic_notes.models import ModelWithPlainAlias, ModelWithSerializationAlias
+
+
+class TestInstrument:
+    def test_should_record_calls_per_model_and_method(self):
+        with instrument(ModelWithPlainAlias, ModelWithSerializationAlias) as recorder:
+            model = ModelWithPlainAlias.model_validate_json('{"firstName": "Mickey"}')
+            ModelWithPlainAlias.model_validate({"firstName": "Mickey"})
+            assert model.model_dump(by_alias=True) == {"firstName": "Mickey"}
+            assert model.model_dump_json(by_alias=True) == '{"firstName":"Mickey"}'
+            ModelWithSerializationAlias(first_name="Mickey").model_dump_json(by_alias=True)
+        snapshot = recorder.snapshot()
+        assert {method: stats["calls"] for method, stats in snapshot["ModelWithPlainAlias"].items()} == {
+            "model_validate": 1,
+            "model_validate_json": 1,
+            "model_dump": 1,
+            "model_dump_json": 1,
+        }
+        assert snapshot["ModelWithPlainAlias"]["model_validate_json"]["payload_bytes"] == len('{"firstName": "Mickey"}')
+        assert snapshot["ModelWithPlainAlias"]["model_dump_json"]["payload_bytes"] == len('{"firstName":"Mickey"}')
+        assert snapshot["ModelWithPlainAlias"]["model_validate"]["payload_bytes"] is None
+        assert snapshot["ModelWithSerializationAlias"]["model_dump_json"]["calls"] == 1
+
+    def test_should_measure_payloads_in_bytes(self):
+        with instrument(ModelWithPlainAlias) as recorder:
+            model = ModelWithPlainAlias.model_validate_json('{"firstName": "Mickaël"}')
+            model.model_dump_json(by_alias=True)
+        snapshot = recorder.snapshot()["ModelWithPlainAlias"]
+        assert snapshot["model_validate_json"]["payload_bytes"] == len('{"firstName": "Mickaël"}'.encode())
+        assert snapshot["model_dump_json"]["payload_bytes"] == len('{"firstName":"Mickaël"}'.encode())
+
+    def test_should_count_failed_calls(self):
+        with instrument(ModelWithPlainAlias) as recorder:
+            with pytest.raises(ValidationError):
+                ModelWithPlainAlias.model_validate({"first_name": "Mickey"})
+        stats = recorder.stats[("ModelWithPlainAlias", "model_validate")]
+        assert (stats.calls, stats.errors, sum(stats.buckets)) == (1, 1, 1)
+
+    def test_should_restore_the_original_methods(self):
+        before = {name: getattr(ModelWithPlainAlias, name) for name in ("model_validate", "model_dump_json")}
+        with instrument(ModelWithPlainAlias):
+            assert "model_validate" in ModelWithPlainAlias.__dict__
+        assert "model_validate" not in ModelWithPlainAlias.__dict__
+        assert {name: getattr(ModelWithPlainAlias, name) for name in before} == before
+
+    def test_should_instrument_each_model_once(self):
+        class Parent(BaseModel):
+            first_name: str = Field(alias="firstName")
+
+        class Child(Parent):
+            pass
+
+        other = Instrumentation()
+        with instrument(Parent, Parent, Child) as recorder:
+            other.instrument(Parent)
+            Parent.model_validate({"firstName": "Mickey"})
+            Child.model_validate({"firstName": "Mickey"}).model_dump()
+            other.uninstrument()
+        assert {key: stats.calls for key, stats in recorder.stats.items()} == {
+            ("Parent", "model_validate"): 1,
+            ("Child", "model_validate"): 1,
+            ("Child", "model_dump"): 1,
+        }
+        assert not other.stats
+        assert all(
+            name not in Parent.__dict__ and name not in Child.__dict__ for name in ("model_validate", "model_dump")
+        )
+
+    def test_should_switch_globally(self):
+        recorder = instrumentation.enable(ModelWithPlainAlias)
+        instrumentation.enable(ModelWithPlainAlias)
+        try:
+            ModelWithPlainAlias.model_validate({"firstName": "Mickey"})
+        finally:
+            instrumentation.disable()
+        ModelWithPlainAlias.model_validate({"firstName": "Mickey"})
+        assert recorder.stats[("ModelWithPlainAlias", "model_validate")].calls == 1
+        recorder.reset()
+
+
+class TestExport:
+    def test_should_export_prometheus_histograms(self):
+        with instrument(ModelWithPlainAlias) as recorder:
+            for _ in range(3):
+                ModelWithPlainAlias.model_validate_json('{"firstName": "Mickey"}')
+        text = recorder.to_prometheus()
+        labels = 'model="ModelWithPlainAlias",method="model_validate_json"'
+        assert f"pydantic_notes_calls_total{{{labels}}} 3" in text
+        assert f'pydantic_notes_latency_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+        assert f"pydantic_notes_latency_seconds_count{{{labels}}} 3" in text
+        assert "# TYPE pydantic_notes_latency_seconds histogram" in text
+
+    def test_should_count_slow_calls_in_the_inf_bucket_only(self):
+        recorder = Instrumentation()
+        recorder._stats_for("Model", "model_validate").record(20 * 10**9, 0, failed=False)
+        recorder._stats_for("Model", "model_validate").record(1000, 0, failed=False)
+        lines = recorder.to_prometheus().splitlines()
+        buckets = [line.rsplit(" ", 1)[1] for line in lines if "_bucket{" in line]
+        assert buckets == ["1"] * BUCKETS + ["2"]
+        assert recorder.snapshot()["Model"]["model_validate"]["buckets"]["+Inf"] == 1
+
+    def test_should_export_json(self, tmp_path):
+        with instrument(ModelWithPlainAlias) as recorder:
+            ModelWithPlainAlias.model_validate({"firstName": "Mickey"})
+        recorder.write_json(tmp_path / "stats.json")
+        recorder.write_prometheus(tmp_path / "stats.prom")
+        assert json.loads((tmp_path / "stats.json").read_text()) == recorder.snapshot()
+        assert (tmp_path / "stats.prom").read_text() == recorder.to_prometheus()
+
+    @pytest.mark.parametrize(
+        "elapsed_ns, expected",
+        [(0, 0), (1024, 0), (1025, 1), (2048, 1), (2049, 2), (2**34, BUCKETS - 1), (2**34 + 1, OVERFLOW)],
+    )
+    def test_should_bucket_latencies_by_powers_of_two(self, elapsed_ns: int, expected: int):
+        assert bucket_index(elapsed_ns) == expected
@@ -0,0 +1,144 @@
+import copy
+import pickle
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+
+from pydantic_notes.lazy import LazyModel
+from pydantic_notes.models import (
+    ModelWithPlainAlias,
+    ModelWithPlainAliasPopByName,
+    ModelWithValidationAliasChoices,
+    ModelWithValidationAliasPath,
+)
+
+
+class ModelWithFieldValidator(BaseModel):
+    first_name: str = Field(alias="firstName")
+    last_name: str = Field(alias="lastName", default="Mouse")
+    age: int = Field(alias="age", frozen=True, default=0)
+
+    @field_validator("first_name")
+    @classmethod
+    def capitalize(cls, value: str) -> str:
+        return value.capitalize()
+
+
+class ModelWithModelValidator(BaseModel):
+    first_name: str
+
+    @model_validator(mode="after")
+    def check(self):
+        raise ValueError(self.first_name)
+
+
+def _unpickled(lazy: LazyModel) -> LazyModel:
+    return pickle.loads(pickle.dumps(lazy))  # noqa: S301
+
+
+class TestLazyModel:
+    @pytest.mark.parametrize("data", [b'{"firstName": "Mickey"}', '{"firstName": "Mickey"}', {"firstName": "Mickey"}])
+    def test_should_read_fields_by_alias(self, data):
+        assert LazyModel(ModelWithPlainAlias, data).first_name == "Mickey"
+
+    @pytest.mark.parametrize("key", ["firstName", "givenName", "preferredName"])
+    def test_should_read_fields_by_alias_choices(self, key: str):
+        assert LazyModel(ModelWithValidationAliasChoices, {key: "Mickey"}).first_name == "Mickey"
+
+    def test_should_read_fields_by_alias_path(self):
+        lazy = LazyModel(ModelWithValidationAliasPath, b'{"names": ["Mickey", "Mouse"]}')
+        assert (lazy.first_name, lazy.last_name) == ("Mickey", "Mouse")
+
+    @pytest.mark.parametrize("key", ["firstName", "first_name"])
+    def test_should_read_fields_by_name_under_populate_by_name(self, key: str):
+        assert LazyModel(ModelWithPlainAliasPopByName, {key: "Mickey"}).first_name == "Mickey"
+
+    def test_should_validate_only_the_fields_read(self):
+        lazy = LazyModel(ModelWithValidationAliasPath, {"names": ["Mickey", 42]})
+        assert lazy.loaded_fields == frozenset()
+        assert lazy.first_name == "Mickey"
+        assert lazy.loaded_fields == {"first_name"}
+
+    def test_should_validate_json_on_first_access_only(self):
+        lazy = LazyModel(ModelWithPlainAlias, b"not json at all")
+        with pytest.raises(ValidationError) as exc_info:
+            _ = lazy.first_name
+        assert exc_info.value.errors()[0]["type"] == "json_invalid"
+
+    def test_should_run_field_validators_and_defaults(self):
+        lazy = LazyModel(ModelWithFieldValidator, {"firstName": "mickey", "age": "7"})
+        assert (lazy.first_name, lazy.last_name, lazy.age) == ("Mickey", "Mouse", 7)
+
+    @pytest.mark.parametrize(
+        "model_cls, data, field, expected_error",
+        [
+            (
+                ModelWithPlainAlias,
+                {"first_name": "Mickey"},
+                "first_name",
+                [
+                    {
+                        "type": "missing",
+                        "loc": ("firstName",),
+                        "msg": "Field required",
+                        "input": {"first_name": "Mickey"},
+                    }
+                ],
+            ),
+            (
+                ModelWithValidationAliasChoices,
+                {"name": "Mickey"},
+                "first_name",
+                [{"type": "missing", "loc": ("firstName",), "msg": "Field required", "input": {"name": "Mickey"}}],
+            ),
+            (
+                ModelWithValidationAliasPath,
+                {"names": ["Mickey", 42]},
+                "last_name",
+                [{"type": "string_type", "loc": ("names", 1), "msg": "Input should be a valid string", "input": 42}],
+            ),
+        ],
+    )
+    def test_should_raise_errors_located_like_full_validation(
+        self, model_cls, data: dict, field: str, expected_error: list[dict]
+    ):
+        with pytest.raises(ValidationError) as lazy_exc_info:
+            getattr(LazyModel(model_cls, data), field)
+        with pytest.raises(ValidationError) as exc_info:
+            model_cls.model_validate(data)
+        assert lazy_exc_info.value.errors(include_url=False) == expected_error
+        assert expected_error[0] in exc_info.value.errors(include_url=False)
+
+    def test_should_materialize_a_regular_model(self):
+        lazy = LazyModel(ModelWithValidationAliasPath, b'{"names": ["Mickey", "Mouse"]}')
+        _ = lazy.first_name
+        assert lazy.materialize() == ModelWithValidationAliasPath(names=["Mickey", "Mouse"])
+
+    def test_should_be_read_only(self):
+        lazy = LazyModel(ModelWithPlainAlias, {"firstName": "Mickey"})
+        with pytest.raises(AttributeError):
+            lazy.first_name = "Minnie"
+        with pytest.raises(AttributeError):
+            _ = lazy.firstName
+
+    @pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, _unpickled])
+    def test_should_copy_and_pickle_with_the_fields_loaded(self, clone):
+        lazy = LazyModel(ModelWithValidationAliasPath, b'{"names": ["Mickey", "Mouse"]}')
+        _ = lazy.first_name
+        cloned = clone(lazy)
+        assert cloned.loaded_fields == {"first_name"}
+        assert (cloned.first_name, cloned.last_name) == ("Mickey", "Mouse")
+        assert lazy.loaded_fields == {"first_name"}
+
+    def test_should_not_resolve_private_or_special_names_as_fields(self):
+        lazy = LazyModel(ModelWithPlainAlias, {"firstName": "Mickey"})
+        for name in ("__deepcopy__", "_lazy_other"):
+            with pytest.raises(AttributeError):
+                getattr(lazy, name)
+        assert lazy.loaded_fields == frozenset()
+
+    def test_should_run_model_validators_on_materialize_only(self):
+        lazy = LazyModel(ModelWithModelValidator, {"first_name": "Mickey"})
+        assert lazy.first_name == "Mickey"
+        with pytest.raises(ValidationError):
+            lazy.materialize()
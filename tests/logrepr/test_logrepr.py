@@ -0,0 +1,93 @@
+import logging
+
+import pytest
+from pydantic import BaseModel, Field
+
+from pydantic_notes.logrepr import bounded, summary
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+
+
+class Wide(BaseModel):
+    first_name: str = Field(alias="firstName")
+    last_name: str = Field(alias="lastName")
+    secret: str = Field(default="hunter2", repr=False)
+    note: str = ""
+    age: int = 0
+
+
+class Spy:
+    def __init__(self):
+        self.calls = 0
+
+    def __repr__(self) -> str:
+        self.calls += 1
+        return "Spy()"
+
+
+class WithSpy(BaseModel, arbitrary_types_allowed=True):
+    spy: Spy
+
+
+MICKEY = Wide(firstName="Mickey", lastName="Mouse")
+
+
+class TestBounded:
+    def test_should_render_like_repr_within_limits(self):
+        assert str(bounded([MICKEY])) == f"[{MICKEY!r}]"
+
+    def test_should_truncate_models(self):
+        assert str(bounded([MICKEY] * 4, max_models=2)) == f"[{MICKEY!r}, {MICKEY!r}, ...+2 more]"
+
+    def test_should_truncate_fields_and_skip_hidden_ones(self):
+        assert str(bounded([MICKEY], max_fields=2)) == "[Wide(first_name='Mickey', last_name='Mouse', ...+2 fields)]"
+
+    def test_should_shorten_long_values(self):
+        text = str(bounded([Wide(firstName="M" * 1000, lastName="Mouse")], max_value_chars=12))
+        assert "M" * 20 not in text
+        assert "last_name='Mouse'" in text
+
+    @pytest.mark.parametrize("max_chars", [10, 50, 200])
+    def test_should_cap_characters(self, max_chars: int):
+        text = str(bounded([MICKEY] * 100, max_chars=max_chars))
+        assert len(text) <= max_chars
+        assert text.endswith("...")
+
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_use_field_names_whatever_the_aliases(self, model: str):
+        instance = ALIAS_MODELS[model].model_validate(SAMPLE_PAYLOADS[model])
+        assert str(bounded([instance])) == f"[{instance!r}]"
+
+    def test_should_render_empty_collections(self):
+        assert str(bounded([])) == "[]"
+
+
+class TestLaziness:
+    def test_should_not_format_filtered_records(self, caplog):
+        spy = Spy()
+        with caplog.at_level(logging.INFO):
+            logging.getLogger("batches").debug("batch %s", bounded([WithSpy(spy=spy)]))
+            logging.getLogger("batches").debug("batch %s", summary([WithSpy(spy=spy)]))
+        assert spy.calls == 0
+        assert not caplog.records
+
+    def test_should_format_emitted_records_once(self, caplog):
+        spy = Spy()
+        batch = bounded([WithSpy(spy=spy)])
+        with caplog.at_level(logging.DEBUG):
+            logging.getLogger("batches").debug("batch %s", batch)
+            logging.getLogger("batches").debug("again %r", batch)
+        assert [record.getMessage() for record in caplog.records] == [
+            "batch [WithSpy(spy=Spy())]",
+            "again [WithSpy(spy=Spy())]",
+        ]
+        assert spy.calls == 1
+
+
+class TestSummary:
+    def test_should_count_models_by_class(self):
+        plain = ALIAS_MODELS["plain_alias"].model_validate(SAMPLE_PAYLOADS["plain_alias"])
+        assert str(summary([MICKEY, plain, MICKEY])) == "3 models: Wide=2, ModelWithPlainAlias=1"
+
+    def test_should_render_single_and_empty_collections(self):
+        assert str(summary([MICKEY])) == "1 model: Wide=1"
+        assert str(summary([])) == "0 models"
@@ -0,0 +1,122 @@
+import pytest
+from pydantic import AliasChoices, AliasGenerator, AliasPath, BaseModel, ConfigDict, Field, ValidationError
+
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+from pydantic_notes.normalize import (
+    AmbiguousKeyError,
+    KeyNormalizer,
+    NormalizedKeysModel,
+    key_normalizer,
+    normalize_key,
+    normalize_keys,
+)
+
+SPELLINGS = [
+    "FIRST_NAME",
+    "first_name",
+    "firstname",
+    "first-name",
+    "FirstName",
+    "firstName",
+    "First Name",
+    "fIrSt.NaMe",
+]
+
+
+class Person(NormalizedKeysModel):
+    model_config = ConfigDict(alias_generator=AliasGenerator(validation_alias=lambda x: x.upper()))
+    first_name: str
+    last_name: str = Field(default="Mouse", validation_alias="lastName")
+
+
+class TestNormalizeKey:
+    @pytest.mark.parametrize("key", SPELLINGS)
+    def test_should_ignore_case_and_separators(self, key: str):
+        assert normalize_key(key) == "firstname"
+
+
+class TestKeyNormalizer:
+    @pytest.mark.parametrize("key", SPELLINGS)
+    def test_should_rewrite_spellings_to_uppercase_validation_alias(self, key: str):
+        assert normalize_keys(Person, {key: "Mickey"}) == {"FIRST_NAME": "Mickey"}
+        assert Person.model_validate({key: "Mickey"}).first_name == "Mickey"
+
+    def test_should_rewrite_to_resolved_generator_aliases(self):
+        model_cls = ALIAS_MODELS["alias_generator_and_priority_1"]
+        normalized = normalize_keys(
+            model_cls, {"first-name-pa": "Mickey", "firstNameVa": "Minnie", "FIRST_NAME_SA": "x"}
+        )
+        assert normalized == {"FIRST_NAME_PA": "Mickey", "FIRST_NAME_VA": "Minnie", "FIRST_NAME_SA": "x"}
+
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_keep_valid_payloads_as_they_are(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        assert normalize_keys(model_cls, SAMPLE_PAYLOADS[model]) == SAMPLE_PAYLOADS[model]
+
+    def test_should_rewrite_to_first_choice(self):
+        model_cls = ALIAS_MODELS["validation_alias_choices"]
+        normalized = normalize_keys(model_cls, {"GIVEN-NAME": "Mickey"})
+        assert normalized == {"givenName": "Mickey"}
+        assert model_cls.model_validate(normalized).first_name == "Mickey"
+
+    def test_should_rewrite_alias_path_heads_only(self):
+        model_cls = ALIAS_MODELS["validation_alias_path"]
+        assert normalize_keys(model_cls, {"NAMES": ["Mickey"]}) == {"names": ["Mickey"]}
+
+    def test_should_include_field_names_under_populate_by_name(self):
+        model_cls = ALIAS_MODELS["plain_alias_and_pop_by_name_config"]
+        assert set(key_normalizer(model_cls).canonical) == {"firstName", "first_name"}
+        assert normalize_keys(model_cls, {"FIRSTNAME": "Mickey"}) == {"firstName": "Mickey"}
+
+    def test_should_not_override_canonical_keys(self):
+        assert normalize_keys(Person, {"first-name": "Minnie", "FIRST_NAME": "Mickey"}) == {
+            "first-name": "Minnie",
+            "FIRST_NAME": "Mickey",
+        }
+        assert normalize_keys(Person, {"first-name": "Minnie", "firstName": "Mickey"}) == {
+            "FIRST_NAME": "Minnie",
+            "firstName": "Mickey",
+        }
+
+    def test_should_pass_unknown_keys_through(self):
+        class Strict(NormalizedKeysModel):
+            model_config = ConfigDict(extra="forbid")
+            first_name: str = Field(alias="firstName")
+
+        with pytest.raises(ValidationError, match="middle_name"):
+            Strict.model_validate({"FIRST_NAME": "Mickey", "middle_name": "M"})
+
+    def test_should_normalize_json_input(self):
+        assert Person.model_validate_json('{"first-name": "Mickey", "LAST_NAME": "Mouse"}') == Person.model_validate(
+            {"FIRST_NAME": "Mickey", "lastName": "Mouse"}
+        )
+
+
+class TestAmbiguity:
+    def test_should_reject_keys_of_different_fields_normalizing_alike(self):
+        class Clashing(BaseModel):
+            first_name: str = Field(alias="firstName")
+            other: str = Field(alias="FIRST_NAME")
+
+        with pytest.raises(AmbiguousKeyError, match="'firstName' \\(first_name\\), 'FIRST_NAME' \\(other\\)"):
+            KeyNormalizer(Clashing)
+
+    def test_should_reject_at_class_creation(self):
+        with pytest.raises(AmbiguousKeyError):
+
+            class Clashing(NormalizedKeysModel):
+                first_name: str
+                firstname: str
+
+    def test_should_allow_spellings_of_one_field(self):
+        class Spellings(BaseModel):
+            first_name: str = Field(validation_alias=AliasChoices("firstName", "first_name"))
+
+        assert normalize_keys(Spellings, {"FIRST-NAME": "Mickey"}) == {"firstName": "Mickey"}
+
+    def test_should_allow_fields_sharing_a_path_head(self):
+        class Names(BaseModel):
+            first_name: str = Field(validation_alias=AliasPath("names", 0))
+            last_name: str = Field(validation_alias=AliasPath("names", 1))
+
+        assert normalize_keys(Names, {"Names": ["Mickey", "Mouse"]}) == {"names": ["Mickey", "Mouse"]}
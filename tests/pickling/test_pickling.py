@@ -0,0 +1,95 @@
+import pickle
+
+import pytest
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.pickling import CompactBatch, CompactPickleModel, compact_batch
+from pydantic_notes.workload import Workload
+
+# Pickles reference classes by qualified name, so the compact variants of the alias models live at module level.
+COMPACT_MODELS = {
+    name: type(model_cls.__name__, (CompactPickleModel, model_cls), {"__module__": __name__})
+    for name, model_cls in ALIAS_MODELS.items()
+}
+globals().update({model_cls.__name__: model_cls for model_cls in COMPACT_MODELS.values()})
+
+
+class Account(CompactPickleModel):
+    model_config = ConfigDict(extra="allow")
+
+    owner: str
+    balance: int = 0
+    _session: str = PrivateAttr(default="s")
+    _cursor: str = PrivateAttr()
+
+
+def _instances(model_cls: type[BaseModel], count: int = 20) -> list[BaseModel]:
+    return [model_cls.model_validate(record) for record in Workload(model_cls, seed=5).records(count)]
+
+
+def _state(instance: BaseModel) -> dict:
+    return {**instance.__getstate__(), "type": type(instance)}
+
+
+class TestCompactPickleModel:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_round_trip_every_alias_model(self, model: str):
+        for instance in _instances(COMPACT_MODELS[model]):
+            rebuilt = pickle.loads(pickle.dumps(instance))  # noqa: S301
+            assert _state(rebuilt) == _state(instance)
+            assert rebuilt.model_dump_json(by_alias=True) == instance.model_dump_json(by_alias=True)
+
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_be_smaller_than_default_pickles(self, model: str):
+        instance = _instances(COMPACT_MODELS[model], 1)[0]
+        default = pickle.dumps(ALIAS_MODELS[model].model_construct(instance.model_fields_set, **instance.__dict__))
+        assert len(pickle.dumps(instance)) < len(default)
+
+    def test_should_keep_fields_set(self):
+        account = Account.model_construct({"owner"}, owner="Mickey", balance=0)
+        assert pickle.loads(pickle.dumps(account)).model_fields_set == {"owner"}  # noqa: S301
+
+    def test_should_keep_extra_and_private_state(self):
+        account = Account.model_validate({"owner": "Mickey", "nickname": "M", "tier": 2})
+        account._cursor = "c"
+        rebuilt = pickle.loads(pickle.dumps(account))  # noqa: S301
+        assert _state(rebuilt) == _state(account)
+        assert rebuilt.model_fields_set == {"owner", "nickname", "tier"}
+        assert (rebuilt._session, rebuilt._cursor) == ("s", "c")
+
+    def test_should_restore_empty_extra_and_private_state(self):
+        rebuilt = pickle.loads(pickle.dumps(Account(owner="Mickey")))  # noqa: S301
+        assert (rebuilt.__pydantic_extra__, rebuilt.__pydantic_private__) == ({}, {"_session": "s"})
+        rebuilt.nickname = "M"
+        assert rebuilt.model_extra == {"nickname": "M"}
+
+    def test_should_load_default_state(self):
+        account = Account.model_validate({"owner": "Mickey", "nickname": "M"})
+        rebuilt = Account.__new__(Account)
+        rebuilt.__setstate__(account.__getstate__())
+        assert _state(rebuilt) == _state(account)
+
+
+class TestCompactBatch:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_round_trip_batches_of_plain_models(self, model: str):
+        instances = _instances(ALIAS_MODELS[model])
+        rebuilt = pickle.loads(pickle.dumps(compact_batch(instances)))  # noqa: S301
+        assert isinstance(rebuilt, CompactBatch)
+        assert [_state(instance) for instance in rebuilt] == [_state(instance) for instance in instances]
+
+    def test_should_write_the_class_once(self):
+        instances = _instances(ALIAS_MODELS["plain_alias"], 50)
+        data = pickle.dumps(compact_batch(instances))
+        assert data.count(b"ModelWithPlainAlias") == 1
+        assert b"first_name" not in data
+        assert len(data) < len(pickle.dumps(instances))
+
+    def test_should_pickle_mixed_batches_one_model_at_a_time(self):
+        instances = [*_instances(ALIAS_MODELS["plain_alias"], 2), Account(owner="Mickey")]
+        rebuilt = pickle.loads(pickle.dumps(compact_batch(instances)))  # noqa: S301
+        assert [_state(instance) for instance in rebuilt] == [_state(instance) for instance in instances]
+
+    def test_should_round_trip_empty_batches(self):
+        assert pickle.loads(pickle.dumps(compact_batch([]))) == []  # noqa: S301
@@ -0,0 +1,118 @@
+import io
+import itertools
+import threading
+from collections.abc import Iterator
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.pipeline import Pipeline, PipelineError, Stage, json_pipeline
+from pydantic_notes.workload import Workload, write_ndjson
+
+MODEL = ALIAS_MODELS["validation_alias_choices"]
+
+
+def shout(model: BaseModel) -> BaseModel:
+    return model.model_copy(update={"first_name": model.first_name.upper()})
+
+
+def double(value: int) -> int:
+    return value * 2
+
+
+def fail_on_fourteen(value: int) -> int:
+    if value == 14:
+        raise ValueError(value)
+    return value
+
+
+def _lines(count: int) -> list[bytes]:
+    fp = io.StringIO()
+    write_ndjson(Workload(MODEL, seed=9).records(count), fp)
+    return fp.getvalue().encode().splitlines(keepends=True)
+
+
+def _expected(lines: list[bytes]) -> list[bytes]:
+    return [shout(MODEL.model_validate_json(line)).model_dump_json(by_alias=True).encode() for line in lines]
+
+
+class TestPipeline:
+    @pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+    def test_should_run_stages_in_order(self, mode: str):
+        lines = _lines(300)
+        pipeline = json_pipeline(
+            MODEL,
+            shout,
+            modes=dict.fromkeys(("validate", "transform", "dump"), mode),
+            workers={"transform": 2},
+            batch_size=16,
+        )
+        assert list(pipeline.run(lines)) == _expected(lines)
+        assert [(metrics.name, metrics.items) for metrics in pipeline.metrics] == [
+            ("validate", 300),
+            ("transform", 300),
+            ("dump", 300),
+        ]
+        assert all(metrics.batches == 19 and metrics.busy > 0 for metrics in pipeline.metrics)
+
+    def test_should_run_unordered(self):
+        pipeline = Pipeline([Stage("double", double, "thread", workers=4)], batch_size=3, ordered=False)
+        assert sorted(pipeline.run(range(1000))) == [value * 2 for value in range(1000)]
+
+    def test_should_read_lines_from_a_binary_file(self):
+        lines = _lines(50)
+        assert list(json_pipeline(MODEL).run(io.BytesIO(b"".join(lines)))) == [
+            MODEL.model_validate_json(line).model_dump_json(by_alias=True).encode() for line in lines
+        ]
+
+    @pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+    def test_should_stop_on_stage_errors(self, mode: str):
+        threads = threading.active_count()
+        pipeline = Pipeline([Stage("double", double), Stage("check", fail_on_fourteen, mode)], batch_size=2)
+        with pytest.raises(PipelineError, match="'check' failed on batch 1") as info:
+            list(pipeline.run([1, 2, 3, 7, *range(10_000)]))
+        assert isinstance(info.value.__cause__, ValueError)
+        assert threading.active_count() == threads
+
+    def test_should_report_validation_errors(self):
+        with pytest.raises(PipelineError, match="'validate'") as info:
+            list(json_pipeline(MODEL).run([b'{"givenName": 1}']))
+        assert isinstance(info.value.__cause__, ValidationError)
+
+    def test_should_stop_on_source_errors(self):
+        def source() -> Iterator[int]:
+            yield 1
+            raise KeyError(2)
+
+        with pytest.raises(PipelineError, match="'source'") as info:
+            list(Pipeline([Stage("double", double)]).run(source()))
+        assert isinstance(info.value.__cause__, KeyError)
+
+    def test_should_apply_backpressure_and_stop_when_closed(self):
+        produced = itertools.count()
+        source = (next(produced) for _ in range(1_000_000))
+        pipeline = Pipeline([Stage("double", double, "thread", workers=2)], batch_size=10, max_pending=2)
+        threads = threading.active_count()
+        results = pipeline.run(source)
+        assert next(results) == 0
+        pipeline_threads = threading.active_count()
+        results.close()  # type: ignore[attr-defined]
+        assert next(produced) < 200
+        assert threading.active_count() <= threads < pipeline_threads
+
+    def test_should_print_metrics(self):
+        pipeline = json_pipeline(MODEL, modes={"dump": "thread"})
+        list(pipeline.run(_lines(10)))
+        list(pipeline.run(_lines(10)))
+        lines = str(pipeline).splitlines()
+        assert lines[0].startswith("2 stages in")
+        assert [line.split()[:3] for line in lines[1:]] == [["validate", "inline", "10"], ["dump", "thread", "10"]]
+
+    def test_should_reject_invalid_settings(self):
+        with pytest.raises(ValueError, match="fork"):
+            Stage("double", double, "fork")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="0"):
+            Stage("double", double, workers=0)
+        with pytest.raises(ValueError, match="0"):
+            Pipeline([], batch_size=0)
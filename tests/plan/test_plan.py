@@ -0,0 +1,153 @@
+import io
+import subprocess
+import sys
+from datetime import datetime
+
+import pytest
+from pydantic import (
+    AliasChoices,
+    AliasPath,
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+
+import pydantic_notes
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+from pydantic_notes.plan import CONTAINER_ITEMS, COSTS, EXTRA_PATH, EXTRA_SEGMENT, PYTHON_CALL, explain, plan
+
+
+class Address(BaseModel):
+    city: str
+    zip_code: str
+
+
+class Order(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    order_id: int = Field(validation_alias=AliasChoices("id", "orderId", AliasPath("meta", "order", "id")))
+    placed_at: datetime | None = None
+    items: list[str] = []
+    address: Address | None = None
+    note: str = Field(default="", alias="Note")
+
+    @field_validator("note")
+    @classmethod
+    def strip(cls, value: str) -> str:
+        return value.strip()
+
+    @field_serializer("note")
+    def shout(self, value: str) -> str:
+        return value.upper()
+
+    @model_validator(mode="before")
+    @classmethod
+    def passthrough(cls, data: dict) -> dict:
+        return data
+
+    @computed_field(alias="itemCount")
+    @property
+    def item_count(self) -> int:
+        return len(self.items)
+
+
+def _fields(model_cls: type[BaseModel]) -> dict:
+    return {field_plan.name: field_plan for field_plan in plan(model_cls).fields}
+
+
+class TestPlan:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_show_resolved_aliases(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        by_alias = model_cls.model_validate(SAMPLE_PAYLOADS[model]).model_dump(by_alias=True)
+        fields = _fields(model_cls)
+        assert list(fields) == list(model_cls.model_fields)
+        assert [field_plan.serialization_key for field_plan in fields.values()] == list(by_alias)
+
+    def test_should_show_alias_generator_and_priority_resolution(self):
+        fields = _fields(ALIAS_MODELS["alias_generator_and_priority_1"])
+        assert fields["first_name_pa"].paths == (("FIRST_NAME_PA",),)
+        assert fields["first_name_pa"].serialization_key == "FirstNamePa"
+
+    def test_should_show_fan_out_and_depth(self):
+        order_id = _fields(Order)["order_id"]
+        assert order_id.paths == (("id",), ("orderId",), ("meta", "order", "id"), ("order_id",))
+        assert (order_id.fan_out, order_id.depth) == (4, 3)
+        assert order_id.cost == COSTS["int"] + 3 * EXTRA_PATH + 2 * EXTRA_SEGMENT
+
+    def test_should_show_types_validators_and_costs(self):
+        fields = _fields(Order)
+        assert fields["placed_at"].type == "datetime | None = default"
+        assert fields["placed_at"].cost == COSTS["datetime"] + COSTS["none"]
+        assert fields["items"].type == "list[str] = default"
+        assert fields["items"].cost == 1 + CONTAINER_ITEMS * COSTS["str"]
+        assert fields["address"].type == "Address | None = default"
+        assert fields["address"].cost == 1 + 2 * COSTS["str"] + COSTS["none"]
+        assert (fields["note"].validators, fields["note"].serializers) == (["after"], ["plain"])
+        assert fields["note"].cost == COSTS["str"] + PYTHON_CALL + EXTRA_PATH
+
+    def test_should_show_model_validators_and_computed_fields(self):
+        order_plan = plan(Order)
+        assert order_plan.model_validators == ["before"]
+        assert order_plan.computed_fields == {"item_count": "itemCount"}
+        assert order_plan.cost == sum(field_plan.cost for field_plan in order_plan.fields) + PYTHON_CALL
+
+
+class TestExplain:
+    def test_should_print_the_plan(self):
+        out = io.StringIO()
+        order_plan = explain(Order, file=out)
+        lines = out.getvalue().splitlines()
+        assert lines[0] == f"Order: estimated cost {order_plan.cost:.1f}"
+        assert lines[1] == "  model validators: before"
+        assert lines[2].split() == [
+            "field",
+            "input",
+            "paths",
+            "n",
+            "depth",
+            "serialized",
+            "as",
+            "type",
+            "python",
+            "cost",
+            "share",
+        ]
+        assert lines[3].split()[:9] == ["order_id", "id", "|", "orderId", "|", "meta.order.id", "|", "order_id", "4"]
+        assert "after, ser:plain" in lines[7]
+        assert lines[-1] == "  computed item_count: serialized as itemCount"
+
+    def test_should_measure_fields_on_samples(self):
+        out = io.StringIO()
+        samples = [{"id": 1, "Note": " a "}, '{"meta": {"order": {"id": 2}}, "items": ["x"]}']
+        order_plan = explain(Order, samples, file=out)
+        assert order_plan.measured > 0
+        assert all(field_plan.measured > 0 for field_plan in order_plan.fields)
+        assert "us per sample (full model)" in out.getvalue().splitlines()[0]
+
+    def test_should_leave_invalid_samples_out(self):
+        out = io.StringIO()
+        order_plan = explain(Order, [{"id": 1}, {"id": "one"}, '{"items": 1}'], file=out)
+        assert order_plan.invalid_samples == 2
+        assert order_plan.measured > 0
+        assert ", 2 invalid sample(s) left out" in out.getvalue().splitlines()[0]
+
+    def test_should_not_measure_without_valid_samples(self):
+        order_plan = plan(Order, [{"id": "one"}])
+        assert (order_plan.invalid_samples, order_plan.measured) == (1, None)
+        assert all(field_plan.measured is None for field_plan in order_plan.fields)
+
+    def test_should_be_exported_at_the_top_level(self):
+        assert pydantic_notes.explain is explain
+        assert "explain" in pydantic_notes.__all__
+        with pytest.raises(AttributeError):
+            _ = pydantic_notes.missing
+
+    def test_should_not_import_plan_with_the_package(self):
+        code = "import sys, pydantic_notes; print(sorted(m for m in sys.modules if m.startswith('pydantic_notes')))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+        assert result.stdout.strip() == "['pydantic_notes']"
@@ -0,0 +1,97 @@
+import json
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_serializer, field_validator
+
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+from pydantic_notes.projection import projection_model, validate_projection
+
+# The keys the notes in ``tests/aliasing`` try on every model, valid or not.
+KEYS = ["firstName", "first_name", "FirstName", "f_name", "f_name_a", "f_name_s", "givenName", "preferredName"]
+
+
+def _inputs(model: str) -> list[dict]:
+    return [SAMPLE_PAYLOADS[model], *({key: "Mickey"} for key in KEYS), {"names": ["Mickey"]}]
+
+
+def _outcome(validate, data):
+    try:
+        return validate(data), None
+    except ValidationError as exc:
+        return None, exc.errors(include_url=False)
+
+
+class ModelWithDecorators(BaseModel):
+    first_name: str = Field(alias="firstName")
+    last_name: str = Field(alias="lastName")
+
+    @field_validator("first_name", "last_name")
+    @classmethod
+    def capitalize(cls, value: str) -> str:
+        return value.capitalize()
+
+    @field_serializer("first_name")
+    def shout(self, value: str) -> str:
+        return value.upper()
+
+
+class TestValidateProjection:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    @pytest.mark.parametrize("as_json", [False, True])
+    def test_should_match_full_model_for_selected_fields(self, model: str, as_json: bool):
+        model_cls = ALIAS_MODELS[model]
+        for field in model_cls.model_fields:
+            for data in _inputs(model):
+                payload = json.dumps(data) if as_json else data
+                full, full_errors = _outcome(
+                    model_cls.model_validate_json if as_json else model_cls.model_validate, payload
+                )
+                projected, errors = _outcome(lambda d, f=field: validate_projection(model_cls, d, {f}), payload)
+                if errors is not None:
+                    assert all(error in full_errors for error in errors)
+                if full is not None:
+                    assert errors is None
+                    assert getattr(projected, field) == getattr(full, field)
+                    assert projected.model_dump(by_alias=True).items() <= full.model_dump(by_alias=True).items()
+
+    @pytest.mark.parametrize("model", [model for model, cls in ALIAS_MODELS.items() if len(cls.model_fields) == 1])
+    def test_should_serialize_and_repr_like_full_model(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        full = model_cls.model_validate(SAMPLE_PAYLOADS[model])
+        projected = validate_projection(model_cls, SAMPLE_PAYLOADS[model], {"first_name"})
+        assert projected.model_dump() == full.model_dump()
+        assert projected.model_dump_json(by_alias=True) == full.model_dump_json(by_alias=True)
+        assert list(projected.__rich_repr__()) == list(full.__rich_repr__())
+
+    def test_should_ignore_unselected_fields(self):
+        projected = validate_projection(
+            ALIAS_MODELS["validation_alias_path"], {"names": ["Mickey", 42]}, {"first_name"}
+        )
+        assert projected.model_dump() == {"first_name": "Mickey"}
+
+    @pytest.mark.parametrize("extra", ["forbid", "allow"])
+    def test_should_ignore_unselected_fields_whatever_the_extra_setting(self, extra: str):
+        class ModelWithExtra(BaseModel):
+            model_config = ConfigDict(extra=extra)  # type: ignore[typeddict-item]
+            first_name: str = Field(alias="firstName")
+            last_name: str = Field(alias="lastName")
+
+        for data in ('{"firstName": "a", "lastName": "b"}', {"firstName": "a", "lastName": "b", "other": 1}):
+            projected = validate_projection(ModelWithExtra, data, {"first_name"})
+            assert projected.model_extra is None
+            assert projected.model_dump() == {"first_name": "a"}
+
+    def test_should_carry_field_validators_and_serializers(self):
+        projected = validate_projection(ModelWithDecorators, '{"firstName": "mickey", "lastName": 1}', {"first_name"})
+        assert projected.first_name == "Mickey"
+        assert projected.model_dump() == {"first_name": "MICKEY"}
+
+    def test_should_cache_derived_models(self):
+        model_cls = ALIAS_MODELS["alias_generator_and_unset_priority"]
+        assert projection_model(model_cls, frozenset({"first_name_va"})) is projection_model(
+            model_cls, frozenset({"first_name_va"})
+        )
+
+    def test_should_reject_unknown_fields(self):
+        with pytest.raises(KeyError):
+            validate_projection(ALIAS_MODELS["plain_alias"], {"firstName": "Mickey"}, {"last_name"})
@@ -0,0 +1,106 @@
+import logging
+
+import pytest
+from pydantic import AliasPath, BaseModel, ConfigDict, Field
+
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.sampling import BOOST, RECOVERY, Alert, SampledValidator, trusted_builder
+from pydantic_notes.workload import Workload
+
+
+class Address(BaseModel):
+    city: str = Field(alias="cityName")
+    zip_code: str | None = Field(default=None, validation_alias=AliasPath("codes", 0))
+
+
+class Customer(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    customer_id: int = Field(alias="customerId")
+    address: Address | None = None
+    tags: list[str] = Field(default_factory=list)
+
+
+RECORD = {"customerId": 1, "address": {"cityName": "Toontown", "codes": ["00001"]}}
+
+
+def _validator(model_cls: type[BaseModel], every: int, alerts: list[Alert]) -> SampledValidator:
+    return SampledValidator(model_cls, every, on_alert=alerts.append, seed=0)
+
+
+class TestTrustedBuilder:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_construct_what_validation_builds(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        for record in Workload(model_cls, seed=8).records(20):
+            constructed = trusted_builder(model_cls).build(record)
+            validated = model_cls.model_validate(record)
+            assert constructed == validated
+            assert constructed.model_fields_set == validated.model_fields_set
+
+    def test_should_construct_nested_models_and_defaults(self):
+        customer = trusted_builder(Customer).build({**RECORD, "tags": ["a"]})
+        assert customer == Customer.model_validate({**RECORD, "tags": ["a"]})
+        assert customer.address.zip_code == "00001"
+        assert trusted_builder(Customer).build({"customer_id": 2}).tags == []
+
+    def test_should_give_up_on_missing_required_fields(self):
+        assert trusted_builder(Customer).build({"address": None}) is None
+
+
+class TestSampledValidator:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_build_every_record_like_validation(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        records = list(Workload(model_cls, seed=8).records(200))
+        alerts: list[Alert] = []
+        sampler = _validator(model_cls, 10, alerts)
+        assert list(sampler.validate_many(records)) == [model_cls.model_validate(record) for record in records]
+        assert alerts == []
+        assert 0 < sampler.sampled < 60
+
+    def test_should_alert_and_sample_more_after_drift(self):
+        alerts: list[Alert] = []
+        sampler = _validator(Customer, 64, alerts)
+        sampler._countdown = 1
+        customer = sampler({**RECORD, "customerId": "7"})
+        assert customer.customer_id == 7
+        assert [(alert.index, alert.kind, alert.fields) for alert in alerts] == [(0, "mismatch", ("customer_id",))]
+        assert sampler.interval == 64 // BOOST
+        assert "constructs differently for ('customer_id',)" in str(alerts[0])
+
+    def test_should_drop_sampled_records_failing_validation(self):
+        alerts: list[Alert] = []
+        sampler = _validator(Customer, 1, alerts)
+        records = [RECORD, {**RECORD, "customerId": "x"}, RECORD]
+        assert len(list(sampler.validate_many(records))) == 2
+        assert [(alert.index, alert.kind) for alert in alerts] == [(1, "invalid")]
+        assert alerts[0].error.errors()[0]["loc"] == ("customerId",)
+
+    def test_should_validate_records_missing_required_fields(self):
+        alerts: list[Alert] = []
+        sampler = _validator(Customer, 1000, alerts)
+        assert sampler({"address": None}) is None
+        assert [alert.kind for alert in alerts] == ["invalid"]
+
+    def test_should_recover_the_interval_after_clean_samples(self):
+        alerts: list[Alert] = []
+        sampler = _validator(Customer, 64, alerts)
+        sampler._countdown = 1
+        sampler({**RECORD, "customerId": "7"})
+        assert sampler.interval == 8
+        records = [RECORD] * (RECOVERY * 8 * 6)
+        for record in records:
+            sampler(record)
+        assert sampler.interval > 8
+        assert len(alerts) == 1
+
+    def test_should_log_alerts_by_default(self, caplog: pytest.LogCaptureFixture):
+        sampler = SampledValidator(Customer, 1)
+        with caplog.at_level(logging.WARNING, logger="pydantic_notes.sampling"):
+            sampler({**RECORD, "customerId": "7"})
+        assert "Customer: sampled record 0 constructs differently" in caplog.text
+
+    def test_should_reject_invalid_rates(self):
+        with pytest.raises(ValueError, match="0"):
+            SampledValidator(Customer, 0)
@@ -0,0 +1,66 @@
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
+
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS, ModelWithAliasGeneratorAndAliasPriority1
+from pydantic_notes.schema import fields_validator
+
+
+class Nested(BaseModel):
+    value: int
+
+
+class ModelWithNestedAndValidator(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    nested: Nested = Field(alias="Nested")
+    others: list[Nested] = []
+    first_name: str = Field(alias="firstName")
+
+    @field_validator("first_name")
+    @classmethod
+    def capitalize(cls, value: str) -> str:
+        return value.capitalize()
+
+
+class ModelWithModelValidator(BaseModel):
+    first_name: str = Field(alias="firstName")
+
+    @model_validator(mode="before")
+    @classmethod
+    def passthrough(cls, data: dict) -> dict:
+        return data
+
+    @model_validator(mode="after")
+    def check(self) -> "ModelWithModelValidator":
+        return self
+
+
+class TestFieldsValidator:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_match_full_validation(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        expected = model_cls.model_validate(SAMPLE_PAYLOADS[model])
+        for name in model_cls.model_fields:
+            fields, _, _ = fields_validator(model_cls, frozenset((name,))).validate_python(SAMPLE_PAYLOADS[model])
+            assert fields == {name: getattr(expected, name)}
+
+    def test_should_raise_missing_by_alias(self):
+        validator = fields_validator(ModelWithAliasGeneratorAndAliasPriority1, frozenset(("first_name_va",)))
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate_json(b'{"f_name_va": "Mickey"}')
+        assert exc_info.value.errors(include_url=False) == [
+            {"type": "missing", "loc": ("FIRST_NAME_VA",), "msg": "Field required", "input": {"f_name_va": "Mickey"}}
+        ]
+
+    def test_should_keep_field_validators_and_definitions_and_ignore_other_fields(self):
+        validator = fields_validator(ModelWithNestedAndValidator, frozenset(("nested", "first_name")))
+        fields, _, _ = validator.validate_json(b'{"Nested": {"value": "1"}, "firstName": "mickey", "others": "oops"}')
+        assert fields == {"nested": Nested(value=1), "first_name": "Mickey"}
+
+    def test_should_cut_through_model_validators(self):
+        validator = fields_validator(ModelWithModelValidator, frozenset(("first_name",)))
+        fields, _, _ = validator.validate_python({"firstName": "Mickey"})
+        assert fields == {"first_name": "Mickey"}
+
+    def test_should_reject_unknown_fields(self):
+        with pytest.raises(KeyError):
+            fields_validator(ModelWithNestedAndValidator, frozenset(("last_name",)))
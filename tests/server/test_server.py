@@ -0,0 +1,164 @@
+import asyncio
+import json
+
+import pytest
+
+from pydantic_notes.models import ModelWithPlainAlias, ModelWithValidationAliasPath
+from pydantic_notes.server import (
+    STATUS_VALID,
+    FrameError,
+    FrameTooLargeError,
+    IngestServer,
+    LoadReport,
+    encode_frame,
+    read_frame,
+    run_load,
+)
+
+
+async def _read_frames(data: bytes, count: int) -> list[bytes | None]:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return [await read_frame(reader) for _ in range(count)]
+
+
+async def _ingest(model_cls, payloads: list[bytes], *, frames: int, **server_kwargs):
+    server = IngestServer(model_cls, **server_kwargs)
+    await server.start()
+    try:
+        report = await run_load(server.host, server.port, payloads, frames=frames, connections=2)
+    finally:
+        await server.close()
+    return server, report
+
+
+class TestFraming:
+    def test_should_read_back_encoded_frames(self):
+        data = encode_frame(b'{"firstName": "Mickey"}') + encode_frame(b"")
+        assert asyncio.run(_read_frames(data, 3)) == [b'{"firstName": "Mickey"}', b"", None]
+
+    @pytest.mark.parametrize("data", [b"\x00\x00", b"\x00\x00\x00\x05abc"])
+    def test_should_reject_truncated_frames(self, data: bytes):
+        with pytest.raises(FrameError):
+            asyncio.run(_read_frames(data, 1))
+
+    def test_should_reject_oversized_frames(self):
+        with pytest.raises(FrameTooLargeError):
+            asyncio.run(_read_frames(b"\xff\xff\xff\xff", 1))
+
+
+class TestIngestServer:
+    def test_should_validate_every_frame_by_alias(self):
+        payloads = [json.dumps({"firstName": "Mickey"}).encode(), json.dumps({"first_name": "Mickey"}).encode()]
+        server, report = asyncio.run(_ingest(ModelWithPlainAlias, payloads, frames=100))
+        assert (report.frames, report.valid, report.invalid) == (100, 50, 50)
+        assert (server.metrics.frames, server.metrics.valid, server.metrics.invalid) == (100, 50, 50)
+        assert server.metrics.payload_bytes == report.payload_bytes
+
+    def test_should_validate_alias_paths(self):
+        payloads = [b'{"names": ["Mickey", "Mouse"]}', b'{"names": ["Mickey"]}']
+        _, report = asyncio.run(_ingest(ModelWithValidationAliasPath, payloads, frames=10))
+        assert (report.valid, report.invalid) == (5, 5)
+
+    def test_should_apply_backpressure_with_bounded_queue(self, monkeypatch: pytest.MonkeyPatch):
+        async def ingest() -> tuple[IngestServer, LoadReport]:
+            server = IngestServer(ModelWithPlainAlias, max_pending=2)
+            release = asyncio.Event()
+            validate = server._validate
+
+            async def blocked(queue, writer) -> None:
+                await release.wait()
+                await validate(queue, writer)
+
+            monkeypatch.setattr(server, "_validate", blocked)
+            await server.start()
+            try:
+                load = asyncio.create_task(
+                    run_load(server.host, server.port, [b'{"firstName": "Mickey"}'], frames=500, connections=2)
+                )
+                async with asyncio.timeout(5):
+                    while not server.metrics.stalls:
+                        await asyncio.sleep(0.01)
+                release.set()
+                return server, await load
+            finally:
+                await server.close()
+
+        server, report = asyncio.run(ingest())
+        assert report.valid == 500
+        assert server.metrics.pending_high_water <= 2
+        assert server.metrics.stalls > 0
+
+    def test_should_stop_validating_on_write_errors(self):
+        class BrokenWriter:
+            writes = 0
+
+            def write(self, data: bytes) -> None:
+                self.writes += 1
+
+            async def drain(self) -> None:
+                raise ConnectionResetError
+
+        async def validate() -> tuple[int, int]:
+            server = IngestServer(ModelWithPlainAlias, flush_every=1)
+            queue: asyncio.Queue = asyncio.Queue()
+            for _ in range(3):
+                queue.put_nowait((b'{"firstName": "Mickey"}', 0.0))
+            queue.put_nowait(None)
+            writer = BrokenWriter()
+            await server._validate(queue, writer)  # type: ignore[arg-type]
+            return writer.writes, queue.qsize()
+
+        assert asyncio.run(validate()) == (1, 3)
+
+    def test_should_close_connections_once_validation_stops(self, monkeypatch: pytest.MonkeyPatch):
+        async def ingest() -> IngestServer:
+            server = IngestServer(ModelWithPlainAlias, max_pending=2)
+
+            async def gone(queue, writer) -> None:
+                # As after a write error: the receiver is left with a full queue.
+                while not queue.full():
+                    await asyncio.sleep(0.01)
+
+            monkeypatch.setattr(server, "_validate", gone)
+            await server.start()
+            try:
+                async with asyncio.timeout(5):
+                    with pytest.raises((asyncio.IncompleteReadError, ConnectionError)):
+                        await run_load(server.host, server.port, [b'{"firstName": "Mickey"}'], frames=500)
+            finally:
+                await server.close()
+            return server
+
+        assert asyncio.run(ingest()).metrics.stalls > 0
+
+    def test_should_stop_sending_once_the_server_hangs_up(self, monkeypatch: pytest.MonkeyPatch):
+        async def ingest() -> list[asyncio.Task]:
+            server = IngestServer(ModelWithPlainAlias)
+
+            async def hang_up(queue, writer) -> None:
+                # As a server shut down mid-load: a few frames are answered, then the connection is closed.
+                for _ in range(10):
+                    await queue.get()
+                    writer.write(STATUS_VALID)
+                await writer.drain()
+
+            monkeypatch.setattr(server, "_validate", hang_up)
+            await server.start()
+            try:
+                async with asyncio.timeout(5):
+                    with pytest.raises((asyncio.IncompleteReadError, ConnectionError)):
+                        await run_load(server.host, server.port, [b'{"firstName": "Mickey"}'], frames=500, window=4)
+            finally:
+                await server.close()
+            return [task for task in asyncio.all_tasks() if "_drive_connection" in task.get_coro().__qualname__]
+
+        assert asyncio.run(ingest()) == []
+
+    def test_should_expose_throughput_and_latency_counters(self):
+        server, _ = asyncio.run(_ingest(ModelWithPlainAlias, [b'{"firstName": "Mickey"}'], frames=20))
+        snapshot = server.metrics.snapshot()
+        assert snapshot["frames"] == 20
+        assert snapshot["frames_per_s"] > 0
+        assert 0 < snapshot["latency_p50_ms"] <= snapshot["latency_max_ms"]
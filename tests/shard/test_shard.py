@@ -0,0 +1,125 @@
+import io
+import json
+
+import pytest
+from pydantic import BaseModel, Field, computed_field, field_serializer
+
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.shard import (
+    MANIFEST,
+    ChecksumMismatchError,
+    RangeGapError,
+    export,
+    load_manifest,
+    merge,
+    row_serializer,
+)
+from pydantic_notes.workload import Workload
+
+
+class Shouting(BaseModel):
+    first_name: str = Field(alias="firstName")
+    last_name: str = Field(default="Mouse", alias="lastName")
+
+    @field_serializer("first_name")
+    def shout(self, value: str) -> str:
+        return value.upper()
+
+    @computed_field
+    @property
+    def full_name(self) -> str:
+        return f"{self.first_name} {self.last_name}"
+
+
+def _instances(model: str, count: int) -> list:
+    model_cls = ALIAS_MODELS[model]
+    return [model_cls.model_validate(record) for record in Workload(model_cls, seed=2).records(count)]
+
+
+def _sequential(instances: list, *, by_alias: bool = True) -> bytes:
+    return b"".join(instance.model_dump_json(by_alias=by_alias).encode() + b"\n" for instance in instances)
+
+
+def _merged(out_dir) -> bytes:
+    fp = io.BytesIO()
+    merge(out_dir, fp)
+    return fp.getvalue()
+
+
+class TestExport:
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_merge_into_sequential_output(self, model: str, tmp_path):
+        instances = _instances(model, 25)
+        export(ALIAS_MODELS[model], instances, tmp_path, shard_size=10, workers=0)
+        assert _merged(tmp_path) == _sequential(instances)
+
+    @pytest.mark.parametrize("by_alias", [True, False])
+    def test_should_serialize_in_worker_processes(self, by_alias: bool, tmp_path):
+        instances = _instances("alias_generator_and_priority_1", 95)
+        manifest = export(
+            ALIAS_MODELS["alias_generator_and_priority_1"],
+            instances,
+            tmp_path,
+            shard_size=10,
+            workers=2,
+            by_alias=by_alias,
+        )
+        assert manifest.records == 95
+        assert _merged(tmp_path) == _sequential(instances, by_alias=by_alias)
+
+    def test_should_accept_raw_validated_rows(self, tmp_path):
+        instances = _instances("validation_alias_path", 30)
+        export(ALIAS_MODELS["validation_alias_path"], (dict(i.__dict__) for i in instances), tmp_path, shard_size=7)
+        assert _merged(tmp_path) == _sequential(instances)
+
+    def test_should_validate_rows_keyed_by_alias(self, tmp_path):
+        model_cls = ALIAS_MODELS["plain_alias"]
+        export(model_cls, [{"firstName": "Mickey"}, {"first_name": "Minnie"}], tmp_path, workers=0)
+        assert _merged(tmp_path) == _sequential([model_cls(firstName="Mickey"), model_cls(firstName="Minnie")])
+
+    def test_should_rebuild_rows_for_models_needing_instances(self, tmp_path):
+        assert row_serializer(Shouting) is None
+        instances = [Shouting(firstName="Mickey"), Shouting(firstName="Minnie", lastName="M")]
+        rows = [dict(instances[0].__dict__), {"first_name": "Minnie", "last_name": "M"}, {"first_name": "Mickey"}]
+        export(Shouting, rows, tmp_path, workers=0)
+        assert _merged(tmp_path) == _sequential([*instances, instances[0]])
+
+    def test_should_write_manifest_of_ranges_and_checksums(self, tmp_path):
+        manifest = export(
+            ALIAS_MODELS["plain_alias"], _instances("plain_alias", 25), tmp_path, shard_size=10, workers=0
+        )
+        assert load_manifest(tmp_path) == manifest
+        assert manifest.model == "pydantic_notes.models.ModelWithPlainAlias"
+        assert [(shard.file, shard.start, shard.stop) for shard in manifest.shards] == [
+            ("shard-00000.ndjson", 0, 10),
+            ("shard-00001.ndjson", 10, 20),
+            ("shard-00002.ndjson", 20, 25),
+        ]
+        for shard in manifest.shards:
+            lines = (tmp_path / shard.file).read_bytes()
+            assert len(lines) == shard.size
+            assert lines.count(b"\n") == shard.records
+
+    def test_should_export_empty_streams(self, tmp_path):
+        manifest = export(ALIAS_MODELS["plain_alias"], [], tmp_path, workers=0)
+        assert manifest.records == 0
+        assert manifest.shards == []
+        assert _merged(tmp_path) == b""
+
+
+class TestMerge:
+    def test_should_detect_corrupted_shards(self, tmp_path):
+        export(ALIAS_MODELS["plain_alias"], _instances("plain_alias", 20), tmp_path, shard_size=10, workers=0)
+        shard = tmp_path / "shard-00001.ndjson"
+        shard.write_bytes(shard.read_bytes().replace(b"firstName", b"firstname", 1))
+        with pytest.raises(ChecksumMismatchError, match="shard-00001"):
+            _merged(tmp_path)
+        merge(tmp_path, io.BytesIO(), verify=False)
+
+    def test_should_detect_missing_ranges(self, tmp_path):
+        export(ALIAS_MODELS["plain_alias"], _instances("plain_alias", 30), tmp_path, shard_size=10, workers=0)
+        manifest = json.loads((tmp_path / MANIFEST).read_text())
+        del manifest["shards"][1]
+        (tmp_path / MANIFEST).write_text(json.dumps(manifest))
+        with pytest.raises(RangeGapError, match="expected 10"):
+            _merged(tmp_path)
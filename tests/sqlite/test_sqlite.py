@@ -0,0 +1,209 @@
+import json
+import sqlite3
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import AliasChoices, AliasPath, BaseModel, Field, ValidationError
+
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+from pydantic_notes.sqlite import (
+    BULK_PRAGMAS,
+    PRAGMAS,
+    MissingColumnsError,
+    SQLiteSink,
+    SQLiteSource,
+    UnsupportedPragmaError,
+    column_fields,
+    columns,
+    load,
+    quote,
+    read,
+    table_schema,
+)
+from pydantic_notes.workload import Workload
+
+
+class Address(BaseModel):
+    city: str
+    zip_code: str | None = None
+
+
+class Order(BaseModel):
+    order_id: int = Field(alias="orderId")
+    placed_at: datetime
+    total: float
+    paid: bool = False
+    note: str | None = None
+    items: list[str] = []
+    address: Address | None = None
+
+
+ORDER = Order(
+    orderId=1,
+    placed_at=datetime(2024, 1, 1, tzinfo=UTC),
+    total=9.5,
+    paid=True,
+    items=["a", "b"],
+    address=Address(city="Toontown"),
+)
+
+
+class Customer(BaseModel):
+    customer_id: int = Field(validation_alias=AliasChoices("id", "customerId"))
+    city: str | None = Field(default=None, validation_alias=AliasPath("address", "city"))
+    vip: bool = False
+
+
+class RecordingCursor:
+    def __init__(self, cursor: sqlite3.Cursor):
+        self.cursor = cursor
+        self.description = cursor.description
+        self.fetched: list[int] = []
+
+    def fetchmany(self, size: int) -> list:
+        rows = self.cursor.fetchmany(size)
+        self.fetched.append(len(rows))
+        return rows
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    yield connection
+    connection.close()
+
+
+class TestTableSchema:
+    def test_should_type_columns_by_field_kind(self):
+        assert table_schema(Order) == (
+            'CREATE TABLE "Order" ("order_id" INTEGER NOT NULL, "placed_at" TEXT NOT NULL, "total" REAL NOT NULL, '
+            '"paid" INTEGER NOT NULL, "note" TEXT, "items" TEXT NOT NULL, "address" TEXT)'
+        )
+
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_name_columns_by_serialization_key(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        by_alias = model_cls.model_validate(SAMPLE_PAYLOADS[model]).model_dump(by_alias=True)
+        assert [column.name for column in columns(model_cls, by_alias=True)] == list(by_alias)
+        assert [column.name for column in columns(model_cls)] == list(model_cls.model_fields)
+
+    def test_should_quote_table_names(self):
+        assert table_schema(Address, 'my "table"', if_not_exists=True).startswith(
+            'CREATE TABLE IF NOT EXISTS "my ""table""" ('
+        )
+
+
+class TestSQLiteSink:
+    def test_should_write_field_values_and_json_columns(self, connection: sqlite3.Connection):
+        assert load(connection, Order, [ORDER, ORDER.model_copy(update={"items": [], "address": None})]) == 2
+        rows = connection.execute('SELECT * FROM "Order"').fetchall()
+        assert rows[0][:5] == (1, '"2024-01-01T00:00:00Z"', 9.5, 1, None)
+        assert json.loads(rows[0][5]) == ["a", "b"]
+        assert json.loads(rows[0][6]) == {"city": "Toontown", "zip_code": None}
+        assert rows[1][5:] == ("[]", None)
+
+    def test_should_write_raw_rows(self, connection: sqlite3.Connection):
+        sink = SQLiteSink(connection, Address, "addresses")
+        sink.write([{"city": "A", "zip_code": "1"}, {"city": "B"}, ("C", "3")])
+        assert connection.execute("SELECT * FROM addresses").fetchall() == [("A", "1"), ("B", None), ("C", "3")]
+
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_load_every_alias_model_by_alias(self, connection: sqlite3.Connection, model: str):
+        model_cls = ALIAS_MODELS[model]
+        instances = [model_cls.model_validate(record) for record in Workload(model_cls, seed=3).records(50)]
+        sink = SQLiteSink(connection, model_cls, by_alias=True, batch_size=7, pragmas=BULK_PRAGMAS)
+        assert sink.write(instances) == 50
+        cursor = connection.execute(f"SELECT * FROM {quote(model_cls.__name__)}")  # noqa: S608
+        keys = [description[0] for description in cursor.description]
+        assert [dict(zip(keys, row, strict=True)) for row in cursor] == [
+            instance.model_dump(by_alias=True) for instance in instances
+        ]
+
+    def test_should_commit_every_batch(self, connection: sqlite3.Connection):
+        sink = SQLiteSink(connection, Address, batch_size=2)
+        records = [Address(city="A"), Address(city="B"), {"zip_code": "1"}]
+        with pytest.raises(sqlite3.IntegrityError):
+            sink.write(records)
+        assert connection.execute('SELECT count(*) FROM "Address"').fetchone() == (2,)
+
+    def test_should_set_pragmas(self, connection: sqlite3.Connection):
+        SQLiteSink(connection, Address, pragmas={"cache_size": -1234})
+        assert connection.execute("PRAGMA cache_size").fetchone() == (-1234,)
+        SQLiteSink(connection, Address, pragmas={"foreign_keys": "ON", "busy_timeout": 50})
+        assert connection.execute("PRAGMA foreign_keys").fetchone() == (1,)
+        assert BULK_PRAGMAS.keys() <= PRAGMAS
+
+    @pytest.mark.parametrize(
+        "pragmas",
+        [
+            {"cache_size = 0; DROP TABLE x; PRAGMA cache_size": 0},
+            {"user_version": 1},
+            {"journal_mode": "MEMORY; DROP TABLE x"},
+            {"cache_size": 1.5},
+            {"journal_mode": "'OFF'"},
+        ],
+    )
+    def test_should_reject_unsupported_pragmas(self, connection: sqlite3.Connection, pragmas: dict):
+        with pytest.raises(UnsupportedPragmaError):
+            SQLiteSink(connection, Address, pragmas={"cache_size": -1234, **pragmas})
+        assert connection.execute("PRAGMA cache_size").fetchone() != (-1234,)
+
+    def test_should_reject_invalid_batch_sizes(self, connection: sqlite3.Connection):
+        with pytest.raises(ValueError, match="0"):
+            SQLiteSink(connection, Address, batch_size=0)
+
+
+class TestSQLiteSource:
+    @pytest.mark.parametrize("by_alias", [False, True])
+    @pytest.mark.parametrize("validate", [True, False])
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_read_back_what_the_sink_wrote(
+        self,
+        connection: sqlite3.Connection,
+        model: str,
+        validate: bool,
+        by_alias: bool,
+    ):
+        model_cls = ALIAS_MODELS[model]
+        instances = [model_cls.model_validate(record) for record in Workload(model_cls, seed=4).records(30)]
+        load(connection, model_cls, instances, by_alias=by_alias)
+        assert list(read(connection, model_cls, validate=validate, batch_size=7)) == instances
+
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_should_restore_bool_and_json_columns(self, connection: sqlite3.Connection, validate: bool):
+        orders = [ORDER, ORDER.model_copy(update={"items": [], "address": None, "paid": False})]
+        load(connection, Order, orders)
+        restored = list(read(connection, Order, validate=validate))
+        assert restored == orders
+        assert restored[0].paid is True
+        assert restored[0].address == Address(city="Toontown")
+
+    def test_should_map_columns_by_accepted_input_keys(self):
+        names = ["customerId", "vip", "note", "id", "customer_id"]
+        assert column_fields(Customer, names) == ["customer_id", "vip", None, None, None]
+
+    def test_should_place_values_at_alias_paths(self, connection: sqlite3.Connection):
+        rows = connection.execute("SELECT 1 AS id, 'Toontown' AS city, 1 AS vip UNION ALL SELECT 2, NULL, 0")
+        customers = list(SQLiteSource(rows, Customer))
+        assert customers == [Customer(id=1, address={"city": "Toontown"}, vip=True), Customer(id=2, vip=False)]
+
+    def test_should_construct_defaults_for_missing_columns(self, connection: sqlite3.Connection):
+        rows = connection.execute("SELECT 3 AS customerId")
+        (customer,) = SQLiteSource(rows, Customer, validate=False)
+        assert (customer.customer_id, customer.city, customer.vip) == (3, None, False)
+        assert customer.model_fields_set == {"customer_id"}
+
+    def test_should_reject_missing_required_columns_when_trusted(self, connection: sqlite3.Connection):
+        with pytest.raises(MissingColumnsError, match=r"\['customer_id'\]"):
+            SQLiteSource(connection.execute("SELECT 1 AS vip"), Customer, validate=False)
+        with pytest.raises(ValidationError):
+            list(SQLiteSource(connection.execute("SELECT 1 AS vip"), Customer))
+
+    def test_should_fetch_lazily_in_batches(self, connection: sqlite3.Connection):
+        load(connection, Address, [Address(city=str(i)) for i in range(10)])
+        cursor = RecordingCursor(connection.execute('SELECT * FROM "Address"'))
+        models = iter(SQLiteSource(cursor, Address, batch_size=4))  # type: ignore[arg-type]
+        assert next(models).city == "0"
+        assert cursor.fetched == [4]
+        assert [model.city for model in models] == [str(i) for i in range(1, 10)]
+        assert cursor.fetched == [4, 4, 2, 0]
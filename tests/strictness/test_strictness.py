@@ -0,0 +1,129 @@
+import json
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+from pydantic.alias_generators import to_camel
+
+from pydantic_notes.models import ALIAS_MODELS, SAMPLE_PAYLOADS
+from pydantic_notes.strictness import (
+    CoercionProfiler,
+    StrictModeUnsupportedError,
+    profile_coercion,
+    strict_variant,
+)
+from pydantic_notes.workload import Workload
+
+
+class Event(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    event_id: int
+    occurred_at: datetime
+    ratio: float = 0.0
+    name: str = Field(alias="N")
+
+    @field_validator("name")
+    @classmethod
+    def strip(cls, value: str) -> str:
+        return value.strip()
+
+
+class Tagged(BaseModel):
+    name: str
+    tags: list[str]
+    counts: list[int] | None = None
+
+
+CANONICAL = {"eventId": 1, "occurredAt": datetime(2024, 1, 1, tzinfo=UTC), "ratio": 0.5, "N": " a "}
+PAYLOADS = [
+    CANONICAL,
+    {**CANONICAL, "eventId": "2"},
+    json.dumps({**CANONICAL, "occurredAt": "2024-01-01T00:00:00Z"}),
+    json.dumps({**CANONICAL, "occurredAt": "2024-01-01T00:00:00Z", "ratio": "0.5"}),
+    {"eventId": "not a number"},
+]
+
+
+class TestCoercionProfiler:
+    def test_should_count_coerced_fields(self):
+        report = profile_coercion(Event, PAYLOADS)
+        assert (report.samples, report.invalid) == (5, 1)
+        assert report.coerced == {"event_id": 1, "occurred_at": 0, "ratio": 1, "name": 0}
+        assert report.strict_fields == {"occurred_at", "name"}
+
+    def test_should_profile_incrementally(self):
+        profiler = CoercionProfiler(Event)
+        profiler.observe(PAYLOADS[0])
+        assert profiler.report().strict_fields == set(Event.model_fields)
+        profiler.observe_many(PAYLOADS[1:])
+        assert profiler.report() == profile_coercion(Event, PAYLOADS)
+
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_find_canonical_alias_model_payloads_strict(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        report = profile_coercion(model_cls, Workload(model_cls, seed=7).records(20))
+        assert report.strict_fields == set(model_cls.model_fields)
+
+    def test_should_report(self):
+        report = profile_coercion(Event, PAYLOADS)
+        assert report.to_dict() == {
+            "model": f"{__name__}.Event",
+            "samples": 5,
+            "invalid": 1,
+            "coerced": {"event_id": 1, "occurred_at": 0, "ratio": 1, "name": 0},
+            "strict_fields": ["name", "occurred_at"],
+            "unsupported": [],
+        }
+        assert str(report).splitlines() == [
+            "Event: 5 samples, 1 invalid",
+            "  event_id     lax     1 coerced (25.0%)",
+            "  occurred_at  strict  0 coerced (0.0%)",
+            "  ratio        lax     1 coerced (25.0%)",
+            "  name         strict  0 coerced (0.0%)",
+        ]
+
+    def test_should_leave_fields_without_strict_mode_lax(self):
+        report = profile_coercion(Tagged, [{"name": "a", "tags": ["x"], "counts": ("1",)}])
+        assert report.unsupported == {"tags"}
+        assert report.strict_fields == {"name"}
+        assert str(report).splitlines()[2:] == [
+            "  tags    lax     no per-field strict mode",
+            "  counts  lax     1 coerced (100.0%)",
+        ]
+        assert report.strict_model().model_validate({"name": "a", "tags": ("x",), "counts": ["2"]}).counts == [2]
+
+
+class TestStrictVariant:
+    def test_should_validate_strict_fields_strictly(self):
+        strict_cls = profile_coercion(Event, PAYLOADS).strict_model()
+        assert issubclass(strict_cls, Event)
+        assert strict_cls.model_validate({**CANONICAL, "eventId": "2", "ratio": "1"}).name == "a"
+        with pytest.raises(ValidationError) as exc_info:
+            strict_cls.model_validate({**CANONICAL, "N": 1})
+        assert exc_info.value.errors()[0]["loc"] == ("N",)
+        assert strict_cls.model_validate_json(PAYLOADS[2]).occurred_at == datetime(2024, 1, 1, tzinfo=UTC)
+
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_keep_alias_config(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        strict_cls = strict_variant(model_cls, frozenset(model_cls.model_fields))
+        for name, field in model_cls.model_fields.items():
+            strict = strict_cls.model_fields[name]
+            assert (strict.alias, strict.validation_alias, strict.serialization_alias) == (
+                field.alias,
+                field.validation_alias,
+                field.serialization_alias,
+            )
+        instance = strict_cls.model_validate(SAMPLE_PAYLOADS[model])
+        expected = model_cls.model_validate(SAMPLE_PAYLOADS[model])
+        assert instance.model_dump(by_alias=True) == expected.model_dump(by_alias=True)
+        assert strict_cls.model_config == model_cls.model_config
+
+    def test_should_reject_fields_without_strict_mode(self):
+        with pytest.raises(StrictModeUnsupportedError, match="tags"):
+            strict_variant(Tagged, frozenset({"name", "tags"}))
+
+    def test_should_reject_unknown_fields(self):
+        with pytest.raises(KeyError, match="nope"):
+            strict_variant(Event, frozenset({"nope"}))
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+from collections import Counter
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_notes.models import ALIAS_MODELS
+from pydantic_notes.workload import Workload, write
+
+
+def _is_valid(model_cls, record: dict) -> bool:
+    try:
+        model_cls.model_validate(record)
+    except ValidationError:
+        return False
+    return True
+
+
+class TestWorkload:
+    def test_should_be_deterministic_for_a_seed(self):
+        model_cls = ALIAS_MODELS["validation_alias_choices"]
+        first = list(Workload(model_cls, seed=7, invalid_ratio=0.2).records(50))
+        second = list(Workload(model_cls, seed=7, invalid_ratio=0.2).records(50))
+        other = list(Workload(model_cls, seed=8, invalid_ratio=0.2).records(50))
+        assert first == second
+        assert first != other
+
+    @pytest.mark.parametrize("model", sorted(ALIAS_MODELS))
+    def test_should_label_records_the_way_pydantic_validates_them(self, model: str):
+        model_cls = ALIAS_MODELS[model]
+        for record, valid in Workload(model_cls, seed=1, invalid_ratio=0.3).labelled(200):
+            assert _is_valid(model_cls, record) is valid
+
+    def test_should_use_every_alias_choice(self):
+        records = Workload(ALIAS_MODELS["validation_alias_choices"]).records(300)
+        assert Counter(key for record in records for key in record).keys() == {
+            "firstName",
+            "givenName",
+            "preferredName",
+        }
+
+    def test_should_use_field_names_under_populate_by_name(self):
+        records = Workload(ALIAS_MODELS["plain_alias_and_pop_by_name_config"]).records(100)
+        assert Counter(key for record in records for key in record).keys() == {"firstName", "first_name"}
+
+    def test_should_nest_alias_paths(self):
+        [record] = Workload(ALIAS_MODELS["validation_alias_path"]).records(1)
+        assert list(record) == ["names"]
+        assert len(record["names"]) == 2
+
+    @pytest.mark.parametrize("invalid_ratio", [0.0, 0.25, 1.0])
+    def test_should_honour_invalid_ratio(self, invalid_ratio: float):
+        labels = [
+            valid for _, valid in Workload(ALIAS_MODELS["plain_alias"], invalid_ratio=invalid_ratio).labelled(2000)
+        ]
+        assert labels.count(False) / len(labels) == pytest.approx(invalid_ratio, abs=0.05)
+
+    def test_should_stream_endlessly(self):
+        records = Workload(ALIAS_MODELS["plain_alias"]).records()
+        assert len([next(records) for _ in range(10_000)]) == 10_000
+
+
+class TestWrite:
+    def test_should_write_ndjson(self):
+        fp = io.StringIO()
+        assert write(Workload(ALIAS_MODELS["validation_alias_path"]), fp, fmt="ndjson", count=5) == 5
+        expected = list(Workload(ALIAS_MODELS["validation_alias_path"]).records(5))
+        assert [json.loads(line) for line in fp.getvalue().splitlines()] == expected
+
+    @pytest.mark.parametrize("count", [0, 3])
+    def test_should_write_json_array(self, count: int):
+        fp = io.StringIO()
+        write(Workload(ALIAS_MODELS["plain_alias"]), fp, fmt="json", count=count)
+        assert json.loads(fp.getvalue()) == list(Workload(ALIAS_MODELS["plain_alias"]).records(count))
+
+    def test_should_write_csv_with_every_possible_key(self):
+        workload = Workload(ALIAS_MODELS["validation_alias_path"], invalid_ratio=0.5)
+        fp = io.StringIO()
+        write(workload, fp, fmt="csv", count=20)
+        rows = list(csv.DictReader(io.StringIO(fp.getvalue())))
+        assert len(rows) == 20
+        assert list(rows[0]) == workload.keys
+        assert all(json.loads(row["names"]) for row in rows if row["names"])